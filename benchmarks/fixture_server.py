@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Fixture Server
+Serves the HTML fixtures in benchmarks/fixtures/ from a local HTTP server,
+with artificial latency and optionally late-rendered values fetched from
+stand-ins of the sites' JSON APIs
+"""
+
+import hashlib
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+FIXTURE_DIR = Path(__file__).resolve().parent / "fixtures"
+
+# Value each fixture holds, as the scraper should return it
+EXPECTED_VALUES = {
+    "redfin": "$412,300",
+    "zillow": "$398,700",
+    "realtor": "$405,000",
+    "bitnodes": "24,293",
+    "coindance": "17,842",
+    "etherscan": "8,123",
+}
+
+# Sources rendered client side on the real sites; their value is only added
+# by JavaScript after the render delay. The others are server rendered.
+LATE_RENDERED = ("redfin", "zillow", "realtor")
+
+
+def _amount(source):
+    return int(EXPECTED_VALUES[source].lstrip("$").replace(",", ""))
+
+
+# Stand-ins for the sites' JSON APIs, at the paths and in the shapes the
+# scrapers expect. Late-rendered pages fetch their value from these before
+# rendering it (response captures); Bitnodes is queried directly by its
+# "api" backend.
+API_ROUTES = {
+    "/graphql/": ("zillow", lambda: json.dumps(
+        {"data": {"property": {"zpid": 1, "zestimate": _amount("zillow")}}})),
+    "/stingray/api/home/details/avm": ("redfin", lambda: "{}&&" + json.dumps(
+        {"resultCode": 0, "payload": {"predictedValue": _amount("redfin")}})),
+    "/api/v1/hulk": ("realtor", lambda: json.dumps(
+        {"data": {"home": {"estimates": {"current_values": [{"estimate": _amount("realtor")}]}}}})),
+    "/api/v1/snapshots/": ("bitnodes", lambda: json.dumps(
+        {"count": 1, "results": [{"timestamp": 1700000000, "total_nodes": _amount("bitnodes"),
+                                  "latest_height": 820000}]})),
+}
+API_PATHS = {source: path for path, (source, _) in API_ROUTES.items()}
+
+VALUE_REGION = re.compile(r"<!--VALUE-->(.*?)<!--/VALUE-->", re.S)
+
+LATE_RENDER_SCRIPT = """<span id="bench-slot"></span>
+<script>
+var api = %s;
+(api ? fetch(api).then(function (r) { return r.text(); }) : Promise.resolve()).then(function () {
+    setTimeout(function () {
+        document.getElementById("bench-slot").outerHTML = %s;
+    }, %d);
+});
+</script>"""
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """Serves /<source> from the fixture directory, and the API_ROUTES"""
+
+    # Keep connections alive between requests, as the real sites do. Headers
+    # and body are written separately, so Nagle's algorithm would hold the
+    # body back for a delayed ACK on a reused connection.
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    # Set by FixtureServer before the server starts
+    latency = 0.0
+    render_delay = 0
+    late_rendered = LATE_RENDERED
+
+    def do_GET(self):
+        route = self.path.split("?", 1)[0]
+        if route in API_ROUTES:
+            time.sleep(self.latency)
+            self._send(API_ROUTES[route][1](), "application/json")
+            return
+
+        source = route.strip("/")
+        path = FIXTURE_DIR / f"{source}.html"
+        if not source.isidentifier() or not path.exists():
+            self.send_error(404)
+            return
+
+        time.sleep(self.latency)
+        html = path.read_text()
+        if source in self.late_rendered:
+            html = VALUE_REGION.sub(
+                lambda m: LATE_RENDER_SCRIPT % (json.dumps(API_PATHS.get(source)), json.dumps(m.group(1)),
+                                                self.render_delay), html
+            )
+        else:
+            html = VALUE_REGION.sub(r"\1", html)
+        self._send(html, "text/html")
+
+    def _send(self, text, content_type):
+        body = text.encode("utf-8")
+        # Fixtures only change between server starts, so a content hash is a valid ETag
+        etag = '"%s"' % hashlib.sha1(body).hexdigest()[:16]
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FixtureServer:
+    """
+    Local stand-in for the six scraped sites.
+
+    Usable as a context manager; the server runs on a free port in a
+    background thread until stop() is called.
+    """
+
+    def __init__(self, latency_ms=0, render_delay_ms=0, late_rendered=LATE_RENDERED):
+        """
+        Initialize the FixtureServer.
+
+        Args:
+            latency_ms (float): Delay before every response, in ms.
+            render_delay_ms (int): How long after load the late-rendered values appear, in ms.
+            late_rendered (tuple): Sources whose value is added by JavaScript.
+        """
+        handler = type("ConfiguredFixtureHandler", (FixtureHandler,), {
+            "latency": latency_ms / 1000,
+            "render_delay": int(render_delay_ms),
+            "late_rendered": tuple(late_rendered),
+        })
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self._thread = None
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self._server.server_address[1]}/"
+
+    def url_for(self, source):
+        """Return the URL serving a source's fixture"""
+        return f"{self.base_url}{source}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
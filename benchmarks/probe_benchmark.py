@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Probe Benchmark
+Measures how much time the cached environment probe saves per create_driver call.
+
+Usage:
+    python -m benchmarks.probe_benchmark [--iterations N] [--create-driver]
+"""
+
+import argparse
+import statistics
+import time
+
+from util.chrome_driver_manager import ChromeDriverManager
+
+
+def time_calls(fn, iterations):
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def report(label, samples):
+    print(f"{label:<34} median {statistics.median(samples):9.2f} ms   "
+          f"min {min(samples):9.2f} ms   max {max(samples):9.2f} ms")
+
+
+def cold_probe():
+    ChromeDriverManager._probe = None
+    ChromeDriverManager.probe_environment(use_cache=False)
+
+
+def disk_cached_probe():
+    # A new process: nothing in memory, cache file on disk
+    ChromeDriverManager._probe = None
+    ChromeDriverManager.probe_environment()
+
+
+def create_and_quit():
+    ChromeDriverManager.quit_driver(ChromeDriverManager.create_driver())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ChromeDriverManager environment probing")
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--create-driver", action="store_true",
+                        help="Also time full create_driver() + quit with a cold and a warm probe cache")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Environment probe benchmark")
+    print("=" * 60)
+
+    cold = time_calls(cold_probe, args.iterations)
+    disk = time_calls(disk_cached_probe, args.iterations)
+    memory = time_calls(ChromeDriverManager.probe_environment, args.iterations)
+
+    report("Uncached probe", cold)
+    report("Cached probe (from disk)", disk)
+    report("Cached probe (in memory)", memory)
+    print(f"\nSaved per create_driver in a new process: {statistics.median(cold) - statistics.median(disk):.2f} ms")
+    print(f"Saved per recreate within a run:          {statistics.median(cold) - statistics.median(memory):.2f} ms")
+
+    if args.create_driver:
+        def create_cold():
+            ChromeDriverManager._probe = None
+            ChromeDriverManager.PROBE_CACHE.unlink(missing_ok=True)
+            create_and_quit()
+
+        print()
+        report("create_driver, cold cache", time_calls(create_cold, args.iterations))
+        report("create_driver, warm cache", time_calls(create_and_quit, args.iterations))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Benchmark Suite
+Runs every scraper and the full run_scrapers pipeline against local fixtures
+of the six sources and records where the time goes.
+
+Measured per source: navigation (driver.get), wait (until a strategy
+matches), extraction (one evaluation of the strategies), the complete
+scraper function, the browserless static path where one is declared, the
+JSON API backend where one exists, and the time until a declared JSON
+response capture yields the value (--intercept).
+Driver startup and the end-to-end run_scrapers.main pipeline are measured
+once per iteration. Medians are written to JSON and can be checked against
+absolute thresholds and against an earlier result file.
+
+Usage:
+    python -m benchmarks.suite [--iterations N] [--latency MS] [--render-delay MS]
+                               [--output FILE] [--thresholds FILE]
+                               [--baseline FILE] [--max-regression 0.25]
+                               [--static-only]
+"""
+
+import argparse
+import contextlib
+import fnmatch
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from benchmarks.fixture_server import EXPECTED_VALUES, FixtureServer
+from scrapers.registry import BUILTIN_SCRAPERS
+from util.http_cache import HttpCache
+from util.static_fetcher import StaticFetcher
+
+DEFAULT_THRESHOLDS = Path(__file__).resolve().parent / "thresholds.json"
+
+# Differences below this many ms never count as a regression (timer noise)
+REGRESSION_SLACK_MS = 5.0
+
+
+def timed(fn, *args, **kwargs):
+    """Call fn and return (result, elapsed ms)"""
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, (time.perf_counter() - start) * 1000
+
+
+@contextlib.contextmanager
+def quiet():
+    """Hide the scrapers' progress output while they are being timed"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+class Recorder:
+    """Collects samples per metric and value mismatches"""
+
+    def __init__(self):
+        self.samples = {}
+        self.errors = []
+
+    def add(self, metric, ms):
+        self.samples.setdefault(metric, []).append(ms)
+
+    def check(self, source, what, value, expected=None):
+        expected = expected or EXPECTED_VALUES[source]
+        if value != expected:
+            self.errors.append(f"{source} {what}: expected {expected!r}, got {value!r}")
+
+    def medians(self):
+        return {metric: round(statistics.median(values), 2) for metric, values in sorted(self.samples.items())}
+
+
+def bench_static(server, specs, recorder):
+    for spec in specs:
+        page = spec.page_spec()
+        if not page.has_static_path:
+            continue
+        with quiet():
+            value, ms = timed(StaticFetcher.scrape, server.url_for(spec.key),
+                              xpath=page.static_xpath, pattern=page.static_pattern)
+        recorder.add(f"{spec.key}.static_ms", ms)
+        recorder.check(spec.key, "static path", value)
+
+
+def bench_api(server, specs, recorder):
+    for spec in specs:
+        if "api" not in spec.backends:
+            continue
+        with quiet():
+            value, ms = timed(spec.with_backend("api").load(), server.url_for(spec.key))
+        recorder.add(f"{spec.key}.api_ms", ms)
+        recorder.check(spec.key, "api backend", value)
+
+
+def bench_browser(server, specs, recorder):
+    # Imported here so --static-only runs don't need a working Chrome setup
+    from util.chrome_driver_manager import ChromeDriverManager
+    from util.extractor import Extractor
+
+    with quiet():
+        driver, ms = timed(ChromeDriverManager.create_driver)
+    recorder.add("driver_startup_ms", ms)
+
+    try:
+        for spec in specs:
+            page = spec.page_spec()
+            url = server.url_for(spec.key)
+
+            _, ms = timed(driver.get, url)
+            recorder.add(f"{spec.key}.navigation_ms", ms)
+            try:
+                (value, _), ms = timed(Extractor.wait_for, driver, page.strategies, page.timeout)
+            except Exception as e:
+                recorder.errors.append(f"{spec.key} wait: {str(e)}")
+                continue
+            recorder.add(f"{spec.key}.wait_ms", ms)
+            (value, _), ms = timed(Extractor.extract, driver, page.strategies)
+            recorder.add(f"{spec.key}.extract_ms", ms)
+            recorder.check(spec.key, "browser extraction", value)
+
+            # The scraper function as the orchestrator calls it (static path first, if any)
+            with quiet():
+                value, ms = timed(spec.load(), url, driver)
+            recorder.add(f"{spec.key}.scrape_ms", ms)
+            recorder.check(spec.key, "scraper", value)
+    finally:
+        with quiet():
+            ChromeDriverManager.quit_driver(driver)
+
+
+def bench_capture(server, specs, recorder):
+    """Time reading values from the fixtures' API responses, as run_scrapers --intercept does"""
+    from util.chrome_driver_manager import ChromeDriverManager
+    from util.extractor import Extractor, ResponseCapture
+
+    specs = [spec for spec in specs if spec.page_spec().responses]
+    if not specs:
+        return
+    saved = ChromeDriverManager.capture_responses, ChromeDriverManager.page_load_strategy
+    ChromeDriverManager.capture_responses = True
+    ChromeDriverManager.page_load_strategy = "none"
+    try:
+        with quiet():
+            driver = ChromeDriverManager.create_driver()
+        try:
+            for spec in specs:
+                page = spec.page_spec()
+                ChromeDriverManager.cdp(driver, "Network.enable")
+                ChromeDriverManager.drain_network_log(driver)
+                start = time.perf_counter()
+                driver.get(server.url_for(spec.key))
+                try:
+                    value, found_by = Extractor.capture(driver, page.responses, page.strategies, page.timeout)
+                except Exception as e:
+                    recorder.errors.append(f"{spec.key} capture: {str(e)}")
+                    continue
+                recorder.add(f"{spec.key}.capture_ms", (time.perf_counter() - start) * 1000)
+                ChromeDriverManager.cdp(driver, "Page.stopLoading")
+                recorder.check(spec.key, "response capture", value)
+                if not isinstance(found_by, ResponseCapture):
+                    recorder.errors.append(f"{spec.key} capture: fell back to the DOM ({found_by.name})")
+        finally:
+            with quiet():
+                ChromeDriverManager.quit_driver(driver)
+    finally:
+        ChromeDriverManager.capture_responses, ChromeDriverManager.page_load_strategy = saved
+
+
+def bench_pipeline(server, specs, recorder, workers):
+    """Time run_scrapers.main end to end in a scratch directory"""
+    import run_scrapers
+
+    enabled = {spec.key for spec in specs}
+    links = {
+        spec.key: {"link": server.url_for(spec.key), "enabled": spec.key in enabled}
+        for spec in BUILTIN_SCRAPERS
+    }
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="scraper_bench_") as scratch:
+        Path(scratch, "links.json").write_text(json.dumps(links))
+        os.chdir(scratch)
+        try:
+            with quiet():
+                start = time.perf_counter()
+                try:
+                    run_scrapers.main(["--force", "all", "--retries", "0", "--workers", str(workers)])
+                    code = 0
+                except SystemExit as e:
+                    code = e.code
+                ms = (time.perf_counter() - start) * 1000
+        finally:
+            os.chdir(cwd)
+
+        recorder.add("pipeline_ms", ms)
+        if code != 0:
+            recorder.errors.append(f"pipeline exited with {code}")
+            return
+        for spec in specs:
+            output = Path(scratch, spec.output_file)
+            recorder.check(spec.key, "pipeline output", output.read_text() if output.exists() else None,
+                           expected=spec.transform(EXPECTED_VALUES[spec.key]))
+
+
+def check_thresholds(metrics, thresholds):
+    """Return messages for metrics above their absolute limit (keys may use * wildcards)"""
+    failures = []
+    for metric, value in metrics.items():
+        for pattern, limit in thresholds.items():
+            if fnmatch.fnmatchcase(metric, pattern) and value > limit:
+                failures.append(f"{metric}: {value:.1f} ms exceeds threshold {limit:.1f} ms")
+                break
+    return failures
+
+
+def check_baseline(metrics, baseline, max_regression):
+    """Return messages for metrics that got slower than the baseline by more than max_regression"""
+    failures = []
+    for metric, value in metrics.items():
+        before = baseline.get(metric)
+        if before is None:
+            continue
+        if value > before * (1 + max_regression) and value - before > REGRESSION_SLACK_MS:
+            failures.append(f"{metric}: {value:.1f} ms vs {before:.1f} ms baseline "
+                            f"(+{(value / before - 1) * 100 if before else float('inf'):.0f}%)")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark all scrapers against local fixtures")
+    parser.add_argument("--iterations", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=100,
+                        help="Artificial server latency per page in ms (default: 100)")
+    parser.add_argument("--render-delay", type=int, default=500,
+                        help="Delay before late-rendering pages add their value, in ms (default: 500)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="--workers passed to run_scrapers for the pipeline run")
+    parser.add_argument("--output", default="benchmark_results.json",
+                        help="Where to write the results (default: benchmark_results.json)")
+    parser.add_argument("--thresholds", default=str(DEFAULT_THRESHOLDS),
+                        help="JSON file of metric -> max ms (default: benchmarks/thresholds.json)")
+    parser.add_argument("--baseline", help="Earlier results file to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.25,
+                        help="Allowed slowdown against --baseline as a fraction (default: 0.25)")
+    parser.add_argument("--static-only", action="store_true",
+                        help="Skip everything that needs Chrome; only time the browserless paths")
+    args = parser.parse_args(argv)
+
+    specs = BUILTIN_SCRAPERS
+    if args.static_only:
+        specs = [spec for spec in specs if spec.page_spec().has_static_path]
+
+    recorder = Recorder()
+    # After the first iteration the browserless paths are revalidated (HTTP 304)
+    # as in production; the cache lives only as long as the fixture server's port
+    with FixtureServer(args.latency, args.render_delay) as server, \
+            tempfile.TemporaryDirectory(prefix="scraper_bench_cache_") as cache_dir:
+        HttpCache.directory = Path(cache_dir)
+        for i in range(1, args.iterations + 1):
+            print(f"Iteration {i}/{args.iterations}...")
+            bench_static(server, specs, recorder)
+            bench_api(server, specs, recorder)
+            if not args.static_only:
+                bench_browser(server, specs, recorder)
+                bench_capture(server, specs, recorder)
+            bench_pipeline(server, specs, recorder, args.workers)
+
+    metrics = recorder.medians()
+    failures = list(dict.fromkeys(recorder.errors))
+
+    thresholds = {}
+    if args.thresholds and Path(args.thresholds).exists():
+        thresholds = json.loads(Path(args.thresholds).read_text())
+        failures += check_thresholds(metrics, thresholds)
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())["metrics"]
+        failures += check_baseline(metrics, baseline, args.max_regression)
+
+    result = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "config": {
+            "iterations": args.iterations,
+            "latency_ms": args.latency,
+            "render_delay_ms": args.render_delay,
+            "workers": args.workers,
+            "static_only": args.static_only,
+        },
+        "metrics": metrics,
+        "failures": failures,
+    }
+    Path(args.output).write_text(json.dumps(result, indent=2))
+
+    print("=" * 60)
+    print(f"{'Metric':<36} {'Median':>12}")
+    print("=" * 60)
+    for metric, value in metrics.items():
+        print(f"{metric:<36} {value:>9.1f} ms")
+    print("=" * 60)
+    print(f"Results written to {args.output}")
+
+    if failures:
+        print("\n✗ Benchmark failed:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    print("\n✓ All metrics within thresholds")
+
+
+if __name__ == "__main__":
+    main()
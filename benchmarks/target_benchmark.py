@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Target Benchmark
+Measures scraping throughput for many targets per source against a local
+fixture server, using the orchestrator's per-domain batching.
+
+Each simulated domain is a separate local server, so targets are grouped
+the same way real links.json targets on different sites would be.
+
+Usage:
+    python -m benchmarks.target_benchmark [--counts 10,100,500] [--workers N]
+                                          [--domains N] [--latency MS] [--browser]
+"""
+
+import argparse
+import contextlib
+import io
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from run_scrapers import group_by_domain, scrape_group
+from util.driver_pool import DriverPool
+from util.extractor import PageSpec, css
+from util.result_writer import ResultBatch
+
+PROPERTY_PAGE = """<!doctype html>
+<html><head><title>Property %(id)s</title></head>
+<body>
+<h1>Property %(id)s</h1>
+<div class="value">$%(value)s</div>
+</body></html>
+"""
+
+
+class PropertyHandler(BaseHTTPRequestHandler):
+    """Serves /property/<id> pages after an optional simulated latency"""
+
+    latency = 0.0
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        target_id = self.path.rstrip("/").rsplit("/", 1)[-1]
+        value = f"{100000 + sum(map(ord, target_id)) * 37:,}"
+        body = (PROPERTY_PAGE % {"id": target_id, "value": value}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_servers(domains, latency):
+    PropertyHandler.latency = latency
+    servers = []
+    for _ in range(domains):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), PropertyHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+    return servers
+
+
+def run_targets(bases, count, workers, spec):
+    """Scrape `count` targets spread over the fixture domains; return (seconds, successes)"""
+    jobs = [
+        (i, (f"fixture/{i}", f"Fixture [{i}]", spec.scrape, f"{bases[i % len(bases)]}property/{i}", None, None))
+        for i in range(1, count + 1)
+    ]
+    groups = group_by_domain(jobs)
+    pool = DriverPool(min(workers, len(groups)))
+    batch = ResultBatch()
+
+    start = time.perf_counter()
+    try:
+        # The scrapers log every step; keep the benchmark output readable
+        with contextlib.redirect_stdout(io.StringIO()):
+            with ThreadPoolExecutor(max_workers=pool.size) as executor:
+                results = {}
+                for future in [executor.submit(scrape_group, pool, group, count, batch) for group in groups]:
+                    results.update(future.result())
+    finally:
+        pool.close()
+    elapsed = time.perf_counter() - start
+    return elapsed, sum(1 for success, _ in results.values() if success)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark scraping throughput for many targets")
+    parser.add_argument("--counts", default="10,100,500",
+                        help="Comma separated numbers of targets to scrape")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--domains", type=int, default=4,
+                        help="Number of simulated sites the targets are spread over")
+    parser.add_argument("--latency", type=float, default=50,
+                        help="Simulated server latency per page in ms")
+    parser.add_argument("--browser", action="store_true",
+                        help="Scrape through Chrome instead of the browserless static path")
+    args = parser.parse_args()
+    counts = [int(c) for c in args.counts.split(",")]
+
+    servers = start_servers(args.domains, args.latency / 1000)
+    bases = [f"http://127.0.0.1:{server.server_address[1]}/" for server in servers]
+
+    if args.browser:
+        spec = PageSpec("Fixture value", [css("div.value")])
+    else:
+        spec = PageSpec("Fixture value", [css("div.value")],
+                        static_xpath="//div[@class='value']", static_pattern=r'class="value">([^<]+)<')
+
+    try:
+        print("=" * 60)
+        print(f"Throughput ({'browser' if args.browser else 'static'} path, {args.workers} workers, "
+              f"{args.domains} domains, {args.latency:.0f} ms latency)")
+        print("=" * 60)
+        print(f"{'Targets':>8} {'OK':>6} {'Seconds':>10} {'Targets/s':>11} {'ms/target':>11}")
+        for count in counts:
+            elapsed, ok = run_targets(bases, count, args.workers, spec)
+            print(f"{count:>8} {ok:>6} {elapsed:>10.2f} {count / elapsed:>11.1f} {elapsed * 1000 / count:>11.1f}")
+    finally:
+        for server in servers:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Wait Benchmark
+Compares the old WebDriverWait polling against the MutationObserver-based
+Extractor.wait_for on a local page whose value renders after a delay.
+
+Reports how long after the element appeared each wait returned.
+
+Usage:
+    python -m benchmarks.wait_benchmark [--iterations N] [--delays 200,750,1500]
+"""
+
+import argparse
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from util.chrome_driver_manager import ChromeDriverManager
+from util.extractor import Extractor, css
+
+LATE_RENDER_PAGE = """<!doctype html>
+<html><body>
+<div id="app">Loading...</div>
+<script>
+setTimeout(function () {
+    var el = document.createElement("div");
+    el.className = "statsValue price";
+    el.textContent = "$123,456";
+    document.getElementById("app").appendChild(el);
+    window.__appearedAt = Date.now();
+}, %d);
+</script>
+</body></html>
+"""
+
+
+class LateRenderHandler(BaseHTTPRequestHandler):
+    """Serves a page whose value is added by JavaScript after ?delay= ms"""
+
+    def do_GET(self):
+        delay = int(parse_qs(urlparse(self.path).query).get("delay", ["0"])[0])
+        body = (LATE_RENDER_PAGE % delay).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def wait_polling(driver):
+    element = WebDriverWait(driver, 15).until(
+        EC.presence_of_element_located((By.CSS_SELECTOR, "div.statsValue.price"))
+    )
+    return element.text.strip()
+
+
+def wait_observer(driver):
+    value, _ = Extractor.wait_for(driver, [css("div.statsValue.price")], 15)
+    return value
+
+
+def measure(driver, url, wait_fn):
+    """Return ms between the value appearing in the page and the wait returning"""
+    driver.get(url)
+    wait_fn(driver)
+    returned_at = time.time() * 1000
+    appeared_at = driver.execute_script("return window.__appearedAt;")
+    return returned_at - appeared_at
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark element waiting strategies")
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--delays", default="200,750,1500",
+                        help="Comma separated render delays in ms")
+    args = parser.parse_args()
+    delays = [int(d) for d in args.delays.split(",")]
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), LateRenderHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}/"
+
+    driver = ChromeDriverManager.create_driver()
+    try:
+        print("=" * 60)
+        print("Latency from value appearing to wait returning (ms)")
+        print("=" * 60)
+        print(f"{'Delay':>7} {'WebDriverWait':>16} {'MutationObserver':>18}")
+        for delay in delays:
+            url = f"{base}?delay={delay}"
+            polling = [measure(driver, url, wait_polling) for _ in range(args.iterations)]
+            observer = [measure(driver, url, wait_observer) for _ in range(args.iterations)]
+            print(f"{delay:>7} {statistics.median(polling):>16.1f} {statistics.median(observer):>18.1f}")
+    finally:
+        ChromeDriverManager.quit_driver(driver)
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,160 +5,970 @@ Runs Redfin, Zillow, Realtor.com, Bitnodes, Coin.dance, and Etherscan scrapers.
 Each scraper only runs if its corresponding entry is enabled in links.json.
 """
 
+import argparse
+import os
+import signal
 import sys
-from scrapers.redfin_scraper import scrape_redfin_home_value
-from scrapers.zillow_scraper import scrape_zillow_zestimate
-from scrapers.realtor_scraper import scrape_realtor_home_value
-from scrapers.bitnodes_scraper import scrape_bitcoin_node_count
-from scrapers.coindance_scraper import scrape_bitcoin_node_count as scrape_coindance_node_count
-from scrapers.etherscan_scraper import scrape_ethereum_node_count
-from util.chrome_driver_manager import ChromeDriverManager
-from util.date_gate import DateGate
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlparse
+from scrapers.registry import get_registry
+from util.chrome_driver_manager import ChromeDriverManager, LazyDriver
+from util.driver_pool import DriverPool
+from util.freshness import FreshnessCache, format_age
+from util.history_store import HistoryStore
+from util.result_writer import ResultBatch
+from util.lean_profile import LeanProfile
 from util.link_loader import LinkLoader
+from util.network_trace import NetworkTrace
+from util.recovery import CircuitBreakers, RetryPolicy
+from util.scheduler import Scheduler
+from util.success_ledger import SuccessLedger
+from util.telemetry import Telemetry
 
+# Browser traffic per scraper when --bytes is given: label -> (bytes, requests)
+network_usage = {}
 
-def get_price_num(price_str: str):
-    return price_str.replace("$", "").replace(",", "")
+# Directory this run's network traces are written to (--trace)
+trace_dir = None
+
+# Browser process tree RSS right after each scrape: label -> KiB
+memory_usage = {}
 
 
 def recreate_driver(driver):
-    """Safely quit and recreate the Chrome driver."""
+    """Quit the Chrome driver, kill its process tree, and recreate it (launched lazily on next use)."""
+    ChromeDriverManager.quit_driver(driver)
+    return ChromeDriverManager.create_lazy_driver()
+
+
+def recover_driver(driver):
+    """Keep a driver whose session still responds; recreate it only if the session is dead."""
+    if ChromeDriverManager.is_healthy(driver):
+        return driver
+    print("Driver session is not responding, recreating web driver...")
+    with Telemetry.span("driver_recreate") as span:
+        span["outcome"] = "driver_recreated"
+        return recreate_driver(driver)
+
+
+def format_bytes(count):
+    for unit in ("B", "KB", "MB"):
+        if count < 1024:
+            return f"{count:.0f} {unit}" if unit == "B" else f"{count:.1f} {unit}"
+        count /= 1024
+    return f"{count:.1f} GB"
+
+
+def record_network_usage(label, driver, events):
+    """Store and print the browser traffic of the scrape that just finished."""
+    if not ChromeDriverManager.log_network:
+        return
+    transferred, requests = ChromeDriverManager.bytes_transferred(driver, events)
+    network_usage[label] = (transferred, requests)
+    print(f"Transferred: {format_bytes(transferred)} in {requests} requests")
+
+
+def save_trace(label, source, url, driver, events, found_at):
+    """Write the waterfall and page metrics of the scrape that just finished."""
+    if trace_dir is None or not events:
+        return
+    trace = NetworkTrace(events)
+    summary = {
+        "source": source,
+        "label": label,
+        "url": url,
+        **trace.summary(found_at, ChromeDriverManager.performance_metrics(driver)),
+    }
+    path = NetworkTrace.save(trace_dir, source or label, summary)
+    slowest = f", slowest host {summary['hosts'][0]['host']}" if summary["hosts"] else ""
+    print(f"Trace: {summary['requests']} requests, {format_bytes(summary['bytes'])}{slowest} -> {path}")
+
+
+def save_result(label, value, output_file, transform=None, source=None, batch=None, duration=None):
+    """
+    Transform a scraped value and buffer it in the batch (or write it right away).
+
+    Returns:
+        bool: True if the value was saved
+    """
     try:
-        driver.quit()
-    except:
-        pass
-    return ChromeDriverManager.create_driver()
+        with Telemetry.span("transform", source=source):
+            output = transform(value) if transform else value
+        if batch is not None:
+            batch.add(label, source, value, output, output_file, duration)
+        elif output_file:
+            with open(output_file, "w") as f:
+                f.write(output)
+            print(f"✓ Saved to {output_file}")
+        return True
+    except Exception as e:
+        print(f"✗ Error saving {label}: {str(e)}")
+        return False
+
+
+def record_memory_usage(label, driver):
+    """Store the RSS of the driver's browser after a scrape, where it can be measured."""
+    rss_kb = ChromeDriverManager.browser_rss_kb(driver)
+    if rss_kb is not None:
+        memory_usage[label] = rss_kb
 
 
-def run_scraper(label, scrape_fn, url, output_file, driver, transform=None):
+def run_scraper(label, scrape_fn, url, output_file, driver, transform=None, source=None, batch=None):
     """
-    Run a single scraper and save its result to a file.
+    Run a single scraper and save its result.
+
+    With a batch, the result is buffered and published together with the
+    rest of the run by ResultBatch.commit(); without one it is written to
+    the output file immediately.
 
     Args:
         label (str): Display name for logging.
         scrape_fn (callable): Scraper function to call.
         url (str): URL to pass to the scraper.
-        output_file (str): Filename to write the result to.
+        output_file (str): Filename to write the result to, or None to skip the .txt file.
         driver: Shared Chrome driver instance.
         transform (callable, optional): Transform applied to result before saving.
+        source (str, optional): links.json key the reading is recorded under.
+        batch (ResultBatch, optional): Batch to buffer the result in.
 
     Returns:
         tuple: (success: bool, value: str|None, driver: updated driver)
+               After a failure the driver is only replaced if its session
+               no longer responds. Before scraping, a driver over the memory
+               governor's limits is recycled.
     """
+    # Between scrapes is the only safe point to swap the browser
+    driver = ChromeDriverManager.recycle_if_needed(driver)
+
     try:
-        value = scrape_fn(url, driver)
+        # These talk to a started browser right away; one that died since the
+        # last scrape fails here and is recovered like any other crash
+        if LeanProfile.enabled:
+            ChromeDriverManager.apply_lean_profile(driver, url)
+        if trace_dir is not None:
+            ChromeDriverManager.start_trace(driver)
+        # Discard traffic from earlier scrapes on this driver
+        ChromeDriverManager.drain_network_log(driver)
+
+        started = time.perf_counter()
+        with Telemetry.span("scrape", label=label) as span:
+            value = scrape_fn(url, driver)
+            if not value:
+                span["outcome"] = "failed"
+        duration = time.perf_counter() - started
+        found_at = time.time()
+        # --bytes and --trace read the same log; drain it once for both
+        events = ChromeDriverManager.drain_network_log(driver)
+        record_network_usage(label, driver, events)
+        save_trace(label, source, url, driver, events, found_at)
+        # Browserless fast paths never start a LazyDriver; only count real page loads
+        if not isinstance(driver, LazyDriver) or driver.started:
+            ChromeDriverManager.count_page_loads(driver)
+            record_memory_usage(label, driver)
         if value:
             print(f"✓ {label}: {value}")
-            try:
-                output = transform(value) if transform else value
-                with open(output_file, "w") as f:
-                    f.write(output)
-                print(f"✓ Saved to {output_file}")
-                return True, value, driver
-            except Exception as e:
-                print(f"✗ Error writing to {output_file}: {str(e)}")
-                return False, value, driver
+            return save_result(label, value, output_file, transform, source, batch, duration), value, driver
         else:
             print(f"✗ Failed to scrape {label}")
-            return False, None, driver
+            return False, None, recover_driver(driver)
     except Exception as e:
         print(f"✗ {label} scraper crashed: {str(e)}")
-        print("Recreating web driver...")
-        driver = recreate_driver(driver)
-        return False, None, driver
+        return False, None, recover_driver(driver)
+
 
+def scrape_with_retries(lease, index, total, key, label, fn, url, output_file, transform, batch,
+                        retry=None, breakers=None):
+    """
+    Run a single scraper on a leased driver, retrying on failure.
 
-def main():
-    gate = DateGate()
+    A driver recreated after a crash is handed back to the lease, so only
+    this slot of the pool is replaced.
 
-    """Main function to run all enabled scrapers"""
-    print("=" * 60)
-    print("Starting Home Value and Node Count Scraper")
-    print("=" * 60)
+    Args:
+        lease (DriverLease): Driver the scraper runs on.
+        retry (RetryPolicy, optional): Attempts and backoff. Defaults to a single attempt.
+        breakers (CircuitBreakers, optional): Breakers updated with every attempt;
+                                              retries stop once the source's opens.
 
-    if not gate.proceed():
-        print("Already ran today. Skipping operation.")
-        sys.exit(0)
+    Returns:
+        tuple: (success: bool, value: str|None)
+    """
+    retry = retry or RetryPolicy(attempts=1)
+    success, value = False, None
 
-    # Load links from configuration
-    print("\nLoading links from configuration...")
-    print("-" * 60)
+    for attempt in range(1, retry.attempts + 1):
+        if attempt == 1:
+            print(f"\n[{index}/{total}] Scraping {label}...")
+        else:
+            print(f"\n[{index}/{total}] Retrying {label} (attempt {attempt}/{retry.attempts})...")
+        print("-" * 60)
+        with Telemetry.source(key):
+            success, value, lease.driver = run_scraper(
+                label, fn, url, output_file, lease.driver, transform, source=key, batch=batch
+            )
+
+        if success:
+            if breakers is not None:
+                breakers.record_success(key)
+            break
+        if breakers is not None and breakers.record_failure(key):
+            print(f"⚠ Circuit breaker open for {label}; skipping it for {format_age(CircuitBreakers.COOLDOWN)}")
+            break
+        if attempt < retry.attempts:
+            delay = retry.delay(attempt)
+            print(f"Retrying {label} in {delay:.1f}s...")
+            time.sleep(delay)
+
+    return success, value
+
+
+def group_by_domain(jobs):
+    """
+    Split scraper jobs into batches that share a site.
+
+    Args:
+        jobs (list): (index, job tuple) pairs, job[3] being the URL.
+
+    Returns:
+        list: Lists of (index, job tuple), one per domain, in first-seen order.
+    """
+    groups = {}
+    for index, job in jobs:
+        groups.setdefault(urlparse(job[3]).netloc.lower(), []).append((index, job))
+    return list(groups.values())
+
+
+def scrape_group(pool, group, total, batch, retry=None, breakers=None):
+    """
+    Lease one driver and run every job of a domain batch on it in order.
+
+    Targets on the same site reuse one browser session (cookies, cache,
+    open connections) instead of each paying for a fresh one. Backoff
+    between retries happens with the lease held, which only delays the
+    rest of this domain's batch.
+
+    Args:
+        pool (DriverPool): Pool to lease the driver from.
+        group (list): (index, (key, label, fn, url, output_file, transform)) pairs.
+        total (int): Number of jobs in the run, for progress output.
+        batch (ResultBatch): Batch results are buffered in.
+        retry (RetryPolicy, optional): Attempts and backoff per job.
+        breakers (CircuitBreakers, optional): Per-target circuit breakers.
+
+    Returns:
+        dict: {label: (success: bool, value: str|None)}
+    """
+    results = {}
+    with pool.lease() as lease:
+        for index, (key, label, fn, url, output_file, transform) in group:
+            results[label] = scrape_with_retries(
+                lease, index, total, key, label, fn, url, output_file, transform, batch, retry, breakers
+            )
+    return results
+
+
+def scrape_tabs(pool, jobs, page_specs, total, batch, tabs, retry=None, breakers=None):
+    """
+    Scrape jobs concurrently in the tabs of a single leased driver.
+
+    Jobs whose PageSpec has a browserless path try it first. The rest are
+    loaded up to `tabs` at a time by a TabMultiplexer. Jobs that fail in a
+    tab get the remaining retries one page at a time, and jobs without a
+    PageSpec (e.g. plugin scrapers) run one page at a time from the start.
+
+    Args:
+        pool (DriverPool): Pool to lease the driver from.
+        jobs (list): (index, (key, label, fn, url, output_file, transform)) pairs.
+        page_specs (dict): {label: PageSpec or None}.
+        total (int): Number of jobs in the run, for progress output.
+        batch (ResultBatch): Batch results are buffered in.
+        tabs (int): Maximum number of tabs loading at once.
+        retry (RetryPolicy, optional): Attempts and backoff per job.
+        breakers (CircuitBreakers, optional): Per-target circuit breakers.
+
+    Returns:
+        dict: {label: (success: bool, value: str|None)}
+    """
+    # Imported here so runs without --tabs don't pay for them at startup
+    from util.static_fetcher import StaticFetcher
+    from util.tab_multiplexer import TabMultiplexer
+
+    retry = retry or RetryPolicy(attempts=1)
+    results = {}
+    sequential = []
+    pages = []
+    by_label = {}
+
+    for index, job in jobs:
+        key, label, fn, url, output_file, transform = job
+        spec = page_specs.get(label)
+        if spec is None:
+            sequential.append((index, job))
+            continue
+        if spec.has_static_path:
+            started = time.perf_counter()
+            with Telemetry.source(key):
+                value = StaticFetcher.scrape(url, xpath=spec.static_xpath, pattern=spec.static_pattern)
+            if value:
+                print(f"✓ {label}: {value}")
+                if save_result(label, value, output_file, transform, key, batch, time.perf_counter() - started):
+                    if breakers is not None:
+                        breakers.record_success(key)
+                    results[label] = (True, value)
+                    continue
+        pages.append((label, spec, url))
+        by_label[label] = (index, job)
+
+    with pool.lease() as lease:
+        retries = []
+        if pages:
+            print(f"\nLoading {len(pages)} page{'s' if len(pages) != 1 else ''} in up to {tabs} tabs...")
+            print("-" * 60)
+            lease.driver = ChromeDriverManager.recycle_if_needed(lease.driver)
+            try:
+                harvested = TabMultiplexer(lease.driver, tabs).run(pages)
+            except Exception as e:
+                print(f"✗ Tab multiplexing failed: {str(e)}")
+                harvested = getattr(e, "results", {})
+                lease.driver = recover_driver(lease.driver)
+
+            for label, spec, url in pages:
+                index, (key, _, fn, _, output_file, transform) = by_label[label]
+                value, duration, rss_kb = harvested.get(label, (None, None, None))
+                if duration is not None:
+                    Telemetry.record("scrape", duration, source=key, outcome="success" if value else "timeout",
+                                     label=label, mode="tab")
+                if rss_kb is not None:
+                    memory_usage[label] = rss_kb
+                if value:
+                    print(f"✓ {label}: {value}")
+                    if save_result(label, value, output_file, transform, key, batch, duration):
+                        if breakers is not None:
+                            breakers.record_success(key)
+                        results[label] = (True, value)
+                        continue
+                results[label] = (False, None)
+                if breakers is not None and breakers.record_failure(key):
+                    print(f"⚠ Circuit breaker open for {label}; skipping it for {format_age(CircuitBreakers.COOLDOWN)}")
+                elif retry.attempts > 1:
+                    retries.append(by_label[label])
+
+        # The tab attempt counts as the first one
+        remaining = RetryPolicy(max(1, retry.attempts - 1), retry.base_delay, retry.max_delay)
+        for policy, group in ((retry, sequential), (remaining, retries)):
+            for index, (key, label, fn, url, output_file, transform) in group:
+                results[label] = scrape_with_retries(
+                    lease, index, total, key, label, fn, url, output_file, transform, batch, policy, breakers
+                )
+
+    return results
+
+
+def export_telemetry(args):
+    """Write the run's spans to the files requested on the command line."""
     try:
-        LinkLoader.load()
+        if args.spans:
+            Telemetry.write_jsonl(args.spans)
+            print(f"✓ Timing spans appended to {args.spans}")
+        if args.prom_textfile:
+            Telemetry.write_textfile(args.prom_textfile)
+            print(f"✓ Prometheus metrics written to {args.prom_textfile}")
     except Exception as e:
-        print(f"✗ Error loading links: {str(e)}")
-        sys.exit(1)
+        print(f"⚠ Could not export timings: {str(e)}")
 
-    # Full scraper registry — url will be None if disabled in links.json
-    scrapers = [
-        ("Redfin",      scrape_redfin_home_value,        LinkLoader.redfin,     "redfin.txt",     get_price_num),
-        ("Zillow",      scrape_zillow_zestimate,          LinkLoader.zillow,     "zillow.txt",     get_price_num),
-        ("Realtor.com", scrape_realtor_home_value,        LinkLoader.realtor,    "realtor.txt",    get_price_num),
-        ("Bitnodes",    scrape_bitcoin_node_count,        LinkLoader.bitnodes,   "bitnodes.txt",   get_price_num),
-        ("Coin.dance",  scrape_coindance_node_count,      LinkLoader.coindance,  "coindance.txt",  get_price_num),
-        ("Etherscan",   scrape_ethereum_node_count,       LinkLoader.etherscan,  "etherscan.txt",  get_price_num),
-    ]
 
-    enabled_scrapers = [(label, fn, url, out, tx) for label, fn, url, out, tx in scrapers if url is not None]
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run all enabled scrapers from links.json")
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="Number of scrapers to run concurrently, each with its own Chrome driver (default: 1)",
+    )
+    parser.add_argument(
+        "--status", action="store_true",
+        help="List live Chrome driver leases with their memory use and exit",
+    )
+    parser.add_argument(
+        "--warm", action="store_true",
+        help="Attach to the warm browser daemon (started on demand) instead of launching Chrome",
+    )
+    parser.add_argument(
+        "--lean", action="store_true",
+        help="Block images, fonts, media and tracker hosts (see lean_profile.json)",
+    )
+    parser.add_argument(
+        "--bytes", action="store_true",
+        help="Report bytes the browser transferred for each scraper",
+    )
+    parser.add_argument(
+        "--history-db", default="history.db",
+        help="SQLite database every scraped value is appended to (default: history.db)",
+    )
+    parser.add_argument(
+        "--no-txt", action="store_true",
+        help="Only record values in the history database; don't write the per-source .txt files",
+    )
+    parser.add_argument(
+        "--history", metavar="SOURCES",
+        help="Print the daily history of comma separated sources (e.g. zillow,redfin) and exit",
+    )
+    parser.add_argument(
+        "--days", type=int, default=365,
+        help="How many days of history --history prints (default: 365)",
+    )
+    parser.add_argument(
+        "--import-txt", action="store_true",
+        help="Import the values in existing .txt output files into the history database and exit",
+    )
+    parser.add_argument(
+        "--force", metavar="SOURCE", action="append", default=[],
+        help="Scrape SOURCE (a links.json key, or 'all') even if its cached value is fresh; repeatable",
+    )
+    parser.add_argument(
+        "--retries", type=int, default=2,
+        help="Retries per failed source, with jittered exponential backoff (default: 2)",
+    )
+    parser.add_argument(
+        "--max-browser-mb", type=float,
+        help="Recycle a browser between scrapes once its processes use this many MB (default: no limit)",
+    )
+    parser.add_argument(
+        "--max-page-loads", type=int,
+        help="Recycle a browser between scrapes after it has loaded this many pages (default: no limit)",
+    )
+    parser.add_argument(
+        "--spans", metavar="FILE",
+        help="Append timing spans for every phase of the run to FILE as JSON lines",
+    )
+    parser.add_argument(
+        "--prom-textfile", metavar="FILE",
+        help="Write the run's timings as Prometheus metrics for node_exporter's textfile collector",
+    )
+    parser.add_argument(
+        "--trace", nargs="?", const="traces", metavar="DIR",
+        help="Save a per-request network waterfall and page metrics for every browser scrape "
+             "under DIR/<run>/ (default DIR: traces)",
+    )
+    parser.add_argument(
+        "--no-http-cache", action="store_true",
+        help="Download browserless pages and API responses in full instead of revalidating cached copies",
+    )
+    parser.add_argument(
+        "--intercept", action="store_true",
+        help="Read values from the JSON responses pages fetch where a scraper declares them, "
+             "and stop loading the page once the value is in (DOM extraction stays as fallback)",
+    )
+    parser.add_argument(
+        "--tabs", type=int, default=1,
+        help="Load up to N pages at once in tabs of a single browser (default: 1, one page at a time)",
+    )
+    parser.add_argument(
+        "--daemon", action="store_true",
+        help="Stay resident and scrape each source whenever it is due (its ttl, or daily), "
+             "reloading links.json when it changes",
+    )
+    parser.add_argument(
+        "--tick", type=float, default=30,
+        help="With --daemon: seconds between checks for due sources (default: 30)",
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=30,
+        help="With --daemon: random delay of up to this many seconds before a due source fires (default: 30)",
+    )
+    parser.add_argument(
+        "--retry-after", type=float, default=300,
+        help="With --daemon: seconds before a failed source is tried again (default: 300)",
+    )
+    parser.add_argument(
+        "--browser-idle", type=float, default=600,
+        help="With --daemon: close browsers after this many idle seconds (default: 600)",
+    )
+    parser.add_argument(
+        "--serve", metavar="ADDRESS",
+        help="With --daemon: serve the latest values as JSON on HOST:PORT (e.g. 127.0.0.1:8765) "
+             "or unix:/path/to.sock",
+    )
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.tabs < 1:
+        parser.error("--tabs must be at least 1")
+    if args.tabs > 1 and args.workers > 1:
+        parser.error("--tabs and --workers can't be combined; tabs share a single browser")
+    if args.tabs > 1:
+        # Tab mode drives pages outside run_scraper, so per-page setup and
+        # network accounting never happen there
+        per_page = [flag for flag, on in (("--lean", args.lean), ("--bytes", args.bytes),
+                                           ("--intercept", args.intercept), ("--trace", args.trace)) if on]
+        if per_page:
+            parser.error(f"{' and '.join(per_page)} {'need' if len(per_page) > 1 else 'needs'} one page at a time; "
+                         f"{'they' if len(per_page) > 1 else 'it'} can't be combined with --tabs")
+    if args.retries < 0:
+        parser.error("--retries can't be negative")
+    if args.tick <= 0 or args.jitter < 0 or args.retry_after < 0 or args.browser_idle < 0:
+        parser.error("--tick must be positive and --jitter, --retry-after and --browser-idle can't be negative")
+    if args.serve and not args.daemon:
+        parser.error("--serve needs --daemon; a single run exits before anyone could read the values")
+    return args
+
+
+def select_due(scrapers, ledger, force, freshness, breakers):
+    """
+    Split enabled scrapers into those due to run and those that can be skipped.
+
+    A source with a "ttl" in links.json is due once its cached value is
+    older than the TTL. A source without one runs once per day: it is due
+    until the ledger has a success for it today, so failed sources are
+    retried by the next run. Sources whose circuit breaker is open are
+    skipped until its cooldown ends. Sources named in --force (or "all")
+    always run.
+
+    Args:
+        scrapers (list): (key, label, spec, url, output_file, transform) tuples.
+        ledger (SuccessLedger): Sources that already succeeded today.
+        force (set): Keys given to --force.
+        freshness (FreshnessCache): Cache of each source's latest value.
+        breakers (CircuitBreakers): Per-source circuit breakers.
+
+    Returns:
+        tuple: (due scrapers: list, skipped: {label: reason})
+    """
+    due = []
+    skipped = {}
+    for scraper in scrapers:
+        key, label, spec, url, output_file, transform = scraper
+        if url is None:
+            continue
+        if "all" in force or key in force or key.split("/")[0] in force:
+            due.append(scraper)
+            continue
+
+        ttl = LinkLoader.get_ttl(key)
+        if ttl is None:
+            if ledger.succeeded_today(key):
+                skipped[label] = "SKIPPED (succeeded today)"
+                continue
+        else:
+            cached = freshness.fresh_value(key, ttl)
+            if cached is not None:
+                age = format_age(time.time() - cached["ts"])
+                skipped[label] = f"FRESH {cached['raw']} ({age} old, ttl {format_age(ttl)})"
+                continue
+
+        if not breakers.allow(key):
+            skipped[label] = f"SKIPPED (circuit open, retry in {format_age(breakers.retry_in(key))})"
+            continue
+        due.append(scraper)
+    return due, skipped
+
+
+def print_history(history, sources, days):
+    """Print one row per day with the last value of each source."""
+    table = history.daily(sources, days)
+    print(f"{'Date':<12}" + "".join(f"{source:>16}" for source in sources))
+    for day, values in table.items():
+        cells = []
+        for source in sources:
+            value = values.get(source)
+            cells.append(f"{value:>16,.0f}" if isinstance(value, float) else f"{value or '-':>16}")
+        print(f"{day:<12}" + "".join(cells))
+    print(f"{len(table)} day{'s' if len(table) != 1 else ''} of history")
+
+
+def _exit_on_signal(signum, frame):
+    """Turn SIGTERM/SIGHUP (e.g. the konsole window closing) into a normal exit so drivers are cleaned up."""
+    sys.exit(128 + signum)
+
+
+def _stop_daemon(signum, frame):
+    raise KeyboardInterrupt
+
+
+def apply_flags(args):
+    """Set the process-wide options chosen on the command line."""
+    if args.warm:
+        ChromeDriverManager.use_daemon = True
+    LeanProfile.enabled = args.lean
+    if args.no_http_cache:
+        from util.http_cache import HttpCache
+        HttpCache.enabled = False
+    ChromeDriverManager.log_network = args.bytes
+    if args.trace:
+        ChromeDriverManager.trace = True
+    if args.max_browser_mb is not None:
+        ChromeDriverManager.max_rss_mb = args.max_browser_mb
+    if args.max_page_loads is not None:
+        ChromeDriverManager.max_page_loads = args.max_page_loads
+    if args.tabs > 1:
+        # Navigations must not block the session while other tabs are checked
+        ChromeDriverManager.page_load_strategy = "none"
+    if args.intercept:
+        ChromeDriverManager.capture_responses = True
+        # Responses are read while the page is still loading
+        ChromeDriverManager.page_load_strategy = "none"
+
+
+def build_scrapers(no_txt=False):
+    """
+    One job per enabled target of every registered scraper, from the loaded links.json.
+
+    A disabled entry keeps a single job with url None. Scraper modules are
+    only imported for enabled entries. With no_txt, values only go to the
+    history database.
+
+    Returns:
+        list: (key, label, spec, url, output_file, transform) tuples.
+
+    Raises:
+        ValueError: If a target asks for a backend its scraper doesn't have.
+    """
+    scrapers = []
+    for spec in get_registry(LinkLoader.links).values():
+        targets = LinkLoader.get_targets(spec.key)
+        if not targets:
+            scrapers.append((spec.key, spec.label, spec, None, None, spec.transform))
+        for target in targets:
+            output_file = None if no_txt else spec.output_for(target)
+            scrapers.append((target.id, spec.label_for(target), spec.with_backend(target.backend),
+                             target.link, output_file, spec.transform))
+    return scrapers
+
+
+def run_due(args, due, summary, skipped, history, ledger, breakers, pool=None):
+    """
+    Scrape the due jobs, publish their results and print the summary.
+
+    Args:
+        args (argparse.Namespace): Parsed command line.
+        due (list): Jobs to scrape, as returned by select_due().
+        summary (list): Jobs to list in the summary (disabled and skipped
+                        ones are shown with their reason).
+        skipped (dict): {label: reason} for jobs that were not due.
+        history (HistoryStore): Store the results are recorded in.
+        ledger (SuccessLedger): Sources that succeeded today.
+        breakers (CircuitBreakers): Per-target circuit breakers.
+        pool (DriverPool, optional): Pool to lease drivers from. Without
+                                     one, a pool is created for this run
+                                     and closed at the end.
+
+    Returns:
+        tuple: (exit code: int, {key: success bool} for every due job)
+    """
+    global trace_dir
+    if args.spans or args.prom_textfile:
+        Telemetry.start_run()
+    run_started = time.perf_counter()
+    if args.trace:
+        trace_dir = Path(args.trace) / datetime.now().strftime("%Y%m%d-%H%M%S")
+    network_usage.clear()
+    memory_usage.clear()
+
+    enabled_scrapers = [
+        (key, label, spec.load(), url, out, tx)
+        for key, label, spec, url, out, tx in due
+    ]
     total = len(enabled_scrapers)
 
-    if total == 0:
-        print("✗ No scrapers are enabled. Check links.json.")
-        sys.exit(1)
+    # Summary column wide enough for the longest target label
+    width = max([14] + [len(label) + 2 for _, label, _, _, _, _ in summary])
+
+    if skipped:
+        print(f"Retrying {total} of {total + len(skipped)} enabled sources: "
+              f"{', '.join(label for _, label, _, _, _, _ in enabled_scrapers)}")
 
     # Track results: label -> (success, value, output_file)
     results = {}
 
-    # Create a single shared Chrome driver
-    print("\nInitializing shared Chrome driver...")
-    print("-" * 60)
-    driver = ChromeDriverManager.create_driver()
+    # Results are published together once every scraper has finished
+    batch = ResultBatch(history)
+
+    ChromeDriverManager.reap_orphans()
+
+    # Targets are batched per domain, each batch running on one leased driver.
+    # One driver per worker; a single worker keeps the original shared-driver behaviour
+    groups = group_by_domain(list(enumerate(enabled_scrapers, start=1)))
+    own_pool = pool is None
+    if own_pool:
+        workers = min(args.workers, len(groups))
+        print(f"\nInitializing Chrome driver pool ({workers} worker{'s' if workers > 1 else ''})...")
+        print("-" * 60)
+        pool = DriverPool(workers)
+    workers = min(pool.size, len(groups))
+    retry = RetryPolicy(attempts=args.retries + 1)
 
     try:
-        for i, (label, fn, url, output_file, transform) in enumerate(enabled_scrapers, start=1):
-            print(f"\n[{i}/{total}] Scraping {label}...")
-            print("-" * 60)
-            success, value, driver = run_scraper(label, fn, url, output_file, driver, transform)
-            results[label] = (success, value, output_file)
+        if args.tabs > 1:
+            # Every page shares the one driver, loading in parallel tabs
+            page_specs = {label: spec.page_spec() for _, label, spec, _, _, _ in due}
+            outcomes = scrape_tabs(
+                pool, list(enumerate(enabled_scrapers, start=1)), page_specs, total, batch,
+                args.tabs, retry, breakers,
+            )
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(scrape_group, pool, group, total, batch, retry, breakers)
+                    for group in groups
+                ]
+                outcomes = {}
+                for future in futures:
+                    outcomes.update(future.result())
+        for key, label, fn, url, output_file, transform in enabled_scrapers:
+            success, value = outcomes[label]
+            results[label] = (success, value, output_file or history.filepath)
 
     finally:
-        print("\nClosing shared Chrome driver...")
-        try:
-            driver.quit()
-        except:
-            pass
+        if own_pool:
+            print("\nClosing Chrome driver pool...")
+            pool.close()
+
+    print("\nSaving results...")
+    print("-" * 60)
+    for label in batch.commit():
+        success, value, output_file = results[label]
+        results[label] = (False, value, output_file)
 
     # Summary
     print("\n" + "=" * 60)
     print("Summary")
     print("=" * 60)
 
-    for label, fn, url, output_file, _ in scrapers:
+    for key, label, spec, url, output_file, _ in summary:
         if url is None:
-            print(f"{label + ':':<14} SKIPPED (disabled)")
+            print(f"{label + ':':<{width}} SKIPPED (disabled)")
+        elif label in skipped:
+            print(f"{label + ':':<{width}} {skipped[label]}")
         else:
             success, value, out = results[label]
             if success:
-                print(f"{label + ':':<14} {value} → {out}")
+                print(f"{label + ':':<{width}} {value} → {out}")
             else:
-                print(f"{label + ':':<14} FAILED")
+                print(f"{label + ':':<{width}} FAILED")
+
+    if ChromeDriverManager.log_network:
+        print("-" * 60)
+        print(f"Browser traffic ({'lean profile' if LeanProfile.enabled else 'full profile'}):")
+        for label, (transferred, requests) in network_usage.items():
+            print(f"{label + ':':<{width}} {format_bytes(transferred):>10} in {requests} requests")
+        total_bytes = sum(transferred for transferred, _ in network_usage.values())
+        print(f"{'Total:':<{width}} {format_bytes(total_bytes):>10}")
+
+    if memory_usage:
+        print("-" * 60)
+        print("Browser memory (RSS after each scrape):")
+        for label, rss_kb in memory_usage.items():
+            print(f"{label + ':':<{width}} {format_bytes(rss_kb * 1024):>10}")
+        print(f"{'Peak:':<{width}} {format_bytes(max(memory_usage.values()) * 1024):>10}")
 
     print("=" * 60)
 
-    gate.save_date()
+    # Only sources whose values were published count as done for today
+    ledger.record([key for key, label, _, _, _, _ in enabled_scrapers if results[label][0]])
+    succeeded = {key: results[label][0] for key, label, _, _, _, _ in enabled_scrapers}
 
     # Exit based on enabled scrapers only
     successes = [s for s, _, __ in results.values()]
+
+    if Telemetry.enabled:
+        outcome = "success" if all(successes) else "partial" if any(successes) else "failed"
+        Telemetry.record("run", time.perf_counter() - run_started, outcome=outcome, sources=total)
+        export_telemetry(args)
     if all(successes):
         print("\n✓ All enabled scrapers completed successfully!")
-        sys.exit(0)
+        return 0, succeeded
     elif any(successes):
         print("\n⚠ Some scrapers failed")
-        sys.exit(1)
+        return 1, succeeded
     else:
         print("\n✗ All scrapers failed")
+        return 1, succeeded
+
+
+def run_daemon(args, history, ledger, breakers):
+    """
+    Stay resident and scrape every source whenever it is due.
+
+    Modules, configuration, the driver pool, the HTTP connection pool and
+    the HTTP cache stay loaded between triggers, so each trigger only costs
+    the scrape itself. Due sources are checked every --tick seconds and
+    fired with jitter (see Scheduler). links.json is reloaded when it
+    changes on disk or on SIGHUP; a broken edit keeps the previous config.
+    Browsers idle for longer than --browser-idle seconds are closed and
+    relaunched on the next trigger that needs one. With --serve, the latest
+    value of every source is served from memory by a ReadApi.
+    """
+    config = Path("links.json")
+    scheduler = Scheduler(jitter=args.jitter, retry_after=args.retry_after)
+    freshness = FreshnessCache(history)
+    pool = DriverPool(args.workers)
+    reload_requested = []
+
+    if hasattr(signal, "SIGHUP"):
+        signal.signal(signal.SIGHUP, lambda signum, frame: reload_requested.append(signum))
+    # A service manager stopping the daemon is a normal shutdown, not an error
+    signal.signal(signal.SIGTERM, _stop_daemon)
+
+    force = {key.strip() for value in args.force for key in value.split(",") if key.strip()}
+    scrapers = []
+    loaded_mtime = None
+    last_used = time.monotonic()
+
+    snapshot = None
+    read_api = None
+    if args.serve:
+        from util.read_api import ReadApi, Snapshot
+        snapshot = Snapshot()
+        try:
+            read_api = ReadApi(snapshot, args.serve).start()
+        except (OSError, ValueError) as e:
+            print(f"✗ Could not serve the read API on {args.serve}: {str(e)}")
+            return 1
+        print(f"✓ Serving latest values at {read_api.url}")
+
+    print(f"Daemon started (pid {os.getpid()}); checking sources every {args.tick:g}s")
+    try:
+        while True:
+            try:
+                mtime = config.stat().st_mtime_ns
+            except OSError:
+                mtime = None
+            if mtime != loaded_mtime or reload_requested:
+                reload_requested.clear()
+                try:
+                    # The jobs are built from LinkLoader, so the new config is
+                    # only kept once they build; the running jobs keep theirs
+                    previous = LinkLoader.save_state()
+                    LinkLoader.load(str(config))
+                    try:
+                        new_scrapers = build_scrapers(args.no_txt)
+                    except Exception:
+                        LinkLoader.restore_state(previous)
+                        raise
+                    scrapers = new_scrapers
+                    print(f"Watching {sum(1 for job in scrapers if job[3] is not None)} enabled targets")
+                    if read_api:
+                        keys = [job[0] for job in scrapers if job[3] is not None]
+                        snapshot.retain(keys)
+                        snapshot.update({key: history.latest(key) for key in keys})
+                except Exception as e:
+                    print(f"✗ Error loading links: {str(e)}" + ("; keeping the previous configuration" if scrapers else ""))
+                loaded_mtime = mtime
+
+            due, _ = select_due(scrapers, ledger, force, freshness, breakers)
+            force = set()
+            ready = set(scheduler.ready([job[0] for job in due]))
+            fire = [job for job in due if job[0] in ready]
+
+            if fire:
+                print("\n" + "=" * 60)
+                print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} Scraping "
+                      f"{', '.join(label for _, label, _, _, _, _ in fire)}")
+                print("=" * 60)
+                _, succeeded = run_due(args, fire, fire, {}, history, ledger, breakers, pool)
+                for key, success in succeeded.items():
+                    scheduler.finished(key, success, LinkLoader.get_ttl(key))
+                if read_api:
+                    snapshot.update({key: history.latest(key) for key, success in succeeded.items() if success})
+                last_used = time.monotonic()
+            elif pool.has_browsers() and time.monotonic() - last_used > args.browser_idle:
+                print("Closing idle browsers")
+                pool.close()
+
+            wait = args.tick
+            next_fire = scheduler.next_fire()
+            if next_fire is not None:
+                wait = min(wait, max(0.0, next_fire - time.time()))
+            time.sleep(max(wait, 0.5))
+    except KeyboardInterrupt:
+        print("\nStopping daemon")
+    finally:
+        # Service managers and `timeout` may signal again; don't let that cut
+        # the cleanup short and leave browsers or the read API socket behind
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        if read_api:
+            read_api.stop()
+        pool.close()
+        # Only open if a browserless fetch or API backend ran
+        if "util.http_session" in sys.modules:
+            from util.http_session import HttpSession
+            HttpSession.close()
+    return 0
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.status:
+        ChromeDriverManager.print_status()
+        sys.exit(0)
+
+    history = HistoryStore(args.history_db)
+
+    if args.history:
+        print_history(history, [s.strip() for s in args.history.split(",") if s.strip()], args.days)
+        sys.exit(0)
+
+    if args.import_txt:
+        files = {spec.key: spec.output_file for spec in get_registry().values()}
+        imported = history.import_txt(files)
+        print(f"✓ Imported {imported} value{'s' if imported != 1 else ''} into {history.filepath}")
+        sys.exit(0)
+
+    for sig in ("SIGTERM", "SIGHUP"):
+        if hasattr(signal, sig):
+            signal.signal(getattr(signal, sig), _exit_on_signal)
+
+    apply_flags(args)
+
+    ledger = SuccessLedger()
+    breakers = CircuitBreakers()
+
+    if args.daemon:
+        sys.exit(run_daemon(args, history, ledger, breakers))
+
+    """Main function to run all enabled scrapers"""
+    print("=" * 60)
+    print("Starting Home Value and Node Count Scraper")
+    print("=" * 60)
+
+    # Load links from configuration
+    print("\nLoading links from configuration...")
+    print("-" * 60)
+    try:
+        LinkLoader.load()
+    except Exception as e:
+        print(f"✗ Error loading links: {str(e)}")
         sys.exit(1)
 
+    try:
+        scrapers = build_scrapers(args.no_txt)
+    except ValueError as e:
+        print(f"✗ Error in links.json: {str(e)}")
+        sys.exit(1)
+
+    if all(url is None for _, _, _, url, _, _ in scrapers):
+        print("✗ No scrapers are enabled. Check links.json.")
+        sys.exit(1)
+
+    # Only sources whose cached value has expired (or that haven't succeeded today) are scraped
+    force = {key.strip() for value in args.force for key in value.split(",") if key.strip()}
+    due, skipped = select_due(scrapers, ledger, force, FreshnessCache(history), breakers)
+
+    if not due:
+        if all(reason == "SKIPPED (succeeded today)" for reason in skipped.values()):
+            print("Already ran today. Skipping operation.")
+        else:
+            width = max([14] + [len(label) + 2 for _, label, _, _, _, _ in scrapers])
+            for label, reason in skipped.items():
+                print(f"{label + ':':<{width}} {reason}")
+            print("No enabled sources are due. Skipping operation.")
+        sys.exit(0)
+
+    code, _ = run_due(args, due, scrapers, skipped, history, ledger, breakers)
+    sys.exit(code)
+
 
 if __name__ == "__main__":
     main()
@@ -1,19 +1,28 @@
 #!/usr/bin/env python3
 """
 Bitnodes.io Bitcoin Nodes Scraper
-Scrapes the total number of Bitcoin nodes from bitnodes.io using headless Selenium
+Scrapes the total number of Bitcoin nodes from bitnodes.io over plain HTTP,
+falling back to headless Selenium, or reads it from the Bitnodes REST API
 """
 
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from util.chrome_driver_manager import ChromeDriverManager
+from util.extractor import PageSpec, css
+from util.json_api import JsonApi
 from util.link_loader import LinkLoader
-import time
-import platform
+
+# The node count link is in the server-rendered HTML, so the browserless
+# fast path normally finds it without starting Chrome
+SPEC = PageSpec(
+    "Total Bitcoin nodes",
+    [css('a[href="."]')],
+    timeout=15,
+    static_xpath='//a[@href="."]',
+    static_pattern=r'<a href="\.">\s*([\d,]+)\s*</a>',
+)
+
+# "backend": "api" in links.json. The snapshot list holds just the counts;
+# /snapshots/latest/ would also send every node's details.
+API = JsonApi("Total Bitcoin nodes", "/api/v1/snapshots/?limit=1", "results.0.total_nodes")
+
 
 def scrape_bitcoin_node_count(url, driver=None):
     """
@@ -26,38 +35,22 @@ def scrape_bitcoin_node_count(url, driver=None):
     Returns:
         str: The total number of Bitcoin nodes as a string, or None if not found
     """
-    # Track if we created the driver (so we know whether to close it)
-    driver_created = driver is None
-    
-    if driver is None:
-        driver = ChromeDriverManager.create_driver()
-    
-    try:
-        print(f"Navigating to: {url}")
-        driver.get(url)
-        
-        # Wait for the page to load and the node count element to be present
-        wait = WebDriverWait(driver, 15)
-        
-        # Find the <a> tag with href="/nodes/"
-        node_count_element = wait.until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, 'a[href="."]'))
-        )
-        
-        # Extract the text
-        node_count = node_count_element.text.strip()
-        
-        print(f"Total Bitcoin nodes found: {node_count}")
-        return node_count
-        
-    except Exception as e:
-        print(f"Error occurred: {str(e)}")
-        return None
-        
-    finally:
-        # Clean up - close the browser only if we created it
-        if driver_created and driver:
-            driver.quit()
+    return SPEC.scrape(url, driver)
+
+
+def scrape_bitcoin_node_count_api(url, driver=None):
+    """
+    Read the total number of Bitcoin nodes from the Bitnodes API
+
+    Args:
+        url (str): The bitnodes.io URL; the API is queried on the same host
+        driver: Unused; no browser is needed
+
+    Returns:
+        str: The total number of Bitcoin nodes as a string, or None if not found
+    """
+    return API.scrape(url)
+
 
 def main():
     """Main function to run the scraper"""
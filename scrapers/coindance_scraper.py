@@ -1,18 +1,27 @@
 #!/usr/bin/env python3
 """
 Coin.Dance Bitcoin Nodes Scraper
-Scrapes the total number of Bitcoin nodes from coin.dance/nodes using headless Selenium
+Scrapes the total number of Bitcoin nodes from coin.dance/nodes over plain HTTP,
+falling back to headless Selenium
 """
 
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from util.chrome_driver_manager import ChromeDriverManager
+from util.extractor import PageSpec, xpath
 from util.link_loader import LinkLoader
 
+# The node count sits in a <strong> inside the "Total node count" tooltip div.
+# The served HTML carries the tooltip in `title`; qTip renames it to
+# `oldtitle` only after its JavaScript runs, so the browser checks both.
+SPEC = PageSpec(
+    "Total Bitcoin nodes",
+    [
+        xpath("//div[@oldtitle='Total node count does not include duplicate and non-listening nodes.']//strong"),
+        xpath("//div[@title='Total node count does not include duplicate and non-listening nodes.']//strong"),
+    ],
+    timeout=15,
+    static_xpath="//div[@title='Total node count does not include duplicate and non-listening nodes.']//strong",
+    static_pattern=r'There are currently\s*<strong[^>]*>\s*([\d,]+)\s*</strong>',
+)
+
 
 def scrape_bitcoin_node_count(url, driver=None):
     """
@@ -29,39 +38,7 @@ def scrape_bitcoin_node_count(url, driver=None):
     Returns:
         str: The total number of Bitcoin nodes as a string, or None if not found
     """
-    driver_created = driver is None
-
-    if driver is None:
-        driver = ChromeDriverManager.create_driver()
-
-    try:
-        print(f"Navigating to: {url}")
-        driver.get(url)
-
-        wait = WebDriverWait(driver, 15)
-
-        # Wait until the <strong> inside the node-count div is present.
-        # The parent div carries a data-hasqtip attribute whose title mentions
-        # "Total node count"; we locate the <strong> directly inside it.
-        node_count_element = wait.until(
-            EC.presence_of_element_located((
-                By.XPATH,
-                "//div[@oldtitle='Total node count does not include duplicate and non-listening nodes.']//strong"
-            ))
-        )
-
-        node_count = node_count_element.text.strip()
-
-        print(f"Total Bitcoin nodes found: {node_count}")
-        return node_count
-
-    except Exception as e:
-        print(f"Error occurred: {str(e)}")
-        return None
-
-    finally:
-        if driver_created and driver:
-            driver.quit()
+    return SPEC.scrape(url, driver)
 
 
 def main():
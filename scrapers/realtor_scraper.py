@@ -4,16 +4,17 @@ Realtor.com Home Value Scraper
 Scrapes the estimated home value from a Realtor.com property listing page using headless Selenium
 """
 
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from util.chrome_driver_manager import ChromeDriverManager
+from util.extractor import PageSpec, css, response
 from util.link_loader import LinkLoader
-import time
-import platform
+
+SPEC = PageSpec(
+    "Estimated home value",
+    [css('h2[data-testid="estimated-home-value-currency"]')],
+    timeout=15,
+    # Property details query the page renders its estimate from
+    responses=[response(r"/api/v1/hulk", "data.home.estimates.current_values.0.estimate", "${:,.0f}")],
+)
+
 
 def scrape_realtor_home_value(url, driver=None):
     """
@@ -26,38 +27,8 @@ def scrape_realtor_home_value(url, driver=None):
     Returns:
         str: The estimated home value as a string, or None if not found
     """
-    # Track if we created the driver (so we know whether to close it)
-    driver_created = driver is None
-    
-    if driver is None:
-        driver = ChromeDriverManager.create_driver()
-    
-    try:
-        print(f"Navigating to: {url}")
-        driver.get(url)
-        
-        # Wait for the page to load and the home value element to be present
-        wait = WebDriverWait(driver, 15)
-        
-        # Find the h2 tag with data-testid="estimated-home-value-currency"
-        home_value_element = wait.until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, 'h2[data-testid="estimated-home-value-currency"]'))
-        )
-        
-        # Extract the text
-        home_value = home_value_element.text.strip()
-        
-        print(f"Estimated home value found: {home_value}")
-        return home_value
-        
-    except Exception as e:
-        print(f"Error occurred: {str(e)}")
-        return None
-        
-    finally:
-        # Clean up - close the browser only if we created it
-        if driver_created and driver:
-            driver.quit()
+    return SPEC.scrape(url, driver)
+
 
 def main():
     """Main function to run the scraper"""
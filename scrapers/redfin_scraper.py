@@ -4,16 +4,17 @@ Redfin Home Value Scraper
 Scrapes the home value from a Redfin property listing page using headless Selenium
 """
 
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from util.chrome_driver_manager import ChromeDriverManager
+from util.extractor import PageSpec, css, response
 from util.link_loader import LinkLoader
-import time
-import platform
+
+SPEC = PageSpec(
+    "Home value",
+    [css("div.statsValue.price")],
+    timeout=15,
+    # Automated valuation the page renders its estimate from
+    responses=[response(r"/stingray/api/home/details/avm", "payload.predictedValue", "${:,.0f}")],
+)
+
 
 def scrape_redfin_home_value(url, driver=None):
     """
@@ -26,36 +27,8 @@ def scrape_redfin_home_value(url, driver=None):
     Returns:
         str: The home value as a string, or None if not found
     """
-    # Track if we created the driver (so we know whether to close it)
-    driver_created = driver is None
-    
-    if driver is None:
-        driver = ChromeDriverManager.create_driver()
-    
-    try:
-        print(f"Navigating to: {url}")
-        driver.get(url)
-        
-        # Wait for the page to load and the price element to be present
-        wait = WebDriverWait(driver, 15)
-        price_element = wait.until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "div.statsValue.price"))
-        )
-        
-        # Extract the text
-        home_value = price_element.text.strip()
-        
-        print(f"Home value found: {home_value}")
-        return home_value
-        
-    except Exception as e:
-        print(f"Error occurred: {str(e)}")
-        return None
-        
-    finally:
-        # Clean up - close the browser only if we created it
-        if driver_created and driver:
-            driver.quit()
+    return SPEC.scrape(url, driver)
+
 
 def main():
     """Main function to run the scraper"""
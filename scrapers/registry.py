@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Scraper Registry
+Maps links.json keys to scraper entry points that are only imported when needed
+"""
+
+import copy
+import importlib
+
+# Third-party packages can add scrapers by declaring an entry point in this
+# group, named after their links.json key:
+#
+#   [project.entry-points."home_value_scraper.scrapers"]
+#   mysource = "my_package.my_scraper:scrape_my_value"
+ENTRY_POINT_GROUP = "home_value_scraper.scrapers"
+
+
+def get_price_num(price_str: str):
+    return price_str.replace("$", "").replace(",", "")
+
+
+class ScraperSpec:
+    """
+    A scraper known to the orchestrator.
+
+    The scraper function is referenced by a "module:function" string and
+    imported on the first call to load(), so disabled scrapers never pay
+    for their imports. A scraper may offer other implementations
+    ("backends", e.g. a JSON API instead of the page), which links.json
+    chooses between per entry or target.
+    """
+
+    def __init__(self, key, label, target, output_file=None, transform=get_price_num, backends=None):
+        """
+        Initialize the ScraperSpec.
+
+        Args:
+            key (str): Entry name in links.json.
+            label (str): Display name for logging and the summary.
+            target (str): Scraper function as "package.module:function".
+            output_file (str, optional): Result file. Defaults to "<key>.txt".
+            transform (callable, optional): Applied to the value before saving.
+            backends (dict, optional): Alternative implementations as
+                                       {name: "package.module:function"};
+                                       `target` is the "page" backend.
+        """
+        self.key = key
+        self.label = label
+        self.target = target
+        self.output_file = output_file or f"{key}.txt"
+        self.transform = transform
+        self.backends = {"page": target, **(backends or {})}
+        self.backend = "page"
+        self._fn = None
+
+    def with_backend(self, backend):
+        """
+        This scraper using another of its implementations.
+
+        Args:
+            backend (str): Backend name from links.json, e.g. "api".
+
+        Returns:
+            ScraperSpec: A spec whose load() returns that implementation.
+
+        Raises:
+            ValueError: If the scraper has no such backend.
+        """
+        if backend not in self.backends:
+            raise ValueError(f"'{self.key}' has no '{backend}' backend "
+                             f"(available: {', '.join(self.backends)})")
+        if backend == self.backend:
+            return self
+        spec = copy.copy(self)
+        spec.target = self.backends[backend]
+        spec.backend = backend
+        spec._fn = None
+        return spec
+
+    def label_for(self, target):
+        """
+        Display name for one of this scraper's targets.
+
+        Args:
+            target (LinkTarget): Target from LinkLoader.get_targets().
+
+        Returns:
+            str: The scraper label, plus the target name for named targets.
+        """
+        return f"{self.label} [{target.name}]" if target.name else self.label
+
+    def output_for(self, target):
+        """
+        Output file for one of this scraper's targets.
+
+        Args:
+            target (LinkTarget): Target from LinkLoader.get_targets().
+
+        Returns:
+            str: The target's configured "output", "<key>_<name>.txt" for
+                 named targets, or output_file for an entry's single link.
+        """
+        if target.output_file:
+            return target.output_file
+        return f"{self.key}_{target.slug}.txt" if target.name else self.output_file
+
+    def load(self):
+        """
+        Import and return the scraper function.
+
+        Returns:
+            callable: fn(url, driver) -> str|None
+        """
+        if self._fn is None:
+            module_name, _, attr = self.target.partition(":")
+            self._fn = getattr(importlib.import_module(module_name), attr)
+        return self._fn
+
+    def page_spec(self):
+        """
+        Return the scraper module's declarative PageSpec, if it has one.
+
+        Returns:
+            PageSpec: The module's SPEC, or None for scrapers that are
+                      plain functions (e.g. most plugins) and for
+                      backends other than the page.
+        """
+        if self.backend != "page":
+            return None
+        module_name, _, _ = self.target.partition(":")
+        return getattr(importlib.import_module(module_name), "SPEC", None)
+
+
+BUILTIN_SCRAPERS = [
+    ScraperSpec("redfin",    "Redfin",      "scrapers.redfin_scraper:scrape_redfin_home_value"),
+    ScraperSpec("zillow",    "Zillow",      "scrapers.zillow_scraper:scrape_zillow_zestimate"),
+    ScraperSpec("realtor",   "Realtor.com", "scrapers.realtor_scraper:scrape_realtor_home_value"),
+    ScraperSpec("bitnodes",  "Bitnodes",    "scrapers.bitnodes_scraper:scrape_bitcoin_node_count",
+                backends={"api": "scrapers.bitnodes_scraper:scrape_bitcoin_node_count_api"}),
+    ScraperSpec("coindance", "Coin.dance",  "scrapers.coindance_scraper:scrape_bitcoin_node_count"),
+    ScraperSpec("etherscan", "Etherscan",   "scrapers.etherscan_scraper:scrape_ethereum_node_count"),
+]
+
+
+def get_registry(keys=None):
+    """
+    Return every known scraper, built-in ones first.
+
+    Plugins registered under ENTRY_POINT_GROUP are added without being
+    imported; a plugin may not replace a built-in key. Looking them up
+    means importing importlib.metadata and scanning the installed
+    packages, so with `keys` that is only done if one of them isn't a
+    built-in scraper.
+
+    Args:
+        keys (iterable, optional): links.json keys the caller needs.
+                                   Defaults to discovering every plugin.
+
+    Returns:
+        dict: {links.json key: ScraperSpec}, in run order
+    """
+    registry = {spec.key: spec for spec in BUILTIN_SCRAPERS}
+    if keys is not None and all(key in registry for key in keys):
+        return registry
+
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:  # Python < 3.8: no plugin discovery
+        return registry
+
+    try:
+        plugins = entry_points(group=ENTRY_POINT_GROUP)
+    except TypeError:  # Python < 3.10 returns a dict of groups
+        plugins = entry_points().get(ENTRY_POINT_GROUP, [])
+
+    for ep in plugins:
+        if ep.name in registry:
+            print(f"⚠ Ignoring plugin scraper '{ep.name}': key already registered")
+            continue
+        registry[ep.name] = ScraperSpec(ep.name, ep.name.replace("_", " ").title(), ep.value)
+
+    return registry
@@ -4,16 +4,17 @@ Zillow Home Value Scraper
 Scrapes the Zestimate value from a Zillow property listing page using headless Selenium
 """
 
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from util.chrome_driver_manager import ChromeDriverManager
+from util.extractor import PageSpec, css, response
 from util.link_loader import LinkLoader
-import time
-import platform
+
+SPEC = PageSpec(
+    "Zestimate value",
+    [css('[data-testid="primary-zestimate"]')],
+    timeout=7,
+    # Property data query the page renders the Zestimate from
+    responses=[response(r"/graphql/", "data.property.zestimate", "${:,.0f}")],
+)
+
 
 def scrape_zillow_zestimate(url, driver=None):
     """
@@ -26,38 +27,8 @@ def scrape_zillow_zestimate(url, driver=None):
     Returns:
         str: The Zestimate value as a string, or None if not found
     """
-    # Track if we created the driver (so we know whether to close it)
-    driver_created = driver is None
-    
-    if driver is None:
-        driver = ChromeDriverManager.create_driver()
-    
-    try:
-        print(f"Navigating to: {url}")
-        driver.get(url)
-        
-        # Wait for the page to load and the Zestimate element to be present
-        wait = WebDriverWait(driver, 7)
-        
-        # Find the p tag with data-testid="primary-zestimate"
-        zestimate_element = wait.until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, '[data-testid="primary-zestimate"]'))
-        )
-        
-        # Extract the text
-        home_value = zestimate_element.text.strip()
-        
-        print(f"Zestimate value found: {home_value}")
-        return home_value
-        
-    except Exception as e:
-        print(f"Error occurred: {str(e)}")
-        return None
-        
-    finally:
-        # Clean up - close the browser only if we created it
-        if driver_created and driver:
-            driver.quit()
+    return SPEC.scrape(url, driver)
+
 
 def main():
     """Main function to run the scraper"""
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+JSON API Backend Tests
+Runs every scraper's "api" backend against the benchmark fixture server
+"""
+
+import io
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from benchmarks.fixture_server import API_PATHS, EXPECTED_VALUES, FixtureServer
+from scrapers.registry import BUILTIN_SCRAPERS
+from util.chrome_driver_manager import ChromeDriverManager
+from util.http_cache import HttpCache
+from util.json_api import JsonApi
+
+
+class JsonApiBackendTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = FixtureServer().start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        # Keep the response cache and the Chrome probe out of the user's directories
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        saved = HttpCache.directory, HttpCache.enabled, ChromeDriverManager.PROBE_CACHE
+        self.addCleanup(self._restore, saved)
+        HttpCache.directory = Path(tmp.name) / "http_cache"
+        HttpCache.enabled = True
+        ChromeDriverManager.PROBE_CACHE = Path(tmp.name) / "chrome_probe.json"
+
+    @staticmethod
+    def _restore(saved):
+        HttpCache.directory, HttpCache.enabled, ChromeDriverManager.PROBE_CACHE = saved
+
+    def api_specs(self):
+        return [spec.with_backend("api") for spec in BUILTIN_SCRAPERS if "api" in spec.backends]
+
+    def test_every_api_backend_reads_the_fixture_value(self):
+        specs = self.api_specs()
+        self.assertTrue(specs)
+        for spec in specs:
+            with self.subTest(source=spec.key):
+                self.assertEqual(spec.load()(self.server.url_for(spec.key)), EXPECTED_VALUES[spec.key])
+
+    def test_every_api_backend_has_a_fixture_route(self):
+        for spec in self.api_specs():
+            with self.subTest(source=spec.key):
+                self.assertIn(spec.key, API_PATHS)
+
+    def test_revalidated_response_keeps_the_value(self):
+        url = self.server.url_for("bitnodes")
+        scrape = next(spec for spec in self.api_specs() if spec.key == "bitnodes").load()
+        first = scrape(url)
+        log = io.StringIO()
+        with redirect_stdout(log):
+            second = scrape(url)
+        self.assertIn("HTTP 304", log.getvalue())
+        self.assertEqual(second, first)
+
+    def test_missing_field_returns_none(self):
+        api = JsonApi("Total Bitcoin nodes", API_PATHS["bitnodes"], "results.0.no_such_field")
+        self.assertIsNone(api.scrape(self.server.url_for("bitnodes")))
+
+    def test_unreachable_host_returns_none(self):
+        api = JsonApi("Total Bitcoin nodes", "/api/v1/snapshots/", "results.0.total_nodes")
+        self.assertIsNone(api.scrape("http://127.0.0.1:9/"))
+
+    def test_etherscan_has_no_api_backend(self):
+        etherscan = next(spec for spec in BUILTIN_SCRAPERS if spec.key == "etherscan")
+        with self.assertRaises(ValueError):
+            etherscan.with_backend("api")
+
+
+if __name__ == "__main__":
+    unittest.main()
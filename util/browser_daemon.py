@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Browser Daemon
+Keeps one warm headless Chromium (plus a chromedriver server) running between
+scraper runs so drivers can attach to it instead of cold-starting a browser.
+
+Usage:
+    python -m util.browser_daemon start    # start in the background
+    python -m util.browser_daemon status
+    python -m util.browser_daemon stop
+"""
+
+import json
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+from util import process_tree, user_dirs
+from util.file_lock import file_lock
+
+
+class BrowserDaemon:
+    """
+    Supervisor for a long-lived Chromium with remote debugging enabled.
+
+    The daemon process launches Chromium and a standalone chromedriver,
+    respawns either one if it dies, and shuts everything down after
+    IDLE_TIMEOUT seconds without a client calling ensure_running().
+    """
+
+    DEBUG_PORT = int(os.environ.get("SCRAPER_DAEMON_DEBUG_PORT", 9222))
+    DRIVER_PORT = int(os.environ.get("SCRAPER_DAEMON_DRIVER_PORT", 9515))
+    IDLE_TIMEOUT = int(os.environ.get("SCRAPER_DAEMON_IDLE_TIMEOUT", 15 * 60))
+    STARTUP_TIMEOUT = 15
+    # Per-user: stop() kills the pids recorded here
+    STATE_DIR = user_dirs.runtime_dir() / "browser_daemon"
+
+    BROWSER_CANDIDATES = ["chromium", "chromium-browser", "google-chrome", "google-chrome-stable"]
+    DRIVER_CANDIDATES = ["chromedriver"]
+
+    @classmethod
+    def _state_file(cls):
+        return cls.STATE_DIR / "state.json"
+
+    @classmethod
+    def _heartbeat_file(cls):
+        return cls.STATE_DIR / "heartbeat"
+
+    @classmethod
+    def _lock_file(cls):
+        return cls.STATE_DIR / "start.lock"
+
+    @classmethod
+    def _read_state(cls):
+        if not user_dirs.trusted(cls._state_file()):
+            return None
+        try:
+            return json.loads(cls._state_file().read_text())
+        except (OSError, ValueError):
+            return None
+
+    @classmethod
+    def _write_state(cls, browser, driver_server):
+        # Start times let stop() clean up after a daemon that was killed
+        # outright without risking a reused PID
+        pids = {"pid": os.getpid(), "browser_pid": browser.pid, "driver_pid": driver_server.pid}
+        state = dict(pids)
+        state["start_times"] = {key: process_tree.start_time(pid) for key, pid in pids.items()}
+        cls._state_file().write_text(json.dumps(state))
+        cls._state_file().chmod(0o600)
+
+    @staticmethod
+    def _get(url, timeout=0.5):
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            return json.loads(response.read().decode("utf-8"))
+
+    @classmethod
+    def is_healthy(cls) -> bool:
+        """Return True if both the browser and the chromedriver server respond"""
+        try:
+            cls._get(f"http://127.0.0.1:{cls.DEBUG_PORT}/json/version")
+            return bool(cls._get(f"http://127.0.0.1:{cls.DRIVER_PORT}/status")["value"]["ready"])
+        except Exception:
+            return False
+
+    @classmethod
+    def touch(cls):
+        """Record client activity so the daemon's idle timer restarts"""
+        user_dirs.ensure_private(cls.STATE_DIR)
+        cls._heartbeat_file().touch()
+
+    @classmethod
+    def ensure_running(cls):
+        """
+        Make sure a healthy daemon is running, starting or replacing it if needed
+
+        Returns:
+            tuple: (debugger_address, driver_server_url)
+
+        Raises:
+            FileNotFoundError: If Chromium or chromedriver is not installed.
+            RuntimeError: If the daemon could not be started.
+        """
+        cls.touch()
+        if not cls.is_healthy():
+            # Pool threads and other runs all land here at once when the
+            # daemon is down; only one of them may replace it, since every
+            # daemon binds the same ports and profile directory
+            with file_lock(cls._lock_file()):
+                if not cls.is_healthy():
+                    cls._start()
+        return f"127.0.0.1:{cls.DEBUG_PORT}", f"http://127.0.0.1:{cls.DRIVER_PORT}"
+
+    @classmethod
+    def _start(cls):
+        """Replace whatever is left of an old daemon with a new one; call with the start lock held"""
+        cls._find(cls.BROWSER_CANDIDATES)
+        cls._find(cls.DRIVER_CANDIDATES)
+        cls.stop()
+        print("Starting warm browser daemon...")
+        subprocess.Popen(
+            [sys.executable, "-m", "util.browser_daemon", "serve"],
+            cwd=Path(__file__).resolve().parent.parent,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        deadline = time.monotonic() + cls.STARTUP_TIMEOUT
+        while not cls.is_healthy():
+            if time.monotonic() > deadline:
+                raise RuntimeError("Warm browser daemon did not become healthy")
+            time.sleep(0.2)
+
+    @classmethod
+    def stop(cls):
+        """Stop a running daemon (and its browser) if there is one"""
+        state = cls._read_state()
+        if not state:
+            return
+        # The pid may have been reused since the state was written; only
+        # signal the process that actually is the supervisor
+        start_times = state.get("start_times", {})
+        if start_times.get("pid") is not None and process_tree.is_same_process(state.get("pid"), start_times["pid"]):
+            try:
+                os.kill(state["pid"], signal.SIGTERM)
+            except OSError:
+                pass
+
+        # If the supervisor died hard, its browser and chromedriver are still
+        # holding the ports; kill them directly
+        leftovers = [
+            state[key] for key in ("browser_pid", "driver_pid")
+            if start_times.get(key) is not None and process_tree.is_same_process(state[key], start_times[key])
+        ]
+        if leftovers:
+            process_tree.kill_tree(leftovers)
+
+        try:
+            cls._state_file().unlink()
+        except OSError:
+            pass
+
+    @classmethod
+    def _find(cls, candidates):
+        for name in candidates:
+            path = shutil.which(name)
+            if path:
+                return path
+        raise FileNotFoundError(f"None of {', '.join(candidates)} found on PATH")
+
+    @classmethod
+    def _launch_browser(cls, user_agent):
+        profile = cls.STATE_DIR / "profile"
+        return subprocess.Popen([
+            cls._find(cls.BROWSER_CANDIDATES),
+            "--headless=new",
+            "--no-sandbox",
+            "--disable-dev-shm-usage",
+            "--disable-gpu",
+            "--window-size=1920,1080",
+            f"--user-agent={user_agent}",
+            f"--user-data-dir={profile}",
+            f"--remote-debugging-port={cls.DEBUG_PORT}",
+            "about:blank",
+        ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    @classmethod
+    def _launch_driver_server(cls):
+        return subprocess.Popen([
+            cls._find(cls.DRIVER_CANDIDATES),
+            f"--port={cls.DRIVER_PORT}",
+        ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    @classmethod
+    def serve(cls):
+        """Run the daemon in the foreground until it goes idle or is stopped"""
+        from util.chrome_driver_manager import ChromeDriverManager
+
+        cls.touch()
+        user_agent = ChromeDriverManager.get_user_agent()
+        browser = cls._launch_browser(user_agent)
+        driver_server = cls._launch_driver_server()
+        cls._write_state(browser, driver_server)
+
+        def shutdown(signum=None, frame=None):
+            for process in (driver_server, browser):
+                process.terminate()
+            for process in (driver_server, browser):
+                try:
+                    process.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+            # Leave no pids behind for stop() to act on later, unless a newer
+            # daemon has already taken over the state
+            state = cls._read_state()
+            if state and state.get("pid") == os.getpid():
+                for path in (cls._state_file(), cls._heartbeat_file()):
+                    try:
+                        path.unlink()
+                    except OSError:
+                        pass
+            sys.exit(0)
+
+        signal.signal(signal.SIGTERM, shutdown)
+        signal.signal(signal.SIGINT, shutdown)
+
+        while True:
+            time.sleep(5)
+            try:
+                idle = time.time() - cls._heartbeat_file().stat().st_mtime
+            except OSError:
+                # Temp cleanup removed the heartbeat; start the idle timer over
+                # rather than pulling the browser from under a client
+                try:
+                    cls.touch()
+                except OSError:
+                    pass
+                idle = 0
+            if idle > cls.IDLE_TIMEOUT:
+                shutdown()
+            # Respawn whichever half has died, and record the new pids for stop()
+            respawned = False
+            if browser.poll() is not None:
+                browser = cls._launch_browser(user_agent)
+                respawned = True
+            if driver_server.poll() is not None:
+                driver_server = cls._launch_driver_server()
+                respawned = True
+            if respawned:
+                try:
+                    user_dirs.ensure_private(cls.STATE_DIR)
+                    cls._write_state(browser, driver_server)
+                except OSError:
+                    pass
+
+
+def main():
+    """Command line entry point: start, stop, status or serve"""
+    command = sys.argv[1] if len(sys.argv) > 1 else "status"
+
+    if command == "serve":
+        BrowserDaemon.serve()
+    elif command == "start":
+        debugger_address, driver_url = BrowserDaemon.ensure_running()
+        print(f"✓ Warm browser daemon running (browser {debugger_address}, chromedriver {driver_url})")
+    elif command == "stop":
+        with file_lock(BrowserDaemon._lock_file()):
+            BrowserDaemon.stop()
+        print("✓ Warm browser daemon stopped")
+    elif command == "status":
+        state = BrowserDaemon._read_state()
+        if state and BrowserDaemon.is_healthy():
+            print(f"✓ Warm browser daemon healthy (pid {state['pid']}, browser pid {state['browser_pid']})")
+        else:
+            print("✗ Warm browser daemon not running")
+    else:
+        print(f"Unknown command: {command}. Use start, stop, status or serve.")
+        sys.exit(2)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,15 +7,63 @@ Provides a reusable ChromeDriver instance for web scraping
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import WebDriverException
+from util import process_tree, user_dirs
+from util.browser_daemon import BrowserDaemon
+from util.driver_leases import DriverLeases
+from util.lean_profile import LeanProfile
+from util.telemetry import Telemetry
+import atexit
+import base64
+import json
+import os
 import platform
+import shutil
 import subprocess
 
 
-
-
 class ChromeDriverManager:
     """Manages Chrome WebDriver instances for web scraping"""
 
+    # Lease file recording every browser process tree this manager launches
+    leases = DriverLeases()
+    _atexit_registered = False
+
+    # Attach to the warm browser daemon instead of launching a new browser.
+    # Opt in with run_scrapers.py --warm or SCRAPER_WARM_BROWSER=1.
+    use_daemon = os.environ.get("SCRAPER_WARM_BROWSER", "") not in ("", "0")
+
+    # Record Chrome's network events so bytes transferred can be reported
+    log_network = False
+
+    # Record network events and page metrics for a per-scrape trace (--trace)
+    trace = False
+
+    # Read values from the JSON responses pages fetch, where a PageSpec
+    # declares them (--intercept). Needs the "none" page load strategy.
+    capture_responses = False
+    # Events read mid-scrape by poll_network_log(), kept for the next drain
+    _log_backlog = {}
+
+    # WebDriver page load strategy for new sessions; None keeps Selenium's
+    # default ("normal"). Tab multiplexing needs "none" so navigations in
+    # one tab don't block commands sent to the others.
+    page_load_strategy = None
+
+    # Memory governor: recycle a browser once its process tree's RSS or the
+    # number of pages it has loaded crosses these limits (0 means no limit).
+    # Set with run_scrapers.py --max-browser-mb/--max-page-loads or the env vars.
+    max_rss_mb = float(os.environ.get("SCRAPER_MAX_BROWSER_MB", "0"))
+    max_page_loads = int(os.environ.get("SCRAPER_MAX_PAGE_LOADS", "0"))
+    _page_loads = {}
+
+    # Browser version, user agent, OS flavour and driver path, cached on disk
+    # and keyed on the chromium/chromedriver binaries so upgrades invalidate it.
+    # The driver path gets executed, so the cache lives in a per-user directory
+    # and is ignored unless only this user can write to it.
+    PROBE_CACHE = user_dirs.cache_dir() / "chrome_probe.json"
+    _probe = None
+
     @staticmethod
     def _get_chromium_version() -> str:
         try:
@@ -36,6 +84,135 @@ class ChromeDriverManager:
         except OSError:
             return False
 
+    @staticmethod
+    def _user_agent_for(system, version) -> str:
+        if system == "Windows":
+            return "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+        elif system == "Linux":
+            return f"Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/{version} Safari/537.36"
+        elif system == "Darwin":  # macOS
+            return "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+        else:
+            return f"Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/{version} Safari/537.36"
+
+    @staticmethod
+    def _resolve_driver_paths(system, is_kubuntu):
+        """Return (driver_path, browser_path), either of which may be None"""
+        # Supply explicit service only on Kubuntu (not CachyOS or other distros)
+        if system == "Linux" and is_kubuntu:
+            return "/usr/bin/chromedriver", None
+        try:
+            # The same lookup Selenium does on every launch when no service is given
+            from selenium.webdriver.common.selenium_manager import SeleniumManager
+            paths = SeleniumManager().binary_paths(["--browser", "chrome"])
+            return paths.get("driver_path") or None, paths.get("browser_path") or None
+        except Exception:
+            return shutil.which("chromedriver"), None
+
+    @staticmethod
+    def _probe_key():
+        """Identify the installed binaries by path and modification time"""
+        key = {"system": platform.system()}
+        for name in ("chromium", "chromedriver", "/etc/os-release"):
+            path = name if os.path.isabs(name) else shutil.which(name)
+            try:
+                key[name] = [path, os.stat(path).st_mtime_ns]
+            except (OSError, TypeError):
+                key[name] = [path, None]
+        return key
+
+    @staticmethod
+    def _binary_stamps(probe):
+        """Size and modification time of the resolved driver and browser binaries"""
+        stamps = {}
+        for path in (probe["driver_path"], probe["browser_path"]):
+            if path is None:
+                continue
+            try:
+                info = os.stat(path)
+                stamps[path] = [info.st_size, info.st_mtime_ns]
+            except OSError:
+                stamps[path] = None
+        return stamps
+
+    @staticmethod
+    def probe_environment(use_cache=True) -> dict:
+        """
+        Return the browser version, user agent, OS flavour and driver paths
+
+        Probing runs `chromium --version`, reads /etc/os-release and asks
+        Selenium Manager for a driver. The result is cached in memory and
+        on disk until the chromium or chromedriver binary on PATH, or the
+        driver or browser binary it resolved (e.g. one Selenium Manager
+        downloaded), changes.
+
+        Args:
+            use_cache (bool): Set to False to force a fresh probe.
+
+        Returns:
+            dict: Keys version, user_agent, system, is_kubuntu, driver_path, browser_path
+        """
+        if use_cache and ChromeDriverManager._probe is not None:
+            return ChromeDriverManager._probe
+
+        key = ChromeDriverManager._probe_key()
+        if use_cache and user_dirs.trusted(ChromeDriverManager.PROBE_CACHE):
+            try:
+                cached = json.loads(ChromeDriverManager.PROBE_CACHE.read_text())
+                stamps = ChromeDriverManager._binary_stamps(cached["probe"])
+                if (cached["key"] == key and cached["binaries"] == stamps
+                        and all(stamp is not None for stamp in stamps.values())):
+                    ChromeDriverManager._probe = cached["probe"]
+                    return ChromeDriverManager._probe
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
+
+        system = key["system"]
+        version = ChromeDriverManager._get_chromium_version()
+        is_kubuntu = ChromeDriverManager._is_kubuntu()
+        driver_path, browser_path = ChromeDriverManager._resolve_driver_paths(system, is_kubuntu)
+        probe = {
+            "version": version,
+            "user_agent": ChromeDriverManager._user_agent_for(system, version),
+            "system": system,
+            "is_kubuntu": is_kubuntu,
+            "driver_path": driver_path,
+            "browser_path": browser_path,
+        }
+
+        try:
+            user_dirs.ensure_private(ChromeDriverManager.PROBE_CACHE.parent)
+            ChromeDriverManager.PROBE_CACHE.write_text(json.dumps({
+                "key": key,
+                "binaries": ChromeDriverManager._binary_stamps(probe),
+                "probe": probe,
+            }, indent=2))
+            ChromeDriverManager.PROBE_CACHE.chmod(0o600)
+        except OSError:
+            pass
+        ChromeDriverManager._probe = probe
+        return probe
+
+    @staticmethod
+    def get_user_agent() -> str:
+        """
+        Return a desktop Chrome user agent matching the current OS
+
+        Returns:
+            str: User agent string
+        """
+        return ChromeDriverManager.probe_environment()["user_agent"]
+
+    @staticmethod
+    def create_lazy_driver():
+        """
+        Return a driver that only launches Chrome when it is first used
+
+        Returns:
+            LazyDriver: Proxy that starts a Chrome WebDriver on first access
+        """
+        return LazyDriver(ChromeDriverManager.create_driver)
+
     @staticmethod
     def create_driver():
         """
@@ -44,6 +221,12 @@ class ChromeDriverManager:
         Returns:
             webdriver.Chrome: Configured Chrome WebDriver instance
         """
+        with Telemetry.span("driver_create", daemon=ChromeDriverManager.use_daemon):
+            return ChromeDriverManager._launch_driver()
+
+    @staticmethod
+    def _start_chrome(probe):
+        """Launch a local headless Chrome session for a probe_environment() result"""
         # Set up Chrome options for headless mode
         chrome_options = Options()
         chrome_options.add_argument("--headless=new")
@@ -51,33 +234,482 @@ class ChromeDriverManager:
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--disable-gpu")
         chrome_options.add_argument("--window-size=1920,1080")
+        chrome_options.add_argument(f"user-agent={probe['user_agent']}")
 
-        version = ChromeDriverManager._get_chromium_version()
+        if LeanProfile.enabled:
+            chrome_options.add_experimental_option("prefs", LeanProfile.chrome_prefs())
+        ChromeDriverManager._set_capabilities(chrome_options)
 
-        # Detect OS and set appropriate user agent
-        system = platform.system()
-        if system == "Windows":
-            user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        elif system == "Linux":
-            user_agent = f"Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/{version} Safari/537.36"
-        elif system == "Darwin":  # macOS
-            user_agent = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        else:
-            user_agent = f"Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/{version} Safari/537.36"
+        # Initialize the Chrome driver with the cached driver path so Selenium
+        # Manager doesn't have to resolve it again on every launch
+        if probe["browser_path"]:
+            chrome_options.binary_location = probe["browser_path"]
+        if probe["driver_path"]:
+            service = Service(executable_path=probe["driver_path"])
+            if probe["is_kubuntu"]:
+                service.log_path = "/tmp/chromedriver_shared.log"
+                print(f"Kubuntu detected — starting Chrome with chromedriver at: {probe['driver_path']}")
+            return webdriver.Chrome(options=chrome_options, service=service)
+        return webdriver.Chrome(options=chrome_options)
 
+    @staticmethod
+    def _launch_driver():
+        if ChromeDriverManager.use_daemon:
+            try:
+                return ChromeDriverManager._attach_to_daemon()
+            except Exception as e:
+                print(f"⚠ Warm browser daemon unavailable, launching a new browser: {str(e)}")
 
-        chrome_options.add_argument(f"user-agent={user_agent}")
+        # A cached probe can point at binaries an auto-update has replaced in
+        # place; if the session can't be created, probe once more and retry
+        for fresh in (False, True):
+            probe = ChromeDriverManager.probe_environment(use_cache=not fresh)
+            try:
+                driver = ChromeDriverManager._start_chrome(probe)
+                break
+            except WebDriverException as e:
+                if fresh:
+                    raise
+                print(f"⚠ Chrome failed to start with the cached driver paths, probing again: {str(e).strip()}")
 
-        # Initialize the Chrome driver
-        # Supply explicit service only on Kubuntu (not CachyOS or other distros)
-        if system == "Linux" and ChromeDriverManager._is_kubuntu():
-            CHROME_DRIVER_PATH = "/usr/bin/chromedriver"
-            service = Service(executable_path=CHROME_DRIVER_PATH)
-            service.log_path = "/tmp/chromedriver_shared.log"
-            print(f"Kubuntu detected — starting Chrome with chromedriver at: {CHROME_DRIVER_PATH}")
-            driver = webdriver.Chrome(options=chrome_options, service=service)
-        else:
-            driver = webdriver.Chrome(options=chrome_options)
+        ChromeDriverManager._register_lease(driver)
 
         print("Chrome driver started successfully")
         return driver
+
+    @staticmethod
+    def _performance_log() -> bool:
+        """Whether Chrome's performance log (CDP network events) is needed"""
+        return (ChromeDriverManager.log_network or ChromeDriverManager.trace
+                or ChromeDriverManager.capture_responses)
+
+    @staticmethod
+    def _set_capabilities(chrome_options):
+        if ChromeDriverManager._performance_log():
+            chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        if ChromeDriverManager.page_load_strategy:
+            chrome_options.page_load_strategy = ChromeDriverManager.page_load_strategy
+
+    @staticmethod
+    def _attach_to_daemon():
+        """
+        Open a session on the warm browser daemon in a tab of its own
+
+        Returns:
+            webdriver.Remote: Driver attached to the daemon's Chromium
+        """
+        # Imported here so runs without the daemon don't pay for it at startup
+        from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+
+        debugger_address, driver_url = BrowserDaemon.ensure_running()
+
+        chrome_options = Options()
+        chrome_options.debugger_address = debugger_address
+        ChromeDriverManager._set_capabilities(chrome_options)
+        connection = ChromiumRemoteConnection(
+            remote_server_addr=driver_url, vendor_prefix="goog", browser_name="chrome"
+        )
+        driver = webdriver.Remote(command_executor=connection, options=chrome_options)
+
+        # Sessions share one browser, so each works in its own tab
+        driver.switch_to.new_window("tab")
+        driver.warm_tab = driver.current_window_handle
+
+        print(f"Attached to warm browser daemon at {debugger_address}")
+        return driver
+
+    @staticmethod
+    def _register_lease(driver):
+        """Record the chromedriver process and the browser processes it launched"""
+        try:
+            root = driver.service.process.pid
+        except AttributeError:
+            return
+
+        driver.lease_id = ChromeDriverManager.leases.add([root] + process_tree.descendants(root))
+        if driver.lease_id and not ChromeDriverManager._atexit_registered:
+            # Covers normal exit, Ctrl-C and standalone scrapers that only call driver.quit()
+            atexit.register(ChromeDriverManager.leases.release_owned)
+            ChromeDriverManager._atexit_registered = True
+
+    @staticmethod
+    def quit_driver(driver):
+        """
+        Quit a driver and kill anything left of its browser process tree
+
+        Args:
+            driver: Chrome WebDriver or LazyDriver instance
+        """
+        ChromeDriverManager._page_loads.pop(id(driver), None)
+        ChromeDriverManager._log_backlog.pop(id(driver), None)
+        if isinstance(driver, LazyDriver):
+            driver.quit()
+            return
+
+        try:
+            if getattr(driver, "warm_tab", None):
+                # Close only our tab; the daemon's browser stays warm
+                BrowserDaemon.touch()
+                driver.switch_to.window(driver.warm_tab)
+                driver.close()
+            driver.quit()
+        except Exception as e:
+            print(f"⚠ driver.quit() failed, killing browser processes: {str(e)}")
+
+        lease_id = getattr(driver, "lease_id", None)
+        if lease_id:
+            ChromeDriverManager.leases.release(lease_id)
+
+    @staticmethod
+    def is_healthy(driver) -> bool:
+        """
+        Check whether a driver's session still responds
+
+        Sends cheap commands that don't touch the page (listing window
+        handles and reading the current one), so a page that failed to load
+        doesn't count as a dead session, but a session left on a closed
+        window does. A LazyDriver that was never started is healthy.
+
+        Args:
+            driver: Chrome WebDriver or LazyDriver instance
+
+        Returns:
+            bool: True if the session answered
+        """
+        if isinstance(driver, LazyDriver) and not driver.started:
+            return True
+        try:
+            return bool(driver.window_handles) and bool(driver.current_window_handle)
+        except Exception:
+            return False
+
+    @staticmethod
+    def browser_rss_kb(driver):
+        """
+        Return the combined RSS of a driver's chromedriver and browser processes
+
+        Args:
+            driver: Chrome WebDriver or LazyDriver instance
+
+        Returns:
+            int: RSS in KiB, or None if the browser isn't running, isn't ours
+                 (warm daemon) or /proc isn't available
+        """
+        if isinstance(driver, LazyDriver):
+            driver = driver.real_driver
+        try:
+            pid = driver.service.process.pid
+        except AttributeError:
+            return None
+        if not process_tree.supported():
+            return None
+        return process_tree.tree_rss_kb([pid])
+
+    @staticmethod
+    def count_page_loads(driver, count=1):
+        """
+        Record that a driver loaded more pages
+
+        Args:
+            driver: Chrome WebDriver or LazyDriver instance
+            count (int): Number of pages loaded
+
+        Returns:
+            int: Pages loaded by this driver so far
+        """
+        key = id(driver)
+        ChromeDriverManager._page_loads[key] = ChromeDriverManager._page_loads.get(key, 0) + count
+        return ChromeDriverManager._page_loads[key]
+
+    @staticmethod
+    def recycle_reason(driver):
+        """
+        Check a driver against the memory governor's limits
+
+        Args:
+            driver: Chrome WebDriver or LazyDriver instance
+
+        Returns:
+            str: Why the driver should be recycled, or None if it is within limits
+        """
+        if isinstance(driver, LazyDriver) and not driver.started:
+            return None
+
+        pages = ChromeDriverManager._page_loads.get(id(driver), 0)
+        if ChromeDriverManager.max_page_loads and pages >= ChromeDriverManager.max_page_loads:
+            return f"{pages} page loads"
+
+        if ChromeDriverManager.max_rss_mb:
+            rss_kb = ChromeDriverManager.browser_rss_kb(driver)
+            if rss_kb is not None and rss_kb / 1024 >= ChromeDriverManager.max_rss_mb:
+                return f"{rss_kb / 1024:.0f} MB RSS"
+        return None
+
+    @staticmethod
+    def recycle_if_needed(driver):
+        """
+        Replace a driver that crossed the memory governor's limits
+
+        Only call this between scrapes; the old browser is quit right away.
+
+        Args:
+            driver: Chrome WebDriver or LazyDriver instance
+
+        Returns:
+            The same driver if it is within limits, otherwise a new LazyDriver
+        """
+        reason = ChromeDriverManager.recycle_reason(driver)
+        if reason is None:
+            return driver
+        print(f"Recycling browser after {reason}...")
+        ChromeDriverManager.quit_driver(driver)
+        return ChromeDriverManager.create_lazy_driver()
+
+    @staticmethod
+    def cdp(driver, cmd, params=None):
+        """
+        Run a Chrome DevTools Protocol command on the driver's current tab
+
+        Works for both locally launched drivers and sessions attached to
+        the warm browser daemon.
+
+        Args:
+            driver: Chrome WebDriver instance
+            cmd (str): CDP method, e.g. "Network.enable"
+            params (dict, optional): Method parameters
+
+        Returns:
+            dict: The command result
+        """
+        if hasattr(driver, "execute_cdp_cmd"):
+            return driver.execute_cdp_cmd(cmd, params or {})
+        return driver.execute("executeCdpCommand", {"cmd": cmd, "params": params or {}})["value"]
+
+    @staticmethod
+    def configure(driver, key, setup):
+        """
+        Apply a setup function to a driver now, or when a LazyDriver starts
+
+        Args:
+            driver: Chrome WebDriver or LazyDriver instance
+            key (str): Name of the setup step; a later call with the same
+                       key replaces a pending one
+            setup (callable): Called with the real WebDriver
+        """
+        if isinstance(driver, LazyDriver):
+            driver.configure(key, setup)
+        else:
+            setup(driver)
+
+    @staticmethod
+    def apply_lean_profile(driver, url):
+        """
+        Block the lean profile's URL patterns for the page about to be loaded
+
+        Args:
+            driver: Chrome WebDriver or LazyDriver instance
+            url (str): The page the scraper will navigate to
+        """
+        patterns = LeanProfile.blocked_patterns(url)
+
+        def setup(real_driver):
+            ChromeDriverManager.cdp(real_driver, "Network.enable")
+            ChromeDriverManager.cdp(real_driver, "Network.setBlockedURLs", {"urls": patterns})
+
+        ChromeDriverManager.configure(driver, "lean_profile", setup)
+
+    @staticmethod
+    def drain_network_log(driver):
+        """
+        Read and clear the network events Chrome has logged so far
+
+        Args:
+            driver: Chrome WebDriver or LazyDriver instance
+
+        Returns:
+            list: CDP event messages (dicts with "method" and "params")
+        """
+        backlog = ChromeDriverManager._log_backlog.pop(id(driver), [])
+        return backlog + ChromeDriverManager._read_network_log(driver)
+
+    @staticmethod
+    def poll_network_log(driver):
+        """
+        Read the network events logged since the last poll, without clearing them
+
+        The events are still returned by the next drain_network_log(), so
+        reading the log while a page loads doesn't hide that page's traffic
+        from --bytes and --trace.
+
+        Args:
+            driver: Chrome WebDriver or LazyDriver instance
+
+        Returns:
+            list: CDP event messages logged since the last poll or drain
+        """
+        events = ChromeDriverManager._read_network_log(driver)
+        ChromeDriverManager._log_backlog.setdefault(id(driver), []).extend(events)
+        return events
+
+    @staticmethod
+    def _read_network_log(driver):
+        if not ChromeDriverManager._performance_log():
+            return []
+        if isinstance(driver, LazyDriver) and not driver.started:
+            return []
+        try:
+            entries = driver.get_log("performance")
+        except Exception:
+            return []
+        return [json.loads(entry["message"])["message"] for entry in entries]
+
+    @staticmethod
+    def response_body(driver, request_id):
+        """
+        Fetch the body of a response the page received
+
+        Args:
+            driver: Chrome WebDriver or LazyDriver instance
+            request_id (str): CDP requestId from a Network.* event
+
+        Returns:
+            str: The body, or None if Chrome no longer has it
+        """
+        try:
+            result = ChromeDriverManager.cdp(driver, "Network.getResponseBody", {"requestId": request_id})
+        except Exception:
+            return None
+        body = result.get("body", "")
+        if result.get("base64Encoded"):
+            body = base64.b64decode(body).decode("utf-8", errors="replace")
+        return body
+
+    @staticmethod
+    def bytes_transferred(driver, events=None):
+        """
+        Total network bytes received since the network log was last drained
+
+        Args:
+            driver: Chrome WebDriver or LazyDriver instance
+            events (list, optional): Events already drained from the log;
+                                     drained from the driver if not given
+
+        Returns:
+            tuple: (bytes: int, requests: int)
+        """
+        total = 0
+        requests = 0
+        if events is None:
+            events = ChromeDriverManager.drain_network_log(driver)
+        for event in events:
+            if event.get("method") == "Network.loadingFinished":
+                total += int(event["params"].get("encodedDataLength", 0))
+                requests += 1
+        return total, requests
+
+    @staticmethod
+    def start_trace(driver):
+        """
+        Enable the CDP Network and Performance domains for the next page load
+
+        Args:
+            driver: Chrome WebDriver or LazyDriver instance
+        """
+        def setup(real_driver):
+            ChromeDriverManager.cdp(real_driver, "Network.enable")
+            ChromeDriverManager.cdp(real_driver, "Performance.enable", {"timeDomain": "timeTicks"})
+
+        ChromeDriverManager.configure(driver, "trace", setup)
+
+    @staticmethod
+    def performance_metrics(driver):
+        """
+        Read Chrome's page metrics (DOM nodes, JS heap, script and layout time, ...)
+
+        Args:
+            driver: Chrome WebDriver or LazyDriver instance
+
+        Returns:
+            dict: Metric name -> value, empty if unavailable
+        """
+        if isinstance(driver, LazyDriver) and not driver.started:
+            return {}
+        try:
+            result = ChromeDriverManager.cdp(driver, "Performance.getMetrics")
+        except Exception:
+            return {}
+        return {metric["name"]: metric["value"] for metric in result.get("metrics", [])}
+
+    @staticmethod
+    def reap_orphans():
+        """
+        Kill Chrome/chromedriver processes left behind by earlier runs
+
+        Returns:
+            int: Number of processes killed
+        """
+        killed = ChromeDriverManager.leases.reap_orphans()
+        if killed:
+            print(f"Reaped {killed} orphaned browser process{'es' if killed != 1 else ''} from a previous run")
+        return killed
+
+    @staticmethod
+    def print_status():
+        """Print every live driver lease with its memory use"""
+        if not process_tree.supported():
+            print("Driver lease tracking is only available on Linux")
+            return
+
+        rows = ChromeDriverManager.leases.live()
+        if not rows:
+            print("No live Chrome driver leases")
+            return
+
+        print(f"{'Lease':<10} {'Owner':<16} {'Started':<21} {'PIDs':>5} {'RSS':>10}")
+        for lease_id, lease, owner_alive, rss in rows:
+            owner = f"{lease['owner'][0]}{'' if owner_alive else ' (dead)'}"
+            print(f"{lease_id:<10} {owner:<16} {lease['started']:<21} {len(lease['pids']):>5} {rss / 1024:>7.1f} MB")
+
+
+class LazyDriver:
+    """
+    Proxy around a Chrome WebDriver that defers launching the browser.
+
+    Scrapers with a browserless fast path can be handed a LazyDriver and
+    never pay the browser startup cost unless they fall back to Selenium.
+    Any attribute access other than quit() starts the real driver.
+    """
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._driver = None
+        self._setup = {}
+
+    @property
+    def started(self) -> bool:
+        """True once the underlying Chrome driver has been launched"""
+        return self._driver is not None
+
+    @property
+    def real_driver(self):
+        """The underlying Chrome driver, or None if it hasn't been launched"""
+        return self._driver
+
+    def configure(self, key, setup):
+        """Run `setup` on the real driver now if started, otherwise once it starts"""
+        self._setup[key] = setup
+        if self._driver is not None:
+            setup(self._driver)
+
+    def quit(self):
+        """Quit the underlying driver if it was ever started"""
+        if self._driver is not None:
+            driver, self._driver = self._driver, None
+            ChromeDriverManager.quit_driver(driver)
+
+    def __getattr__(self, name):
+        if self._driver is None:
+            self._driver = self._factory()
+            for setup in self._setup.values():
+                setup(self._driver)
+        return getattr(self._driver, name)
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Driver Leases
+Records the browser processes launched by ChromeDriverManager so they can be
+cleaned up even after a crash or an interrupted run
+"""
+
+import json
+import os
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+from util import process_tree, user_dirs
+from util.file_lock import file_lock
+
+
+class DriverLeases:
+    """
+    A JSON file listing every chromedriver/Chromium process tree in use.
+
+    Each lease stores the PID and kernel start time of the process that
+    created it (the owner) and of every browser process it launched. A
+    lease whose owner is no longer running belongs to a dead run and its
+    processes are orphans that can safely be killed.
+
+    Concurrent runs (the --daemon next to a cron run, say) share the file,
+    so every read-modify-write holds a lock on a sidecar ".lock" file.
+    The pids in it get killed, so its directory must belong to this user
+    and be writable by nobody else; otherwise leases aren't tracked.
+    """
+
+    DEFAULT_PATH = user_dirs.runtime_dir() / "driver_leases.json"
+
+    def __init__(self, filepath=None):
+        """
+        Initialize the DriverLeases.
+
+        Args:
+            filepath: Path to the lease file. Defaults to a file in this
+                        user's runtime directory, since PIDs are local to
+                        this machine.
+        """
+        self.filepath = Path(filepath) if filepath else self.DEFAULT_PATH
+        self._lock_path = self.filepath.with_name(f"{self.filepath.name}.lock")
+        self._private = None
+
+    def _usable(self):
+        """Create or check the lease directory once; warn if it can't be trusted"""
+        if self._private is None:
+            try:
+                user_dirs.ensure_private(self.filepath.parent)
+                self._private = True
+            except OSError as e:
+                print(f"⚠ Not tracking browser processes: {str(e)}")
+                self._private = False
+        return self._private
+
+    def _locked(self):
+        return file_lock(self._lock_path)
+
+    def _read(self):
+        if not user_dirs.trusted(self.filepath):
+            return {}
+        try:
+            return json.loads(self.filepath.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, leases):
+        fd, tmp = tempfile.mkstemp(prefix=f".{self.filepath.name}.", suffix=".tmp", dir=self.filepath.parent)
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(json.dumps(leases, indent=2))
+            os.replace(tmp, self.filepath)
+        except Exception:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+    def add(self, pids):
+        """
+        Record a new lease for a set of browser processes.
+
+        Args:
+            pids (list): Root PIDs of the launched processes (chromedriver
+                         first, then the browser processes under it).
+
+        Returns:
+            str: The lease ID, or None if process tracking is unsupported.
+        """
+        if not process_tree.supported() or not pids or not self._usable():
+            return None
+
+        owner = os.getpid()
+        lease = {
+            "owner": [owner, process_tree.start_time(owner)],
+            "started": datetime.now().isoformat(timespec="seconds"),
+            "pids": [[pid, process_tree.start_time(pid)] for pid in pids],
+        }
+        lease_id = str(pids[0])
+
+        with self._locked():
+            leases = self._read()
+            leases[lease_id] = lease
+            self._write(leases)
+        return lease_id
+
+    @staticmethod
+    def _live_pids(lease):
+        return [pid for pid, started in lease["pids"] if process_tree.is_same_process(pid, started)]
+
+    def release(self, lease_id, kill=True):
+        """
+        Remove a lease, killing whatever is left of its process tree.
+
+        Args:
+            lease_id (str): ID returned by add().
+            kill (bool): Kill surviving processes before removing the lease.
+        """
+        if not self._usable():
+            return
+        with self._locked():
+            leases = self._read()
+            lease = leases.pop(lease_id, None)
+            if lease is None:
+                return
+            self._write(leases)
+        # Killing can take the whole grace period; don't hold up other runs meanwhile
+        if kill:
+            process_tree.kill_tree(self._live_pids(lease))
+
+    def release_owned(self):
+        """Release every lease created by the current process."""
+        if not self._usable():
+            return
+        owner = os.getpid()
+        with self._locked():
+            leases = self._read()
+            owned = [lid for lid, lease in leases.items() if lease["owner"][0] == owner]
+        for lease_id in owned:
+            self.release(lease_id)
+
+    def reap_orphans(self):
+        """
+        Kill processes left behind by runs that are no longer alive.
+
+        Returns:
+            int: Number of processes that were signalled.
+        """
+        if not self._usable():
+            return 0
+        orphans = []
+        with self._locked():
+            leases = self._read()
+            for lease_id, lease in list(leases.items()):
+                if process_tree.is_same_process(*lease["owner"]):
+                    continue
+                orphans.extend(self._live_pids(lease))
+                del leases[lease_id]
+            self._write(leases)
+        return len(process_tree.kill_tree(orphans))
+
+    def live(self):
+        """
+        List leases that still have running processes.
+
+        Returns:
+            list: (lease_id, lease dict, owner_alive bool, rss_kb int) tuples.
+        """
+        rows = []
+        for lease_id, lease in self._read().items():
+            pids = self._live_pids(lease)
+            if not pids:
+                continue
+            owner_alive = process_tree.is_same_process(*lease["owner"])
+            rows.append((lease_id, lease, owner_alive, process_tree.tree_rss_kb(pids)))
+        return rows
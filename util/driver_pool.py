@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Driver Pool
+Leases Chrome WebDriver instances to scrapers running concurrently
+"""
+
+import queue
+import threading
+from contextlib import contextmanager
+
+from util.chrome_driver_manager import ChromeDriverManager, LazyDriver
+
+
+class DriverLease:
+    """
+    A single driver checked out of a DriverPool.
+
+    Scrapers may swap `driver` for a replacement (e.g. after a crash);
+    whatever is in `driver` when the lease is released goes back into
+    the same slot, so a recreated driver never affects other slots.
+    """
+
+    def __init__(self, slot, driver):
+        self.slot = slot
+        self.driver = driver
+
+
+class DriverPool:
+    """
+    A fixed number of driver slots shared by worker threads.
+
+    Slots hold LazyDriver instances by default, so a browser is only
+    launched once a scraper leasing that slot actually needs one.
+    """
+
+    def __init__(self, size, factory=None):
+        """
+        Initialize the DriverPool.
+
+        Args:
+            size (int): Number of driver slots (maximum concurrent browsers).
+            factory (callable, optional): Creates a new driver. Defaults to
+                                          ChromeDriverManager.create_lazy_driver.
+        """
+        if size < 1:
+            raise ValueError("Driver pool size must be at least 1")
+
+        self.size = size
+        self.factory = factory or ChromeDriverManager.create_lazy_driver
+        self._slots = [None] * size
+        self._free = queue.Queue()
+        self._lock = threading.Lock()
+
+        for slot in range(size):
+            self._free.put(slot)
+
+    @contextmanager
+    def lease(self):
+        """
+        Check out a driver for the duration of a `with` block.
+
+        Blocks until a slot is free. Yields a DriverLease whose `driver`
+        attribute may be replaced by the caller.
+        """
+        slot = self._free.get()
+        try:
+            driver = self._slots[slot]
+            if driver is None:
+                driver = self.factory()
+            lease = DriverLease(slot, driver)
+            try:
+                yield lease
+            finally:
+                with self._lock:
+                    self._slots[slot] = lease.driver
+        finally:
+            self._free.put(slot)
+
+    def has_browsers(self):
+        """Whether any slot holds a browser that has been launched."""
+        with self._lock:
+            return any(
+                d is not None and (not isinstance(d, LazyDriver) or d.started)
+                for d in self._slots
+            )
+
+    def close(self):
+        """Quit every driver the pool has started."""
+        with self._lock:
+            drivers = [d for d in self._slots if d is not None]
+            self._slots = [None] * self.size
+
+        for driver in drivers:
+            ChromeDriverManager.quit_driver(driver)
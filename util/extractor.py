@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+"""
+Extractor
+Evaluates an ordered list of CSS/XPath/regex strategies inside the page in a
+single WebDriver round trip, can read values straight from the JSON responses
+a page fetches, and lets scrapers be declared as specs on top of it
+"""
+
+import json
+import re
+import time
+
+from selenium.common.exceptions import JavascriptException, TimeoutException, WebDriverException
+from util.chrome_driver_manager import ChromeDriverManager
+from util.telemetry import Telemetry
+
+
+class Strategy:
+    """One way of locating a value: a CSS selector, an XPath, or a regex over the page HTML"""
+
+    KINDS = ("css", "xpath", "regex")
+
+    def __init__(self, kind, query, name=None):
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown strategy kind '{kind}', expected one of {self.KINDS}")
+        self.kind = kind
+        self.query = query
+        self.name = name or f"{kind}: {query}"
+
+    def to_js(self):
+        return {"kind": self.kind, "query": self.query}
+
+
+def css(query, name=None):
+    """Text of the first element matching a CSS selector"""
+    return Strategy("css", query, name)
+
+
+def xpath(query, name=None):
+    """Text of the first node matching an XPath"""
+    return Strategy("xpath", query, name)
+
+
+def regex(query, name=None):
+    """First capture group of a regex over the page HTML (JavaScript syntax)"""
+    return Strategy("regex", query, name)
+
+
+class ResponseCapture:
+    """A value inside a JSON response the page fetches (XHR or fetch), found by URL and key path"""
+
+    # Anti-hijacking prefixes some APIs put in front of their JSON
+    JSON_PREFIXES = ("{}&&", ")]}'", "while(1);", "for(;;);")
+
+    def __init__(self, url_pattern, path, fmt="{}", name=None):
+        """
+        Args:
+            url_pattern (str): Regex searched for in the response URL.
+            path (str): Dotted key path into the JSON; list items by index,
+                        e.g. "data.home.estimates.0.estimate".
+            fmt (str): Format string turning the JSON value into the value
+                       the DOM strategies would return, e.g. "${:,.0f}".
+            name (str, optional): Name for logging.
+        """
+        self.url_pattern = re.compile(url_pattern)
+        self.path = path.split(".")
+        self.fmt = fmt
+        self.name = name or f"response: {url_pattern} {path}"
+
+    def matches(self, url):
+        return bool(self.url_pattern.search(url))
+
+    def extract(self, body):
+        """
+        Read the value from a response body
+
+        Returns:
+            str: The formatted value, or None if the body doesn't hold one
+        """
+        text = body.lstrip()
+        for prefix in self.JSON_PREFIXES:
+            if text.startswith(prefix):
+                text = text[len(prefix):]
+                break
+        try:
+            node = json.loads(text)
+        except ValueError:
+            return None
+        for key in self.path:
+            if isinstance(node, list) and key.isdigit() and int(key) < len(node):
+                node = node[int(key)]
+            elif isinstance(node, dict) and key in node:
+                node = node[key]
+            else:
+                return None
+        if node is None or node == "" or isinstance(node, (dict, list)):
+            return None
+        try:
+            return self.fmt.format(node)
+        except (ValueError, TypeError):
+            return None
+
+
+def response(url_pattern, path, fmt="{}", name=None):
+    """A value from a JSON response whose URL matches url_pattern"""
+    return ResponseCapture(url_pattern, path, fmt, name)
+
+
+# Shared by the scripts below. findValue returns [text, strategy index] for the
+# first strategy that yields non-empty text (or just a node, when requireText is
+# false), or null. innerText matches Selenium's WebElement.text.
+FIND_JS = """
+function textOf(node) {
+    if (!node) return null;
+    return (node.innerText !== undefined ? node.innerText : node.textContent) || "";
+}
+function findValue(strategies, requireText, allowRegex) {
+    for (var i = 0; i < strategies.length; i++) {
+        var s = strategies[i], text = null;
+        try {
+            if (s.kind === "css") {
+                text = textOf(document.querySelector(s.query));
+            } else if (s.kind === "xpath") {
+                text = textOf(document.evaluate(s.query, document, null,
+                    XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue);
+            } else if (s.kind === "regex" && allowRegex) {
+                var m = new RegExp(s.query).exec(document.documentElement.outerHTML);
+                text = m ? m[1] : null;
+            }
+        } catch (e) {}
+        if (text !== null && (text.trim() || !requireText)) return [text.trim(), i];
+    }
+    return null;
+}
+"""
+
+# Runs in the page: one synchronous evaluation of every strategy.
+EXTRACT_JS = FIND_JS + """
+return findValue(arguments[0], true, true);
+"""
+
+# Runs in the page as an async script: resolves as soon as a DOM mutation makes
+# any strategy match, instead of waiting for the next WebDriver poll. Regex
+# strategies serialize the whole document, so they are re-checked at most every
+# REGEX_INTERVAL ms rather than on every mutation. The result carries a third
+# element: how long the matching evaluation took in the page, in ms.
+WAIT_JS = FIND_JS + """
+var strategies = arguments[0], timeoutMs = arguments[1], requireText = arguments[2];
+var done = arguments[arguments.length - 1];
+var REGEX_INTERVAL = 100;
+var finished = false, lastRegex = 0, observer = null, timer = null, regexTimer = null;
+
+function finish(result) {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    clearTimeout(timer);
+    clearTimeout(regexTimer);
+    done(result);
+}
+function check() {
+    if (finished) return;
+    var now = Date.now(), allowRegex = now - lastRegex >= REGEX_INTERVAL;
+    if (allowRegex) lastRegex = now;
+    var started = performance.now();
+    var result = findValue(strategies, requireText, allowRegex);
+    if (result) {
+        result.push(performance.now() - started);
+        finish(result);
+    }
+    else if (!allowRegex && !regexTimer) {
+        regexTimer = setTimeout(function () { regexTimer = null; check(); }, REGEX_INTERVAL);
+    }
+}
+
+check();
+if (!finished) {
+    observer = new MutationObserver(check);
+    observer.observe(document, {childList: true, subtree: true, characterData: true, attributes: true});
+    timer = setTimeout(function () { finish(null); }, timeoutMs);
+}
+"""
+
+
+class Extractor:
+    """Runs extraction strategies in the browser"""
+
+    CAPTURE_POLL_INTERVAL = 0.05
+
+    @staticmethod
+    def extract(driver, strategies):
+        """
+        Evaluate all strategies in one execute_script call
+
+        Args:
+            driver: Chrome WebDriver instance
+            strategies (list): Strategy objects, in order of preference
+
+        Returns:
+            tuple: (value: str, strategy: Strategy), or (None, None) if none matched
+        """
+        result = driver.execute_script(EXTRACT_JS, [s.to_js() for s in strategies])
+        if not result:
+            return None, None
+        text, index = result
+        return text, strategies[index]
+
+    @staticmethod
+    def wait_for(driver, strategies, timeout, require_text=True):
+        """
+        Wait until any strategy matches, using an in-page MutationObserver
+
+        The observer resolves on the DOM mutation that makes a strategy
+        match, so there is no polling interval between the value appearing
+        and the wait returning. If the page navigates away while waiting
+        (e.g. a client-side redirect), the wait is restarted on the new
+        document for the remaining time.
+
+        Args:
+            driver: Chrome WebDriver instance
+            strategies (list): Strategy objects, in order of preference
+            timeout (float): Seconds to wait
+            require_text (bool): Only match nodes with non-empty text
+
+        Returns:
+            tuple: (value: str, strategy: Strategy)
+
+        Raises:
+            TimeoutException: If nothing matched within the timeout.
+        """
+        payload = [s.to_js() for s in strategies]
+        deadline = time.monotonic() + timeout
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            driver.set_script_timeout(remaining + 5)
+            try:
+                result = driver.execute_async_script(WAIT_JS, payload, int(remaining * 1000), require_text)
+            except JavascriptException:
+                # Document replaced mid-wait; observe the new one
+                time.sleep(0.05)
+                continue
+            if result:
+                text, index = result[:2]
+                if len(result) > 2:
+                    Telemetry.record("extract", result[2] / 1000, strategy=strategies[index].name)
+                return text, strategies[index]
+            break
+
+        raise TimeoutException(f"No strategy matched within {timeout}s")
+
+    @staticmethod
+    def capture(driver, responses, strategies, timeout):
+        """
+        Wait for a value in a matching JSON response, with the DOM as fallback
+
+        Watches the network log for responses whose URL matches a capture
+        and reads the value from the body as soon as it has arrived, which
+        is usually well before a client-side framework renders it. The DOM
+        strategies are checked on every cycle too, so a page whose API
+        changed still yields its value. The page must have been opened
+        with the "none" page load strategy so navigation doesn't block.
+
+        Args:
+            driver: Chrome WebDriver instance
+            responses (list): ResponseCapture objects, in order of preference
+            strategies (list): DOM Strategy objects, in order of preference
+            timeout (float): Seconds to wait
+
+        Returns:
+            tuple: (value: str, found_by: ResponseCapture or Strategy)
+
+        Raises:
+            TimeoutException: If neither a response nor the DOM yielded a value.
+        """
+        deadline = time.monotonic() + timeout
+        pending = {}  # requestId -> ResponseCapture
+
+        while True:
+            for event in ChromeDriverManager.poll_network_log(driver):
+                method = event.get("method")
+                params = event.get("params", {})
+                if method == "Network.responseReceived":
+                    url = params.get("response", {}).get("url", "")
+                    capture = next((c for c in responses if c.matches(url)), None)
+                    if capture:
+                        pending[params["requestId"]] = capture
+                elif method == "Network.loadingFinished" and params.get("requestId") in pending:
+                    capture = pending.pop(params["requestId"])
+                    started = time.perf_counter()
+                    body = ChromeDriverManager.response_body(driver, params["requestId"])
+                    value = capture.extract(body) if body else None
+                    if value:
+                        Telemetry.record("extract", time.perf_counter() - started, strategy=capture.name)
+                        return value, capture
+
+            try:
+                value, strategy = Extractor.extract(driver, strategies)
+            except WebDriverException:
+                # Document is being replaced; check again next cycle
+                value, strategy = None, None
+            if value:
+                return value, strategy
+
+            if time.monotonic() >= deadline:
+                raise TimeoutException(f"No response or strategy matched within {timeout}s")
+            time.sleep(Extractor.CAPTURE_POLL_INTERVAL)
+
+
+class PageSpec:
+    """
+    Declarative description of how to scrape one value from a page.
+
+    The optional static XPath/regex are tried over plain HTTP first (see
+    StaticFetcher); the browser strategies are used when that fails or
+    isn't declared. With ChromeDriverManager.capture_responses on, declared
+    response captures are read from the page's JSON traffic and the rest
+    of the page load is aborted once one yields the value.
+    """
+
+    def __init__(self, description, strategies, timeout=15, static_xpath=None, static_pattern=None,
+                 responses=None):
+        """
+        Initialize the PageSpec.
+
+        Args:
+            description (str): What is being scraped, for logging (e.g. "Zestimate value").
+            strategies (list): Browser Strategy objects, in order of preference.
+            timeout (float): Seconds to wait for any strategy to match.
+            static_xpath (str, optional): XPath for the browserless fast path.
+            static_pattern (str, optional): Regex for the browserless fast path.
+            responses (list, optional): ResponseCapture objects for the JSON
+                                        the page fetches its value from.
+        """
+        self.description = description
+        self.strategies = strategies
+        self.timeout = timeout
+        self.static_xpath = static_xpath
+        self.static_pattern = static_pattern
+        self.responses = responses or []
+
+    @property
+    def has_static_path(self):
+        return bool(self.static_xpath or self.static_pattern)
+
+    def scrape(self, url, driver=None):
+        """
+        Scrape the value from a page
+
+        Args:
+            url (str): Page URL
+            driver (webdriver.Chrome, optional): Existing Chrome driver instance.
+                                                 If None, creates a new one.
+
+        Returns:
+            str: The value, or None if not found
+        """
+        if self.has_static_path:
+            # Try a plain HTTP fetch first; only start the browser if it fails.
+            # Imported here so pages without a static path don't load the HTTP stack.
+            from util.static_fetcher import StaticFetcher
+            value = StaticFetcher.scrape(url, xpath=self.static_xpath, pattern=self.static_pattern)
+            if value:
+                print(f"{self.description} found: {value}")
+                return value
+
+        # Track if we created the driver (so we know whether to close it)
+        driver_created = driver is None
+
+        if driver is None:
+            driver = ChromeDriverManager.create_driver()
+
+        capture = bool(self.responses and ChromeDriverManager.capture_responses)
+
+        try:
+            if capture:
+                ChromeDriverManager.configure(driver, "capture",
+                                              lambda d: ChromeDriverManager.cdp(d, "Network.enable"))
+                # Responses from an earlier page on this driver must not match
+                ChromeDriverManager.drain_network_log(driver)
+
+            print(f"Navigating to: {url}")
+            with Telemetry.span("navigate"):
+                driver.get(url)
+
+            with Telemetry.span("wait"):
+                if capture:
+                    value, strategy = Extractor.capture(driver, self.responses, self.strategies, self.timeout)
+                    # The value is in; stop downloading the rest of the page
+                    ChromeDriverManager.cdp(driver, "Page.stopLoading")
+                else:
+                    value, strategy = Extractor.wait_for(driver, self.strategies, self.timeout)
+
+            print(f"{self.description} found: {value} (matched {strategy.name})")
+            return value
+
+        except Exception as e:
+            print(f"Error occurred: {str(e)}")
+            return None
+
+        finally:
+            # Clean up - close the browser only if we created it
+            if driver_created and driver:
+                ChromeDriverManager.quit_driver(driver)
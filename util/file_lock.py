@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+File Lock
+Exclusive lock shared by the threads of this process and by every other
+process using the same lock file
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: only the threads of one process are serialized
+    fcntl = None
+
+_thread_locks = {}
+_thread_locks_guard = threading.Lock()
+
+
+def _thread_lock(path):
+    with _thread_locks_guard:
+        return _thread_locks.setdefault(str(path), threading.Lock())
+
+
+@contextmanager
+def file_lock(path):
+    """
+    Hold an exclusive lock on `path` for the duration of the block
+
+    flock() locks belong to the open file, not to the thread, so a
+    process-wide threading.Lock per path is taken first.
+
+    Args:
+        path: Lock file; created if it doesn't exist. Use a sidecar file
+              (e.g. "state.json.lock") rather than a file that gets
+              replaced by rename, since the lock stays on the old inode.
+    """
+    path = Path(path)
+    with _thread_lock(path):
+        if fcntl is None:
+            yield
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)  # closing the descriptor releases the flock
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Freshness
+Decides per source whether the last scraped value is still fresh enough to reuse
+"""
+
+import re
+import time
+
+_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+
+def parse_ttl(value):
+    """
+    Parse a TTL from links.json.
+
+    Accepts a number of seconds or a string such as "15m", "1h", "7d"
+    or "1w".
+
+    Returns:
+        float: TTL in seconds, or None if no TTL is set.
+
+    Raises:
+        ValueError: If the value can't be parsed.
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([smhdw]?)\s*", str(value).lower())
+    if not match:
+        raise ValueError(f"Invalid ttl '{value}', expected seconds or e.g. '15m', '1h', '7d'")
+    return float(match.group(1)) * _UNITS[match.group(2) or "s"]
+
+
+def format_age(seconds):
+    """Format a duration as a short human readable age, e.g. "3h 12m"."""
+    seconds = int(seconds)
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m"
+    if seconds < 86400:
+        return f"{seconds // 3600}h {seconds % 3600 // 60}m"
+    return f"{seconds // 86400}d {seconds % 86400 // 3600}h"
+
+
+class FreshnessCache:
+    """
+    Per-source result cache backed by the history store.
+
+    The latest reading of a source is its cached value. It stays fresh
+    until the source's TTL has elapsed, after which the source is due to
+    be scraped again.
+    """
+
+    def __init__(self, history):
+        """
+        Initialize the FreshnessCache.
+
+        Args:
+            history (HistoryStore): Store holding the latest reading of each source.
+        """
+        self.history = history
+
+    def fresh_value(self, source, ttl):
+        """
+        Return the cached reading if it is younger than the TTL.
+
+        Args:
+            source (str): links.json key.
+            ttl (float): Maximum age in seconds.
+
+        Returns:
+            sqlite3.Row: The latest reading, or None if it is missing or expired.
+        """
+        latest = self.history.latest(source)
+        if latest is None or time.time() - latest["ts"] >= ttl:
+            return None
+        return latest
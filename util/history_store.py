@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+History Store
+Keeps every scraped value in a local SQLite database for time-series queries
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+
+class HistoryStore:
+    """
+    Time series of scraped values, one row per (source, timestamp).
+
+    The database runs in WAL mode so readers (dashboards, range queries)
+    never block the scraper while it writes. Rows are indexed on
+    (source, ts) and on ts, so range queries for a few sources only touch
+    the matching part of the table.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS readings (
+            id        INTEGER PRIMARY KEY,
+            source    TEXT NOT NULL,
+            ts        REAL NOT NULL,
+            raw       TEXT,
+            value     REAL,
+            duration  REAL
+        );
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_readings_source_ts ON readings (source, ts);
+        CREATE INDEX IF NOT EXISTS idx_readings_ts ON readings (ts);
+    """
+
+    def __init__(self, filepath="history.db"):
+        """
+        Initialize the HistoryStore, creating the database if needed.
+
+        Args:
+            filepath: Path to the SQLite database. Defaults to "history.db".
+        """
+        self.filepath = Path(filepath)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.filepath), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+
+    @staticmethod
+    def normalize(text):
+        """
+        Convert a scraped value such as "$412,300" or "24,293" to a number.
+
+        Returns:
+            float: The numeric value, or None if the text isn't a number.
+        """
+        if text is None:
+            return None
+        try:
+            return float(str(text).replace("$", "").replace(",", "").strip())
+        except ValueError:
+            return None
+
+    def record(self, source, raw, value=None, duration=None, ts=None):
+        """
+        Append one reading.
+
+        Args:
+            source (str): links.json key, e.g. "zillow".
+            raw (str): Text exactly as scraped.
+            value (float, optional): Numeric value. Defaults to normalize(raw).
+            duration (float, optional): Scrape duration in seconds.
+            ts (float, optional): Unix timestamp. Defaults to now.
+        """
+        self.record_many([(source, raw, value, duration, ts)])
+
+    def record_many(self, readings):
+        """
+        Append several readings in a single transaction.
+
+        Args:
+            readings (list): (source, raw, value, duration, ts) tuples; value
+                             None is normalized from raw, ts None means now.
+        """
+        now = time.time()
+        rows = [
+            (source, ts or now, raw, value if value is not None else self.normalize(raw), duration)
+            for source, raw, value, duration, ts in readings
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO readings (source, ts, raw, value, duration) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def latest(self, source):
+        """
+        Return the most recent reading for a source.
+
+        Returns:
+            sqlite3.Row: Row with source, ts, raw, value, duration, or None.
+        """
+        with self._lock:
+            return self._conn.execute(
+                "SELECT source, ts, raw, value, duration FROM readings WHERE source = ? ORDER BY ts DESC LIMIT 1",
+                (source,),
+            ).fetchone()
+
+    def range(self, sources, since, until=None):
+        """
+        Return readings for some sources within a time window.
+
+        Args:
+            sources (list): links.json keys to include.
+            since (float): Start of the window (unix timestamp, inclusive).
+            until (float, optional): End of the window. Defaults to now.
+
+        Returns:
+            list: sqlite3.Row objects ordered by timestamp.
+        """
+        placeholders = ",".join("?" * len(sources))
+        with self._lock:
+            return self._conn.execute(
+                f"SELECT source, ts, raw, value, duration FROM readings "
+                f"WHERE source IN ({placeholders}) AND ts >= ? AND ts <= ? ORDER BY ts",
+                (*sources, since, until or time.time()),
+            ).fetchall()
+
+    def daily(self, sources, days):
+        """
+        Return the last value of each day for some sources.
+
+        Args:
+            sources (list): links.json keys to include.
+            days (int): How many days back to look.
+
+        Returns:
+            dict: {"YYYY-MM-DD": {source: value}} ordered by date.
+        """
+        since = (datetime.now() - timedelta(days=days)).timestamp()
+        table = {}
+        for row in self.range(sources, since):
+            day = datetime.fromtimestamp(row["ts"]).strftime("%Y-%m-%d")
+            table.setdefault(day, {})[row["source"]] = row["value"] if row["value"] is not None else row["raw"]
+        return table
+
+    def import_txt(self, files):
+        """
+        Bulk import the values currently stored in legacy .txt output files.
+
+        Each file becomes one reading timestamped with the file's mtime.
+        Re-importing an unchanged file is a no-op.
+
+        Args:
+            files (dict): {source: path to .txt file}
+
+        Returns:
+            int: Number of readings imported.
+        """
+        rows = []
+        for source, path in files.items():
+            try:
+                raw = Path(path).read_text().strip()
+                ts = os.path.getmtime(path)
+            except OSError:
+                continue
+            if raw:
+                rows.append((source, ts, raw, self.normalize(raw), None))
+
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO readings (source, ts, raw, value, duration) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            return self._conn.total_changes - before
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+HTTP Cache
+On-disk cache for browserless fetches that revalidates with ETag and
+Last-Modified, so an unchanged page costs a 304 instead of a full download
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+import zlib
+from pathlib import Path
+
+from util.http_session import HttpSession
+
+
+class HttpCache:
+    """
+    Conditional-request cache shared by the StaticFetcher and JsonApi paths.
+
+    A response is stored only if the server sent an ETag or Last-Modified
+    validator, together with the values extracted from it. The next fetch
+    of the URL sends If-None-Match / If-Modified-Since; on a 304 the
+    stored value is returned without downloading or parsing anything.
+
+    Each URL is one metadata file and one compressed body file in
+    `directory`. Reading an entry touches it, and once the directory grows
+    past `max_bytes` the least recently used entries are deleted.
+    """
+
+    directory = Path(os.environ.get("SCRAPER_HTTP_CACHE_DIR", ".http_cache"))
+    max_bytes = int(float(os.environ.get("SCRAPER_HTTP_CACHE_MB", "50")) * 1024 * 1024)
+    enabled = max_bytes > 0
+
+    _evict_lock = threading.Lock()
+
+    @staticmethod
+    def _paths(url):
+        name = hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+        return HttpCache.directory / f"{name}.json", HttpCache.directory / f"{name}.body"
+
+    @staticmethod
+    def _load(url):
+        """Return the stored metadata for a URL, or None"""
+        meta_path, body_path = HttpCache._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text())
+        except (OSError, ValueError):
+            return None
+        if meta.get("url") != url or not body_path.exists():
+            return None
+        return meta
+
+    @staticmethod
+    def _write_atomic(path, data):
+        fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except Exception:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+    @staticmethod
+    def _store(url, response, values):
+        meta_path, body_path = HttpCache._paths(url)
+        HttpCache.directory.mkdir(parents=True, exist_ok=True)
+        # Body first: an entry only counts once its metadata exists
+        HttpCache._write_atomic(body_path, zlib.compress(response.body))
+        HttpCache._write_atomic(meta_path, json.dumps({
+            "url": url,
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+            "content_type": response.headers.get("content-type", ""),
+            "stored": time.time(),
+            "values": values,
+        }).encode("utf-8"))
+        HttpCache._evict()
+
+    @staticmethod
+    def _save_values(url, meta):
+        meta_path, _ = HttpCache._paths(url)
+        try:
+            HttpCache._write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+        except OSError:
+            pass
+
+    @staticmethod
+    def _touch(url):
+        for path in HttpCache._paths(url):
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _evict():
+        """Delete least recently used entries until the cache fits in max_bytes"""
+        with HttpCache._evict_lock:
+            entries = {}
+            for path in HttpCache.directory.glob("*.*"):
+                if path.suffix not in (".json", ".body"):
+                    continue
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                size, used = entries.get(path.stem, (0, 0))
+                entries[path.stem] = (size + stat.st_size, max(used, stat.st_mtime))
+
+            total = sum(size for size, _ in entries.values())
+            for stem, (size, _) in sorted(entries.items(), key=lambda item: item[1][1]):
+                if total <= HttpCache.max_bytes:
+                    break
+                for suffix in (".json", ".body"):
+                    try:
+                        (HttpCache.directory / f"{stem}{suffix}").unlink()
+                    except OSError:
+                        pass
+                total -= size
+
+    @staticmethod
+    def _cacheable(response):
+        if response.status != 200:
+            return False
+        if "no-store" in response.headers.get("cache-control", "").lower():
+            return False
+        return bool(response.headers.get("etag") or response.headers.get("last-modified"))
+
+    @staticmethod
+    def fetch_value(url, key, extract, headers=None, timeout=None):
+        """
+        Fetch a URL and extract a value, revalidating a cached copy if there is one
+
+        Args:
+            url (str): http or https URL
+            key (str): Identifies the extraction, so values extracted
+                       differently from the same page are cached separately
+            extract (callable): Turns the body text into the value (or None)
+            headers (dict, optional): Request headers
+            timeout (float, optional): Seconds for connecting and for each read
+
+        Returns:
+            tuple: (value: str|None, response: HttpResponse). response.status
+                   is 304 when the cached copy was still valid.
+
+        Raises:
+            OSError: If the server answers with an error status.
+        """
+        meta = HttpCache._load(url) if HttpCache.enabled else None
+        request_headers = dict(headers or {})
+        if meta:
+            if meta.get("etag"):
+                request_headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                request_headers["If-Modified-Since"] = meta["last_modified"]
+
+        response = HttpSession.get(url, headers=request_headers, timeout=timeout)
+
+        if response.status == 304 and meta:
+            HttpCache._touch(url)
+            value = meta["values"].get(key)
+            if value is None:
+                # Cached for another extraction; parse the stored body once
+                _, body_path = HttpCache._paths(url)
+                response.body = zlib.decompress(body_path.read_bytes())
+                response.headers.setdefault("content-type", meta.get("content_type", ""))
+                value = extract(response.text())
+                if value is not None:
+                    meta["values"][key] = value
+                    HttpCache._save_values(url, meta)
+            return value, response
+
+        if response.status >= 400:
+            raise OSError(f"HTTP {response.status} from {url}")
+
+        value = extract(response.text())
+        if HttpCache.enabled and HttpCache._cacheable(response):
+            try:
+                HttpCache._store(url, response, {key: value} if value is not None else {})
+            except OSError as e:
+                print(f"⚠ Could not write HTTP cache: {str(e)}")
+        return value, response
+
+    @staticmethod
+    def clear():
+        """Delete every cached entry"""
+        for path in HttpCache.directory.glob("*.*"):
+            if path.suffix in (".json", ".body"):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+HTTP Session
+Shared keep-alive connection pool for every fetch made without the browser,
+speaking HTTP/2 where the server and the installed packages allow it
+"""
+
+import json
+import threading
+
+import urllib3
+
+try:
+    import httpx
+except ImportError:  # httpx is optional; urllib3 (installed with selenium) keeps connections alive too
+    httpx = None
+
+try:
+    import h2  # httpx only speaks HTTP/2 when h2 is installed
+except ImportError:
+    h2 = None
+
+
+class HttpResponse:
+    """Status, headers and body of one response"""
+
+    def __init__(self, url, status, headers, body, http_version):
+        self.url = url
+        self.status = status
+        self.headers = {key.lower(): value for key, value in headers.items()}
+        self.body = body
+        self.http_version = http_version
+
+    def text(self):
+        charset = "utf-8"
+        for part in self.headers.get("content-type", "").split(";")[1:]:
+            name, _, value = part.strip().partition("=")
+            if name.lower() == "charset" and value:
+                charset = value.strip('"')
+        return self.body.decode(charset, errors="replace")
+
+    def json(self):
+        return json.loads(self.text())
+
+
+class HttpSession:
+    """
+    One connection pool shared by all scrapers and threads.
+
+    Connections to each host are kept open between requests, so sources
+    on the same host (or the same source in consecutive daemon runs) skip
+    the TCP and TLS handshakes. With httpx and h2 installed, HTTPS hosts
+    that offer HTTP/2 are spoken to over a single multiplexed connection;
+    otherwise urllib3 keeps HTTP/1.1 connections alive.
+    """
+
+    TIMEOUT = 10
+    MAX_CONNECTIONS = 10
+    MAX_REDIRECTS = 5
+
+    _client = None
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _get_client():
+        with HttpSession._lock:
+            if HttpSession._client is None:
+                if httpx is not None:
+                    HttpSession._client = httpx.Client(
+                        http2=h2 is not None,
+                        follow_redirects=True,
+                        max_redirects=HttpSession.MAX_REDIRECTS,
+                        limits=httpx.Limits(max_connections=HttpSession.MAX_CONNECTIONS),
+                    )
+                else:
+                    HttpSession._client = urllib3.PoolManager(maxsize=HttpSession.MAX_CONNECTIONS, block=False)
+            return HttpSession._client
+
+    @staticmethod
+    def protocol() -> str:
+        """Newest HTTP version the session can negotiate"""
+        return "HTTP/2" if httpx is not None and h2 is not None else "HTTP/1.1"
+
+    @staticmethod
+    def get(url, headers=None, timeout=None) -> HttpResponse:
+        """
+        GET a URL over a pooled connection, following redirects
+
+        Args:
+            url (str): http or https URL
+            headers (dict, optional): Request headers
+            timeout (float, optional): Seconds for connecting and for each read
+
+        Returns:
+            HttpResponse: The response, whatever its status
+        """
+        client = HttpSession._get_client()
+        timeout = timeout or HttpSession.TIMEOUT
+        if httpx is not None:
+            response = client.get(url, headers=headers, timeout=timeout)
+            return HttpResponse(str(response.url), response.status_code, response.headers,
+                                response.content, response.http_version)
+
+        response = client.request(
+            "GET", url, headers=headers,
+            timeout=urllib3.Timeout(connect=timeout, read=timeout),
+            retries=urllib3.Retry(total=None, connect=0, read=0, status=0, other=0,
+                                  redirect=HttpSession.MAX_REDIRECTS),
+        )
+        return HttpResponse(response.geturl() or url, response.status, response.headers,
+                            response.data, f"HTTP/{response.version / 10:.1f}")
+
+    @staticmethod
+    def close():
+        """Close every pooled connection; the next request opens new ones"""
+        with HttpSession._lock:
+            client, HttpSession._client = HttpSession._client, None
+        if client is not None:
+            if httpx is not None:
+                client.close()
+            else:
+                client.clear()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Lean Profile
+Configuration for blocking images, fonts, media and tracker hosts while scraping
+"""
+
+import json
+from pathlib import Path
+from urllib.parse import urlparse
+
+
+class LeanProfile:
+    """
+    Per-domain allow/deny lists of URL patterns to block in the browser.
+
+    Patterns use the wildcard syntax of CDP Network.setBlockedURLs. The
+    defaults below can be extended or overridden in an optional JSON
+    file shaped like:
+
+        {
+          "block_images": true,
+          "block": ["*.example-tracker.com*"],
+          "domains": {
+            "realtor.com": { "allow": ["*.woff2"], "block": ["*/ads/*"] }
+          }
+        }
+
+    A domain entry applies to that host and its subdomains. Its `allow`
+    entries are removed from the blocked list for that domain only. The
+    browser can't make exceptions to a blocked pattern, so an allow entry
+    has to repeat a block pattern exactly ("*.woff2", not
+    "*fonts.example.com*"); allowing "*.png" also allows "*.png?*".
+    Allow entries that match nothing are reported when the profile loads.
+    """
+
+    CONFIG_FILE = "lean_profile.json"
+
+    # Opt in with run_scrapers.py --lean
+    enabled = False
+
+    # Each extension also with a query string ("photo.jpg?w=400")
+    IMAGES = [f"*.{ext}{query}" for ext in ("jpg", "jpeg", "png", "gif", "webp", "avif", "ico") for query in ("", "?*")]
+    FONTS = [f"*.{ext}{query}" for ext in ("woff", "woff2", "ttf", "otf", "eot") for query in ("", "?*")]
+    MEDIA = [f"*.{ext}{query}" for ext in ("mp4", "webm", "m3u8", "ts", "mp3", "m4a") for query in ("", "?*")]
+    TRACKERS = [
+        "*google-analytics.com*", "*googletagmanager.com*", "*googlesyndication.com*",
+        "*doubleclick.net*", "*googleadservices.com*", "*adservice.google.com*",
+        "*facebook.net*", "*facebook.com/tr*", "*connect.facebook.net*",
+        "*hotjar.com*", "*clarity.ms*", "*bat.bing.com*",
+        "*segment.io*", "*cdn.segment.com*", "*amplitude.com*", "*mixpanel.com*",
+        "*fullstory.com*", "*newrelic.com*", "*nr-data.net*", "*optimizely.com*",
+        "*quantserve.com*", "*scorecardresearch.com*", "*adsrvr.org*",
+        "*criteo.com*", "*criteo.net*", "*taboola.com*", "*outbrain.com*",
+        "*branch.io*", "*pinimg.com*", "*tiktok.com/i18n/pixel*",
+    ]
+
+    _config = None
+
+    @classmethod
+    def load(cls, config_file=None):
+        """
+        Load the profile configuration, falling back to the built-in defaults
+
+        Args:
+            config_file: Path to the JSON config. Defaults to "lean_profile.json";
+                         a missing file is not an error.
+        """
+        config_path = Path(config_file or cls.CONFIG_FILE)
+        config = {}
+        if config_path.exists():
+            with open(config_path, 'r') as f:
+                config = json.load(f)
+            print(f"Loaded lean profile from {config_path}")
+
+        cls._config = {
+            "block_images": config.get("block_images", True),
+            "block": cls.FONTS + cls.MEDIA + cls.TRACKERS + config.get("block", []),
+            "domains": config.get("domains", {}),
+        }
+
+        known = set(cls._config["block"] + cls.IMAGES)
+        for domain, rules in cls._config["domains"].items():
+            known_here = known | set(rules.get("block", []))
+            for pattern in rules.get("allow", []):
+                if pattern not in known_here:
+                    print(f"⚠ Lean profile: allow '{pattern}' for {domain} matches no block pattern; "
+                          f"allow entries must repeat a block pattern exactly")
+
+    @classmethod
+    def _get_config(cls):
+        if cls._config is None:
+            cls.load()
+        return cls._config
+
+    @classmethod
+    def chrome_prefs(cls):
+        """
+        Chrome preferences applied when a lean browser is launched
+
+        Images are blocked per page through blocked_patterns(), not with a
+        browser-wide content setting, so a domain can allow them back.
+
+        Returns:
+            dict: Preferences for Options.add_experimental_option("prefs", ...)
+        """
+        return {"profile.default_content_setting_values.notifications": 2}
+
+    @classmethod
+    def blocked_patterns(cls, url):
+        """
+        URL patterns to block while loading a page
+
+        Args:
+            url (str): The page about to be loaded
+
+        Returns:
+            list: Patterns for Network.setBlockedURLs
+        """
+        config = cls._get_config()
+        blocked = list(config["block"])
+        if config["block_images"]:
+            blocked += cls.IMAGES
+
+        host = urlparse(url).hostname or ""
+        for domain, rules in config["domains"].items():
+            if host == domain or host.endswith("." + domain):
+                allowed = {variant for p in rules.get("allow", []) for variant in (p, p + "?*")}
+                blocked = [p for p in blocked if p not in allowed] + rules.get("block", [])
+
+        return list(dict.fromkeys(blocked))
@@ -5,8 +5,49 @@ Loads and provides access to scraper URLs from a JSON configuration file
 """
 
 import json
+import re
 from pathlib import Path
 
+from util.freshness import parse_ttl
+
+
+class LinkTarget:
+    """
+    One URL to scrape for a config entry.
+
+    Entries with a single "link" have one unnamed target whose id is the
+    entry key. Entries with a "targets" list have one named target per
+    item, identified as "<key>/<name>" in the history, ledger and breakers.
+    """
+
+    def __init__(self, source, name, link, ttl=None, output_file=None, backend="page"):
+        """
+        Initialize the LinkTarget.
+
+        Args:
+            source (str): Entry key in the config file, e.g. "zillow".
+            name (str): Target name, or None for an entry's single link.
+            link (str): URL to scrape.
+            ttl (float, optional): Cache TTL in seconds.
+            output_file (str, optional): Output file set in the config.
+            backend (str): Scraper implementation to use, e.g. "page" or "api".
+        """
+        self.source = source
+        self.name = name
+        self.link = link
+        self.ttl = ttl
+        self.output_file = output_file
+        self.backend = backend
+
+    @property
+    def id(self):
+        return f"{self.source}/{self.name}" if self.name else self.source
+
+    @property
+    def slug(self):
+        """Target name made safe for use in a filename"""
+        return re.sub(r"[^\w.-]+", "_", self.name) if self.name else None
+
 
 class LinkLoader:
     """
@@ -17,6 +58,18 @@ class LinkLoader:
     
     Each entry in the config is expected to have the shape:
         { "link": "https://...", "enabled": true }
+    
+    or, to scrape several pages with the same scraper:
+        { "enabled": true, "targets": [
+            { "name": "home", "link": "https://..." },
+            { "name": "rental", "link": "https://...", "enabled": false }
+        ] }
+    
+    An entry or target may also set "ttl" (seconds, or e.g. "15m", "1h",
+    "7d") to re-scrape it only once its last value is older than that,
+    and a target may set "output" to choose its output file. "backend"
+    picks another implementation of the scraper where one exists, e.g.
+    "api" to read the Bitnodes count from its JSON API.
     """
     
     # Public class variables for scraper URLs (None if disabled or not loaded)
@@ -26,6 +79,19 @@ class LinkLoader:
     bitnodes = None
     coindance = None
     etherscan = None
+
+    # Every entry in the config, including plugin scrapers: key -> URL or None
+    # (the first enabled target's URL for entries with "targets")
+    links = {}
+
+    # Enabled targets of every enabled entry: key -> [LinkTarget]
+    targets = {}
+
+    # Optional cache TTLs in seconds: entry key or target id -> float (None if unset)
+    ttls = {}
+
+    # Everything load() replaces
+    _STATE = ('links', 'targets', 'ttls', 'redfin', 'zillow', 'realtor', 'bitnodes', 'coindance', 'etherscan')
     
     @classmethod
     def load(cls, config_file="links.json"):
@@ -39,6 +105,8 @@ class LinkLoader:
             FileNotFoundError: If the config file doesn't exist.
             json.JSONDecodeError: If the config file is not valid JSON.
             KeyError: If required keys are missing from the config.
+            ValueError: If a "ttl" value can't be parsed or target names
+                        are missing or repeated.
         """
         config_path = Path(config_file)
         
@@ -48,16 +116,125 @@ class LinkLoader:
         with open(config_path, 'r') as f:
             links = json.load(f)
         
+        # Parse everything before replacing anything, so a bad config
+        # (e.g. on reload in daemon mode) leaves the loaded one intact
+        targets = {}
+        ttls = {}
+        for key, entry in links.items():
+            ttls[key] = parse_ttl(entry.get('ttl'))
+            targets[key] = cls._parse_targets(key, entry) if entry.get('enabled') else []
+            for target in targets[key]:
+                ttls[target.id] = target.ttl
+        for key in ('redfin', 'zillow', 'realtor', 'bitnodes', 'coindance', 'etherscan'):
+            if key not in targets:
+                raise KeyError(key)
+
+        cls.targets = targets
+        cls.ttls = ttls
+
+        cls.links = {
+            key: targets[0].link if targets else None
+            for key, targets in cls.targets.items()
+        }
+
         # Load each URL from the config; set to None if disabled
-        cls.redfin    = links['redfin']['link']    if links['redfin']['enabled']    else None
-        cls.zillow    = links['zillow']['link']    if links['zillow']['enabled']    else None
-        cls.realtor   = links['realtor']['link']   if links['realtor']['enabled']   else None
-        cls.bitnodes  = links['bitnodes']['link']  if links['bitnodes']['enabled']  else None
-        cls.coindance = links['coindance']['link'] if links['coindance']['enabled'] else None
-        cls.etherscan = links['etherscan']['link'] if links['etherscan']['enabled'] else None
+        cls.redfin    = cls.links['redfin']
+        cls.zillow    = cls.links['zillow']
+        cls.realtor   = cls.links['realtor']
+        cls.bitnodes  = cls.links['bitnodes']
+        cls.coindance = cls.links['coindance']
+        cls.etherscan = cls.links['etherscan']
         
         print(f"Successfully loaded links from {config_file}")
     
+    @classmethod
+    def save_state(cls):
+        """
+        Capture the loaded configuration, to put back with restore_state().
+        
+        Returns:
+            dict: The class variables load() sets.
+        """
+        return {name: getattr(cls, name) for name in cls._STATE}
+    
+    @classmethod
+    def restore_state(cls, state):
+        """
+        Put back a configuration captured by save_state().
+        
+        Args:
+            state (dict): Value returned by save_state().
+        """
+        for name, value in state.items():
+            setattr(cls, name, value)
+    
+    @staticmethod
+    def _parse_targets(key, entry):
+        """
+        Build the enabled targets of one enabled config entry.
+        
+        Returns:
+            list: LinkTarget objects, in config order.
+        """
+        ttl = parse_ttl(entry.get('ttl'))
+        backend = entry.get('backend', 'page')
+        if 'targets' not in entry:
+            return [LinkTarget(key, None, entry['link'], ttl, backend=backend)]
+        
+        targets = []
+        names = set()
+        for item in entry['targets']:
+            name = item.get('name')
+            if not name:
+                raise ValueError(f"Every target of '{key}' needs a name")
+            if name in names:
+                raise ValueError(f"Duplicate target name '{name}' in '{key}'")
+            names.add(name)
+            if item.get('enabled', True):
+                item_ttl = parse_ttl(item['ttl']) if 'ttl' in item else ttl
+                targets.append(LinkTarget(key, name, item['link'], item_ttl, item.get('output'),
+                                          item.get('backend', backend)))
+        return targets
+    
+    @classmethod
+    def get(cls, key):
+        """
+        Get the URL for any config entry, including plugin scrapers.
+        
+        Args:
+            key: Entry name in the config file.
+            
+        Returns:
+            str: The URL, or None if the entry is disabled or missing.
+        """
+        return cls.links.get(key)
+    
+    @classmethod
+    def get_targets(cls, key):
+        """
+        Get the enabled targets of a config entry.
+        
+        Args:
+            key: Entry name in the config file.
+            
+        Returns:
+            list: LinkTarget objects; empty if the entry is disabled or missing.
+        """
+        return cls.targets.get(key, [])
+    
+    @classmethod
+    def get_ttl(cls, key):
+        """
+        Get the cache TTL configured for an entry or target.
+        
+        Args:
+            key: Entry name in the config file, or a target id ("zillow/home").
+            
+        Returns:
+            float: TTL in seconds, or None if the entry has no TTL.
+        """
+        return cls.ttls.get(key)
+    
     @classmethod
     def get_all(cls):
         """
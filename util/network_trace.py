@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Network Trace
+Turns the CDP network events Chrome logged during a scrape into a compact
+per-request waterfall and a per-host summary
+"""
+
+import json
+import re
+from pathlib import Path
+from urllib.parse import urlparse
+
+
+def _span(timing, start, end):
+    """Duration in ms between two ResourceTiming offsets, or None if either is missing"""
+    if timing.get(start, -1) < 0 or timing.get(end, -1) < 0:
+        return None
+    return round(timing[end] - timing[start], 1)
+
+
+class NetworkTrace:
+    """
+    Waterfall of every request one page load made.
+
+    Built from the Network.* events in Chrome's performance log. Request
+    times are in ms from the first request, with the connection phases
+    (DNS, connect, TLS, send, time to first byte, download) broken out
+    from Chrome's ResourceTiming.
+    """
+
+    SLOWEST = 5
+
+    def __init__(self, events):
+        """
+        Initialize the NetworkTrace.
+
+        Args:
+            events (list): CDP event messages from ChromeDriverManager.drain_network_log().
+        """
+        self.requests = []
+        self._origin = None  # (monotonic timestamp, wall time) of the first request
+        self._build(events)
+
+    def _offset_ms(self, timestamp):
+        return round((timestamp - self._origin[0]) * 1000, 1)
+
+    def _build(self, events):
+        pending = {}
+        for event in events:
+            method = event.get("method", "")
+            params = event.get("params", {})
+            request_id = params.get("requestId")
+
+            if method == "Network.requestWillBeSent":
+                if self._origin is None:
+                    self._origin = (params["timestamp"], params.get("wallTime"))
+                if request_id in pending and params.get("redirectResponse"):
+                    # The same id continues after a redirect; finish the hop before it
+                    entry = pending.pop(request_id)
+                    self._apply_response(entry, params["redirectResponse"])
+                    self._finish(entry, params["timestamp"])
+                request = params.get("request", {})
+                pending[request_id] = {
+                    "url": request.get("url", ""),
+                    "host": urlparse(request.get("url", "")).netloc,
+                    "method": request.get("method"),
+                    "type": params.get("type"),
+                    "priority": request.get("initialPriority"),
+                    "blocking": params.get("renderBlockingBehavior"),
+                    "start_ms": self._offset_ms(params["timestamp"]),
+                    "_started": params["timestamp"],
+                }
+            elif request_id not in pending:
+                continue
+            elif method == "Network.responseReceived":
+                self._apply_response(pending[request_id], params.get("response", {}))
+            elif method == "Network.requestServedFromCache":
+                pending[request_id]["from_cache"] = True
+            elif method == "Network.loadingFinished":
+                entry = pending.pop(request_id)
+                entry["bytes"] = int(params.get("encodedDataLength", 0))
+                self._finish(entry, params["timestamp"])
+            elif method == "Network.loadingFailed":
+                entry = pending.pop(request_id)
+                entry["failed"] = params.get("blockedReason") or params.get("errorText") or "failed"
+                self._finish(entry, params["timestamp"])
+
+        # Requests still in flight when the value was found
+        for entry in pending.values():
+            entry.pop("_started", None)
+            entry["unfinished"] = True
+            self.requests.append(entry)
+        self.requests.sort(key=lambda r: r["start_ms"])
+
+    def _apply_response(self, entry, response):
+        timing = response.get("timing") or {}
+        entry.update({
+            "status": response.get("status"),
+            "mime": response.get("mimeType"),
+            "protocol": response.get("protocol"),
+            "from_cache": bool(response.get("fromDiskCache") or response.get("fromServiceWorker")),
+            "dns_ms": _span(timing, "dnsStart", "dnsEnd"),
+            "connect_ms": _span(timing, "connectStart", "connectEnd"),
+            "ssl_ms": _span(timing, "sslStart", "sslEnd"),
+            "send_ms": _span(timing, "sendStart", "sendEnd"),
+            "ttfb_ms": _span(timing, "sendEnd", "receiveHeadersEnd"),
+        })
+        if timing.get("receiveHeadersEnd", -1) >= 0:
+            entry["_headers_at"] = timing["requestTime"] + timing["receiveHeadersEnd"] / 1000
+
+    def _finish(self, entry, timestamp):
+        entry["end_ms"] = self._offset_ms(timestamp)
+        entry["duration_ms"] = round(entry["end_ms"] - entry["start_ms"], 1)
+        headers_at = entry.pop("_headers_at", None)
+        if headers_at is not None:
+            entry["download_ms"] = round(max(0.0, timestamp - headers_at) * 1000, 1)
+        entry.pop("_started", None)
+        self.requests.append(entry)
+
+    @property
+    def started_at(self):
+        """Wall clock time of the first request, or None if nothing was requested"""
+        return self._origin[1] if self._origin else None
+
+    def hosts(self):
+        """
+        Aggregate the waterfall per host.
+
+        Returns:
+            list: Dicts with host, requests, bytes and busy_ms (summed request
+                  durations), most time-consuming host first.
+        """
+        hosts = {}
+        for request in self.requests:
+            host = hosts.setdefault(request["host"], {"host": request["host"], "requests": 0, "bytes": 0, "busy_ms": 0.0})
+            host["requests"] += 1
+            host["bytes"] += request.get("bytes", 0)
+            host["busy_ms"] = round(host["busy_ms"] + request.get("duration_ms", 0), 1)
+        return sorted(hosts.values(), key=lambda h: h["busy_ms"], reverse=True)
+
+    def summary(self, value_at=None, metrics=None):
+        """
+        Build the compact summary saved for one scrape.
+
+        Args:
+            value_at (float, optional): Wall clock time the value was found.
+            metrics (dict, optional): Performance.getMetrics results.
+
+        Returns:
+            dict: Totals, per-host breakdown, slowest and render-blocking
+                  requests, page metrics and the full waterfall.
+        """
+        finished = [r for r in self.requests if "duration_ms" in r]
+        time_to_value = None
+        if value_at is not None and self.started_at is not None:
+            time_to_value = round((value_at - self.started_at) * 1000, 1)
+        return {
+            "requests": len(self.requests),
+            "bytes": sum(r.get("bytes", 0) for r in self.requests),
+            "failed": sum(1 for r in self.requests if r.get("failed")),
+            "time_to_value_ms": time_to_value,
+            "hosts": self.hosts(),
+            "slowest": [
+                {"url": r["url"], "duration_ms": r["duration_ms"], "bytes": r.get("bytes", 0)}
+                for r in sorted(finished, key=lambda r: r["duration_ms"], reverse=True)[:self.SLOWEST]
+            ],
+            "render_blocking": [r["url"] for r in self.requests if r.get("blocking") == "Blocking"],
+            "metrics": metrics or {},
+            "waterfall": self.requests,
+        }
+
+    @staticmethod
+    def save(directory, source, trace):
+        """
+        Write a trace summary to `<directory>/<source>.json`.
+
+        Retries of the same source get a numbered suffix instead of
+        overwriting the first attempt.
+
+        Returns:
+            Path: The file written.
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        name = re.sub(r"[^\w.-]+", "_", source)
+        path = directory / f"{name}.json"
+        attempt = 2
+        while path.exists():
+            path = directory / f"{name}-{attempt}.json"
+            attempt += 1
+        path.write_text(json.dumps(trace, indent=2))
+        return path
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Process Tree
+Small /proc helpers for finding, measuring and killing browser process trees.
+
+All functions are no-ops (returning empty results) on systems without /proc,
+so callers never risk signalling an unrelated process on Windows or macOS.
+"""
+
+import os
+import signal
+import time
+from pathlib import Path
+
+PROC = Path("/proc")
+
+
+def supported() -> bool:
+    """Return True if process tree inspection is available on this system"""
+    return PROC.is_dir()
+
+
+def _stat_fields(pid):
+    """Return the fields of /proc/<pid>/stat after the command name, or None"""
+    try:
+        raw = (PROC / str(pid) / "stat").read_text()
+    except OSError:
+        return None
+    # The command name is wrapped in parentheses and may itself contain spaces
+    return raw[raw.rindex(")") + 2:].split()
+
+
+def start_time(pid):
+    """
+    Return the kernel start time of a process (clock ticks since boot)
+
+    Combined with the PID this identifies a process even after PID reuse.
+
+    Returns:
+        int: Start time, or None if the process does not exist
+    """
+    fields = _stat_fields(pid)
+    return int(fields[19]) if fields else None
+
+
+def is_same_process(pid, started) -> bool:
+    """Return True if `pid` is alive and is the process that started at `started`"""
+    current = start_time(pid)
+    if current is None:
+        return False
+    # A zombie has exited and can't be killed any further
+    fields = _stat_fields(pid)
+    return current == started and fields is not None and fields[0] != "Z"
+
+
+def children_map():
+    """
+    Map each parent PID to its child PIDs
+
+    Returns:
+        dict: {ppid: [pid, ...]}
+    """
+    children = {}
+    if not supported():
+        return children
+
+    for entry in PROC.iterdir():
+        if not entry.name.isdigit():
+            continue
+        fields = _stat_fields(entry.name)
+        if fields:
+            children.setdefault(int(fields[1]), []).append(int(entry.name))
+    return children
+
+
+def descendants(pid):
+    """
+    Return every descendant of a process, depth first
+
+    Returns:
+        list: PIDs of children, grandchildren, ... (not including `pid`)
+    """
+    children = children_map()
+    found = []
+    stack = list(children.get(pid, []))
+    while stack:
+        child = stack.pop()
+        found.append(child)
+        stack.extend(children.get(child, []))
+    return found
+
+
+def rss_kb(pid) -> int:
+    """Return the resident set size of a single process in KiB (0 if unknown)"""
+    try:
+        with open(PROC / str(pid) / "status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except (OSError, ValueError, IndexError):
+        pass
+    return 0
+
+
+def tree_rss_kb(pids) -> int:
+    """Return the combined RSS in KiB of the given processes and their descendants"""
+    seen = set()
+    for pid in pids:
+        if start_time(pid) is None:
+            continue
+        seen.add(pid)
+        seen.update(descendants(pid))
+    return sum(rss_kb(pid) for pid in seen)
+
+
+def kill_tree(pids, grace=2.0):
+    """
+    Terminate processes and all of their descendants
+
+    Sends SIGTERM, waits up to `grace` seconds, then SIGKILLs survivors.
+
+    Args:
+        pids (iterable): Root process IDs. Expected to be verified by the caller.
+        grace (float): Seconds to wait between SIGTERM and SIGKILL.
+
+    Returns:
+        list: PIDs that were signalled
+    """
+    if not supported():
+        return []
+
+    targets = []
+    for pid in pids:
+        if start_time(pid) is None:
+            continue
+        # Collect children first: once the parent dies they are reparented
+        targets.extend(descendants(pid))
+        targets.append(pid)
+    targets = list(dict.fromkeys(targets))
+
+    for pid in targets:
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except OSError:
+            pass
+
+    deadline = time.monotonic() + grace
+    while time.monotonic() < deadline:
+        if not any(_running(pid) for pid in targets):
+            return targets
+        time.sleep(0.1)
+
+    for pid in targets:
+        if _running(pid):
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except OSError:
+                pass
+    return targets
+
+
+def _running(pid) -> bool:
+    fields = _stat_fields(pid)
+    return fields is not None and fields[0] != "Z"
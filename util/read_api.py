@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Read API
+Serves the latest value of every source from memory over HTTP or a Unix
+socket, with ETags and long-polling, while run_scrapers.py --daemon runs
+"""
+
+import errno
+import hashlib
+import json
+import math
+import os
+import socket
+import socketserver
+import stat
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from util.link_loader import LinkLoader
+
+
+class Snapshot:
+    """
+    Latest reading of every source, held in memory.
+
+    Readers get a consistent copy without touching the disk. Every change
+    bumps `version` and wakes the long-polling readers.
+    """
+
+    def __init__(self):
+        self.version = 0
+        self._readings = {}
+        self._changed = threading.Condition()
+
+    def update(self, readings):
+        """
+        Store new readings.
+
+        Args:
+            readings (dict): {source: HistoryStore row (or dict with raw,
+                             value and ts)}; None rows are ignored.
+        """
+        with self._changed:
+            changed = False
+            for source, row in readings.items():
+                if row is None:
+                    continue
+                reading = {"raw": row["raw"], "value": row["value"], "ts": row["ts"]}
+                if self._readings.get(source) != reading:
+                    self._readings[source] = reading
+                    changed = True
+            if changed:
+                self.version += 1
+                self._changed.notify_all()
+
+    def retain(self, sources):
+        """Forget sources that are no longer configured"""
+        with self._changed:
+            removed = set(self._readings) - set(sources)
+            for source in removed:
+                del self._readings[source]
+            if removed:
+                self.version += 1
+                self._changed.notify_all()
+
+    def get(self):
+        """
+        Returns:
+            tuple: (version: int, {source: reading dict})
+        """
+        with self._changed:
+            return self.version, dict(self._readings)
+
+    def wait(self, version, timeout):
+        """Block until the snapshot is newer than `version` or the timeout passes"""
+        with self._changed:
+            self._changed.wait_for(lambda: self.version != version, timeout)
+
+
+def etag_for(readings):
+    """Weak ETag over the readings themselves, so it only changes with a value"""
+    digest = hashlib.sha1(json.dumps(readings, sort_keys=True).encode("utf-8")).hexdigest()
+    return f'W/"{digest[:16]}"'
+
+
+def describe(source, reading, now):
+    """The JSON object served for one source, with its age and staleness at `now`"""
+    ttl = LinkLoader.get_ttl(source)
+    age = now - reading["ts"]
+    if ttl is not None:
+        stale = age >= ttl
+    else:
+        # Sources without a ttl are scraped once a day
+        stale = datetime.fromtimestamp(reading["ts"]).date() != datetime.fromtimestamp(now).date()
+    return {
+        "raw": reading["raw"],
+        "value": reading["value"],
+        "ts": reading["ts"],
+        "updated": datetime.fromtimestamp(reading["ts"]).isoformat(timespec="seconds"),
+        "age": round(age, 3),
+        "ttl": ttl,
+        "stale": stale,
+    }
+
+
+class ReadApiHandler(BaseHTTPRequestHandler):
+    """
+    GET /values            every source
+    GET /values/<source>   one source (target ids such as zillow/home work as paths)
+
+    Responses carry a weak ETag that changes only when a value changes
+    (age and staleness are computed per request). With If-None-Match and
+    ?wait=SECONDS the request blocks until a new value lands or the wait
+    runs out, and answers 304 if nothing changed.
+    """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server_version = "ScraperReadAPI/1.0"
+
+    # Set by ReadApi before the server starts
+    snapshot = None
+
+    MAX_WAIT = 300
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        path = url.path.rstrip("/")
+        if path == "/values":
+            source = None
+        elif path.startswith("/values/"):
+            source = path[len("/values/"):]
+        else:
+            self._send_json(404, {"error": "not found"})
+            return
+
+        try:
+            wait = float(parse_qs(url.query).get("wait", ["0"])[0])
+        except ValueError:
+            wait = math.nan
+        # float() also accepts "nan" and "inf", which would break the deadline
+        if not math.isfinite(wait):
+            self._send_json(400, {"error": "wait must be a number of seconds"})
+            return
+        wait = min(wait, self.MAX_WAIT)
+        deadline = time.monotonic() + max(wait, 0)
+        known = self.headers.get("If-None-Match")
+
+        while True:
+            version, readings = self.snapshot.get()
+            if source is not None and source not in readings:
+                self._send_json(404, {"error": f"no value for '{source}'"})
+                return
+            selected = readings if source is None else {source: readings[source]}
+            etag = etag_for(selected)
+            if etag != known:
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.snapshot.wait(version, remaining)
+
+        now = time.time()
+        if source is None:
+            body = {"version": version, "sources": {s: describe(s, r, now) for s, r in sorted(selected.items())}}
+        else:
+            body = {"source": source, **describe(source, selected[source], now)}
+        self._send_json(200, body, etag)
+
+    def _send_json(self, status, body, etag=None):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Cache-Control", "no-cache")
+        if etag:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def address_string(self):
+        # Unix socket peers have no host address
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class ReadApi:
+    """
+    The read API server, running in a background thread.
+
+    `address` is "HOST:PORT" (or just ":PORT" for localhost) for TCP, or
+    "unix:/path/to.sock" for a Unix socket.
+    """
+
+    def __init__(self, snapshot, address):
+        """
+        Initialize the ReadApi.
+
+        Args:
+            snapshot (Snapshot): Readings to serve.
+            address (str): Where to listen; see the class docstring.
+
+        Raises:
+            ValueError: If the address can't be parsed.
+            OSError: If the address can't be bound, or another daemon is
+                     already serving on the socket.
+        """
+        self.socket_path = None
+        if address.startswith("unix:"):
+            # TCP_NODELAY doesn't exist on Unix sockets
+            handler = type("ConfiguredReadApiHandler", (ReadApiHandler,),
+                           {"snapshot": snapshot, "disable_nagle_algorithm": False})
+            self.socket_path = address[len("unix:"):]
+            self._remove_stale_socket()
+            self._server = ThreadingUnixHTTPServer(self.socket_path, handler)
+            # Identifies our socket, so stop() never removes one bound by someone else
+            self._socket_id = self._stat_socket()
+        else:
+            handler = type("ConfiguredReadApiHandler", (ReadApiHandler,), {"snapshot": snapshot})
+            host, _, port = address.rpartition(":")
+            if not port.isdigit():
+                raise ValueError(f"Invalid address '{address}', expected HOST:PORT or unix:/path")
+            self._server = ThreadingHTTPServer((host or "127.0.0.1", int(port)), handler)
+            self._server.daemon_threads = True
+        self._thread = None
+
+    def _stat_socket(self):
+        try:
+            info = os.stat(self.socket_path)
+        except OSError:
+            return None
+        return info.st_dev, info.st_ino
+
+    def _remove_stale_socket(self):
+        """Remove a socket file left behind by a daemon that is gone; refuse to take a live one"""
+        try:
+            mode = os.lstat(self.socket_path).st_mode
+        except FileNotFoundError:
+            return
+        if not stat.S_ISSOCK(mode):
+            raise OSError(errno.EEXIST, f"{self.socket_path} exists and is not a socket")
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.socket_path)
+        except OSError as e:
+            if e.errno == errno.ENOENT:
+                return
+            if e.errno != errno.ECONNREFUSED:
+                raise
+            os.unlink(self.socket_path)
+            return
+        finally:
+            probe.close()
+        raise OSError(errno.EADDRINUSE, f"another process is already serving on {self.socket_path}")
+
+    @property
+    def url(self):
+        if self.socket_path:
+            return f"unix:{self.socket_path}"
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/values"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self.socket_path and self._stat_socket() == self._socket_id:
+            try:
+                os.unlink(self.socket_path)
+            except OSError:
+                pass
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Recovery
+Retry timing and per-source circuit breakers for scrapers that fail
+"""
+
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from util.file_lock import file_lock
+
+
+class RetryPolicy:
+    """
+    How often a failed source is retried, and how long to wait in between.
+
+    Delays grow exponentially with each attempt and use "full jitter"
+    (a random delay between 0 and the exponential cap), so workers that
+    failed at the same time don't all hit the site again in lockstep.
+    """
+
+    def __init__(self, attempts=3, base_delay=2.0, max_delay=30.0):
+        """
+        Initialize the RetryPolicy.
+
+        Args:
+            attempts (int): Total attempts per source, including the first.
+            base_delay (float): Cap of the first backoff delay in seconds.
+            max_delay (float): Upper bound for any backoff delay in seconds.
+        """
+        if attempts < 1:
+            raise ValueError("A retry policy needs at least one attempt")
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt):
+        """
+        Return how long to wait after a failed attempt.
+
+        Args:
+            attempt (int): Number of the attempt that just failed, starting at 1.
+
+        Returns:
+            float: Seconds to sleep before the next attempt.
+        """
+        cap = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return random.uniform(0, cap)
+
+
+class CircuitBreakers:
+    """
+    One circuit breaker per source, persisted between runs.
+
+    Consecutive failed attempts are counted per source. Once a source
+    reaches THRESHOLD failures its breaker opens and the source is not
+    scraped at all for COOLDOWN seconds. After the cooldown one attempt
+    is let through (half-open): a success closes the breaker, a failure
+    opens it again for another cooldown.
+    """
+
+    THRESHOLD = int(os.environ.get("SCRAPER_BREAKER_THRESHOLD", "5"))
+    COOLDOWN = float(os.environ.get("SCRAPER_BREAKER_COOLDOWN", "1800"))
+
+    def __init__(self, filepath="circuit_breakers.json"):
+        """
+        Initialize the CircuitBreakers.
+
+        Args:
+            filepath: Path to the JSON state file. Defaults to "circuit_breakers.json".
+        """
+        self.filepath = Path(filepath)
+        self._lock_path = self.filepath.with_name(f"{self.filepath.name}.lock")
+        self._lock = threading.Lock()
+        self._state = self._read()
+
+    def _read(self):
+        try:
+            state = json.loads(self.filepath.read_text())
+        except (OSError, ValueError):
+            return {}
+        return state if isinstance(state, dict) else {}
+
+    def _entry(self, source):
+        return self._state.setdefault(source, {"failures": 0, "opened_at": None})
+
+    def retry_in(self, source):
+        """
+        Return how long a source's breaker stays open.
+
+        Args:
+            source (str): links.json key.
+
+        Returns:
+            float: Seconds until the source may be tried again, or 0 if
+                   the breaker is closed or half-open.
+        """
+        with self._lock:
+            opened_at = self._state.get(source, {}).get("opened_at")
+        if opened_at is None:
+            return 0
+        return max(0, opened_at + self.COOLDOWN - time.time())
+
+    def allow(self, source):
+        """
+        Check whether a source may be scraped now.
+
+        Args:
+            source (str): links.json key.
+
+        Returns:
+            bool: False while the source's breaker is open.
+        """
+        return self.retry_in(source) == 0
+
+    def record_success(self, source):
+        """Close a source's breaker and reset its failure count."""
+        with self._lock:
+            # Nearly every attempt succeeds; only touch the file if the breaker had state
+            if self._state.pop(source, None) is not None:
+                self._save(source)
+
+    def record_failure(self, source):
+        """
+        Count a failed attempt, opening the breaker at the threshold.
+
+        Returns:
+            bool: True if the breaker is now open.
+        """
+        with self._lock:
+            entry = self._entry(source)
+            half_open = entry["opened_at"] is not None
+            entry["failures"] += 1
+            opened = half_open or entry["failures"] >= self.THRESHOLD
+            if opened:
+                entry["opened_at"] = time.time()
+            self._save(source)
+        return opened
+
+    def _save(self, source):
+        # Called with the lock held. Other runs share the file, so only this
+        # source's entry is merged into what is on disk, under the file lock;
+        # written via rename so a crash can't truncate it
+        try:
+            with file_lock(self._lock_path):
+                state = self._read()
+                if source in self._state:
+                    state[source] = self._state[source]
+                else:
+                    state.pop(source, None)
+                target = self.filepath.resolve()
+                fd, tmp = tempfile.mkstemp(prefix=f".{target.name}.", suffix=".tmp", dir=target.parent)
+                try:
+                    with os.fdopen(fd, "w") as f:
+                        json.dump(state, f, indent=2)
+                    os.replace(tmp, target)
+                except Exception:
+                    try:
+                        os.unlink(tmp)
+                    except OSError:
+                        pass
+                    raise
+        except Exception as e:
+            print(f"⚠ Could not save circuit breaker state: {str(e)}")
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Result Writer
+Buffers the values scraped during a run and publishes them all in one pass
+"""
+
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from util.history_store import HistoryStore
+from util.telemetry import Telemetry
+
+
+def _published_mode():
+    """
+    Mode for published files: 0666 minus the umask, as open() would create them
+
+    mkstemp creates files as 0600. Reading the umask with os.umask() means
+    changing it for every thread, so it is read from /proc where possible.
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("Umask:"):
+                    return 0o666 & ~int(line.split()[1], 8)
+    except (OSError, ValueError, IndexError):
+        pass
+    return 0o644
+
+
+_FILE_MODE = _published_mode()
+
+
+class ResultBatch:
+    """
+    Collects results while scrapers run and commits them together.
+
+    Nothing is written until commit(), so a crash mid-run leaves the
+    previous run's outputs untouched. On commit, each output file is first
+    written to a temp file in the same directory and fsynced. If any of
+    them can't be staged, nothing is published. Otherwise the history
+    rows go in as a single transaction, and then every temp file is renamed
+    over its target back to back. The directory is fsynced once at the
+    end. Readers and sync clients only ever see complete files, never a
+    half-written one.
+
+    A rename can still fail after the history transaction committed (e.g.
+    the target was replaced by a directory); that result is reported as
+    an error and the others stay published.
+    """
+
+    def __init__(self, history=None):
+        """
+        Initialize the ResultBatch.
+
+        Args:
+            history (HistoryStore, optional): Store the run's readings are added to.
+        """
+        self.history = history
+        self._pending = []
+        self._lock = threading.Lock()
+
+    def add(self, label, source, value, output, output_file=None, duration=None):
+        """
+        Buffer one result.
+
+        Args:
+            label (str): Display name for logging.
+            source (str): links.json key, used for the history row.
+            value (str): Value as scraped.
+            output (str): Transformed value written to the output file.
+            output_file (str, optional): File to publish `output` to.
+            duration (float, optional): Scrape duration in seconds.
+        """
+        with self._lock:
+            self._pending.append({
+                "label": label,
+                "source": source,
+                "value": value,
+                "output": output,
+                "output_file": output_file,
+                "duration": duration,
+                "ts": time.time(),
+            })
+
+    def __len__(self):
+        return len(self._pending)
+
+    @staticmethod
+    def _fsync_dir(directory):
+        # Directories can't be opened for fsync on Windows; rename is durable enough there
+        if not hasattr(os, "O_DIRECTORY"):
+            return
+        fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _discard(tmp):
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
+    def commit(self):
+        """
+        Publish every buffered result.
+
+        Returns:
+            dict: {label: error message} for results that could not be saved
+                  (empty if everything was committed).
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+        errors = {}
+
+        # Stage every file first; if one can't be staged, publish nothing
+        staged = []
+        for r in pending:
+            if not r["output_file"]:
+                continue
+            target = Path(r["output_file"]).resolve()
+            tmp = None
+            try:
+                with Telemetry.span("write", source=r["source"]):
+                    fd, tmp = tempfile.mkstemp(prefix=f".{target.name}.", suffix=".tmp", dir=target.parent)
+                    with os.fdopen(fd, "w") as f:
+                        if hasattr(os, "fchmod"):
+                            os.fchmod(f.fileno(), _FILE_MODE)
+                        f.write(r["output"])
+                        f.flush()
+                        os.fsync(f.fileno())
+                staged.append((r, tmp, target))
+            except Exception as e:
+                errors[r["label"]] = str(e)
+                if tmp is not None:
+                    self._discard(tmp)
+
+        if not errors and self.history is not None and pending:
+            try:
+                with Telemetry.span("history_write", readings=len(pending)):
+                    self.history.record_many([
+                        (r["source"], r["value"], HistoryStore.normalize(r["output"]), r["duration"], r["ts"])
+                        for r in pending
+                    ])
+                print(f"✓ Recorded {len(pending)} value{'s' if len(pending) != 1 else ''} in {self.history.filepath}")
+            except Exception as e:
+                for r in pending:
+                    errors[r["label"]] = f"history: {str(e)}"
+
+        if errors:
+            for r, tmp, _ in staged:
+                self._discard(tmp)
+            staged = []
+            for r in pending:
+                errors.setdefault(r["label"], "not published; another result of this run could not be saved")
+
+        directories = set()
+        for r, tmp, target in staged:
+            try:
+                os.replace(tmp, target)
+                directories.add(target.parent)
+                print(f"✓ Saved {r['label']} to {r['output_file']}")
+            except Exception as e:
+                errors[r["label"]] = str(e)
+                self._discard(tmp)
+
+        for directory in directories:
+            try:
+                self._fsync_dir(directory)
+            except OSError:
+                pass
+
+        for label, error in errors.items():
+            print(f"✗ Error saving {label}: {error}")
+        return errors
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Scheduler
+Decides when each due source fires in daemon mode, spreading them out with
+random jitter and holding failed sources back before they are retried
+"""
+
+import random
+import time
+
+
+class Scheduler:
+    """
+    Fire times for the sources of a resident run_scrapers.py --daemon.
+
+    Whether a source is due is still decided by select_due(): once its
+    "ttl" has passed, or once a day for sources without one. Each time a
+    source becomes due it is held back by a random 0..jitter seconds, so
+    sources sharing an interval don't all fire in the same instant. A
+    source that failed waits `retry_after` seconds (at most its own
+    interval) plus jitter before it fires again; its circuit breaker
+    takes over if it keeps failing.
+    """
+
+    def __init__(self, jitter=30.0, retry_after=300.0):
+        """
+        Initialize the Scheduler.
+
+        Args:
+            jitter (float): Maximum random delay in seconds added to every fire time.
+            retry_after (float): Seconds a failed source waits before firing again.
+        """
+        self.jitter = jitter
+        self.retry_after = retry_after
+        self._fire_at = {}
+
+    def ready(self, due, now=None):
+        """
+        Pick the due sources whose fire time has come.
+
+        Args:
+            due (list): Keys select_due() considers due right now.
+            now (float, optional): Current unix time.
+
+        Returns:
+            list: The keys of `due` to scrape now, in the given order.
+        """
+        now = time.time() if now is None else now
+        due_keys = set(due)
+        # Sources no longer due (fresh again, disabled, breaker open) lose their slot
+        for key in list(self._fire_at):
+            if key not in due_keys:
+                del self._fire_at[key]
+        for key in due:
+            self._fire_at.setdefault(key, now + random.uniform(0, self.jitter))
+        return [key for key in due if self._fire_at[key] <= now]
+
+    def finished(self, key, success, interval=None, now=None):
+        """
+        Record the outcome of a source that fired.
+
+        Args:
+            key (str): Target id.
+            success (bool): Whether its value was published.
+            interval (float, optional): The source's TTL, which caps the retry delay.
+            now (float, optional): Current unix time.
+        """
+        now = time.time() if now is None else now
+        if success:
+            self._fire_at.pop(key, None)
+            return
+        delay = min(self.retry_after, interval) if interval else self.retry_after
+        self._fire_at[key] = now + delay + random.uniform(0, self.jitter)
+
+    def next_fire(self):
+        """
+        Earliest pending fire time.
+
+        Returns:
+            float: Unix time, or None if no source is waiting to fire.
+        """
+        return min(self._fire_at.values(), default=None)
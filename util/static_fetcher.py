@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Static Fetcher
+Fetches server-rendered pages over plain HTTP and extracts a single value
+without starting a browser
+"""
+
+import re
+import urllib.request
+
+from util.chrome_driver_manager import ChromeDriverManager
+from util.http_cache import HttpCache
+from util.http_session import HttpSession
+from util.telemetry import Telemetry
+
+try:
+    import lxml.html
+except ImportError:  # lxml is optional; regex extraction still works without it
+    lxml = None
+
+
+class StaticFetcher:
+    """
+    Browserless fast path for sources whose value is in the initial HTML.
+
+    A scraper declares an XPath and/or a regex for its value. XPath is
+    used when lxml is installed; the regex (first capture group) is used
+    otherwise, or when the XPath finds nothing. HTTP(S) pages go through
+    the HttpCache, so an unchanged page is revalidated instead of
+    downloaded and parsed again.
+    """
+
+    TIMEOUT = 10
+
+    @staticmethod
+    def _headers():
+        return {
+            "User-Agent": ChromeDriverManager.get_user_agent(),
+            "Accept": "text/html,application/xhtml+xml",
+            "Accept-Language": "en-US,en;q=0.9",
+        }
+
+    @staticmethod
+    def fetch(url, timeout=None) -> str:
+        """
+        Download a page and return its decoded HTML
+
+        HTTP(S) pages are fetched over the shared keep-alive HttpSession.
+
+        Args:
+            url (str): Page URL (http, https or file)
+            timeout (float, optional): Socket timeout in seconds
+
+        Returns:
+            str: Page HTML
+
+        Raises:
+            OSError: If the server answers with an error status.
+        """
+        headers = StaticFetcher._headers()
+        if url.startswith(("http://", "https://")):
+            response = HttpSession.get(url, headers=headers, timeout=timeout or StaticFetcher.TIMEOUT)
+            if response.status >= 400:
+                raise OSError(f"HTTP {response.status} from {url}")
+            return response.text()
+
+        request = urllib.request.Request(url, headers=headers)
+        with urllib.request.urlopen(request, timeout=timeout or StaticFetcher.TIMEOUT) as response:
+            charset = response.headers.get_content_charset() or "utf-8"
+            return response.read().decode(charset, errors="replace")
+
+    @staticmethod
+    def extract(html, xpath=None, pattern=None):
+        """
+        Extract a value from HTML using an XPath and/or regex
+
+        Args:
+            html (str): Page HTML
+            xpath (str, optional): XPath to the element holding the value
+            pattern (str, optional): Regex whose first group is the value
+
+        Returns:
+            str: The stripped value, or None if nothing matched
+        """
+        if xpath and lxml is not None:
+            for node in lxml.html.fromstring(html).xpath(xpath):
+                text = node.text_content().strip() if hasattr(node, "text_content") else str(node).strip()
+                if text:
+                    return text
+
+        if pattern:
+            match = re.search(pattern, html)
+            if match and match.group(1).strip():
+                return match.group(1).strip()
+
+        return None
+
+    @staticmethod
+    def scrape(url, xpath=None, pattern=None):
+        """
+        Fetch a page and extract a value, never raising
+
+        Args:
+            url (str): Page URL
+            xpath (str, optional): XPath to the element holding the value
+            pattern (str, optional): Regex whose first group is the value
+
+        Returns:
+            str: The extracted value, or None if the fetch or extraction failed
+        """
+        def extract(html):
+            with Telemetry.span("extract", path="static") as span:
+                value = StaticFetcher.extract(html, xpath, pattern)
+                if value is None:
+                    span["outcome"] = "failed"
+            return value
+
+        try:
+            print(f"Fetching without browser: {url}")
+            if url.startswith(("http://", "https://")):
+                with Telemetry.span("fetch") as span:
+                    value, response = HttpCache.fetch_value(
+                        url, f"static:{xpath}|{pattern}", extract, StaticFetcher._headers(), StaticFetcher.TIMEOUT
+                    )
+                    span["status"] = response.status
+                if response.status == 304:
+                    print("Page not modified (HTTP 304), using the cached value")
+            else:
+                with Telemetry.span("fetch"):
+                    html = StaticFetcher.fetch(url)
+                value = extract(html)
+        except Exception as e:
+            print(f"Static fetch failed: {str(e)}")
+            return None
+
+        if value is None:
+            print("Static fetch found no value, falling back to Selenium")
+        return value
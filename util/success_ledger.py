@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Success Ledger
+Tracks which sources were scraped successfully today, so a rerun only retries the rest
+"""
+
+import json
+import os
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from util.file_lock import file_lock
+
+
+class SuccessLedger:
+    """
+    Per-source replacement for DateGate.
+
+    Each successful source is recorded with the time it succeeded. The
+    ledger only covers the current day: once the date changes every
+    source is due again. Sources that failed or never ran are simply
+    absent, so a second run the same day retries just those.
+    """
+
+    def __init__(self, filepath="last_success.json"):
+        """
+        Initialize the SuccessLedger.
+
+        Args:
+            filepath: Path to the JSON ledger file. Defaults to "last_success.json".
+        """
+        self.filepath = Path(filepath)
+        self._lock_path = self.filepath.with_name(f"{self.filepath.name}.lock")
+
+    @staticmethod
+    def _today():
+        return datetime.now().strftime("%Y-%m-%d")
+
+    def _load(self):
+        """
+        Read today's entries from the ledger file.
+
+        Returns:
+            dict: {source: unix timestamp of success}; empty if the file is
+                  missing, unreadable, or from an earlier day.
+        """
+        try:
+            data = json.loads(self.filepath.read_text())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("date") != self._today():
+            return {}
+        return dict(data.get("succeeded", {}))
+
+    def succeeded_today(self, source):
+        """
+        Check whether a source already succeeded today.
+
+        Args:
+            source (str): links.json key.
+
+        Returns:
+            bool: True if the source has a success recorded for today.
+        """
+        return source in self._load()
+
+    def record(self, sources):
+        """
+        Mark sources as succeeded today.
+
+        The read-modify-write happens under a file lock, so concurrent runs
+        don't drop each other's entries, and the file is rewritten through
+        a temp file and a rename, so an interrupted write never loses the
+        earlier entries.
+
+        Args:
+            sources (list): links.json keys that succeeded.
+        """
+        if not sources:
+            return
+        with file_lock(self._lock_path):
+            succeeded = self._load()
+            now = time.time()
+            for source in sources:
+                succeeded[source] = now
+
+            payload = json.dumps({"date": self._today(), "succeeded": succeeded}, indent=2)
+            target = self.filepath.resolve()
+            fd, tmp = tempfile.mkstemp(prefix=f".{target.name}.", suffix=".tmp", dir=target.parent)
+            try:
+                with os.fdopen(fd, "w") as f:
+                    f.write(payload)
+                os.replace(tmp, target)
+            except Exception:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+                raise
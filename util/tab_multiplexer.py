@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Tab Multiplexer
+Loads several pages at once in tabs of a single browser and harvests each
+value as soon as it appears
+"""
+
+import time
+from collections import deque
+
+from selenium.common.exceptions import WebDriverException
+from util.chrome_driver_manager import ChromeDriverManager
+from util.extractor import Extractor
+
+
+class TabMultiplexer:
+    """
+    Runs many PageSpec scrapes concurrently on one WebDriver session.
+
+    Up to `max_tabs` tabs are open at a time. Every pending page gets its
+    own tab and starts navigating immediately; the multiplexer then cycles
+    through the open tabs, evaluating each spec's strategies in one round
+    trip per tab. A tab is closed as soon as its value is found or its
+    spec's timeout expires, and the next pending page takes its place.
+
+    Network waits overlap across tabs while only one browser process tree
+    is running. The driver must use the "none" page load strategy (see
+    ChromeDriverManager.page_load_strategy); otherwise every navigation
+    blocks the session until the page has loaded.
+    """
+
+    POLL_INTERVAL = 0.1
+
+    def __init__(self, driver, max_tabs=4):
+        """
+        Initialize the TabMultiplexer.
+
+        Args:
+            driver: Chrome WebDriver or LazyDriver instance.
+            max_tabs (int): Maximum number of tabs loading at the same time.
+        """
+        if max_tabs < 1:
+            raise ValueError("At least one tab is needed")
+        self.driver = driver
+        self.max_tabs = max_tabs
+
+    def run(self, pages):
+        """
+        Load every page and collect its value.
+
+        Args:
+            pages (list): (label, PageSpec, url) tuples.
+
+        Returns:
+            dict: {label: (value: str|None, seconds: float, rss_kb: int|None)}
+                  for every page, rss_kb being the browser's RSS when the
+                  page finished.
+
+        Raises:
+            Exception: If the session itself fails. The pages finished so
+                       far are attached as the exception's `results`.
+        """
+        driver = self.driver
+        pending = deque(pages)
+        open_tabs = {}  # window handle -> (label, spec, started)
+        results = {}
+
+        home = driver.current_window_handle
+        try:
+            while pending or open_tabs:
+                while pending and len(open_tabs) < self.max_tabs:
+                    label, spec, url = pending.popleft()
+                    # new_window() needs a live current window, so always open from home
+                    driver.switch_to.window(home)
+                    driver.switch_to.new_window("tab")
+                    driver.get(url)
+                    open_tabs[driver.current_window_handle] = (label, spec, time.perf_counter())
+                    print(f"Opened tab for {label}: {url}")
+
+                for handle, (label, spec, started) in list(open_tabs.items()):
+                    driver.switch_to.window(handle)
+                    try:
+                        value, strategy = Extractor.extract(driver, spec.strategies)
+                    except WebDriverException:
+                        # Document is being replaced; check again next cycle
+                        value, strategy = None, None
+                    elapsed = time.perf_counter() - started
+
+                    if value:
+                        print(f"{spec.description} found for {label}: {value} (matched {strategy.name})")
+                    elif elapsed >= spec.timeout:
+                        print(f"✗ {label}: no strategy matched within {spec.timeout}s")
+                    else:
+                        continue
+
+                    ChromeDriverManager.count_page_loads(self.driver)
+                    results[label] = (value, elapsed, ChromeDriverManager.browser_rss_kb(self.driver))
+                    driver.close()
+                    del open_tabs[handle]
+                    # close() leaves the session without a current window
+                    driver.switch_to.window(home)
+
+                if open_tabs:
+                    time.sleep(self.POLL_INTERVAL)
+        except Exception as e:
+            e.results = results
+            raise
+        finally:
+            # Leave the driver on its original window, without stray tabs,
+            # so the next scraper on this session can use it
+            try:
+                for handle in open_tabs:
+                    driver.switch_to.window(handle)
+                    driver.close()
+                driver.switch_to.window(home)
+            except WebDriverException:
+                pass
+
+        return results
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Telemetry
+Times the phases of each scrape as spans and exports them as JSON lines and
+as a Prometheus node_exporter textfile
+
+Usage:
+    python -m util.telemetry spans.jsonl [--days N]
+"""
+
+import argparse
+import json
+import math
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+from selenium.common.exceptions import TimeoutException
+
+
+class Telemetry:
+    """
+    Collects timing spans while a run is in progress.
+
+    A span covers one phase (driver_create, navigate, wait, extract,
+    fetch, transform, write, ...) of one source, or the whole run, and
+    ends with an outcome: success, failed, timeout, crash or
+    driver_recreated. The source is taken from the thread's current
+    source() block unless given explicitly, so deeper layers such as
+    ChromeDriverManager don't need to know which source they work for.
+
+    Nothing is recorded unless `enabled` is set.
+    """
+
+    enabled = False
+    run_id = None
+
+    _spans = []
+    _lock = threading.Lock()
+    _local = threading.local()
+
+    @staticmethod
+    def start_run():
+        """Enable recording and start a new run id"""
+        Telemetry.enabled = True
+        Telemetry.run_id = f"{datetime.now().strftime('%Y%m%dT%H%M%S')}-{os.getpid()}"
+        with Telemetry._lock:
+            Telemetry._spans = []
+
+    @staticmethod
+    @contextmanager
+    def source(source):
+        """Attribute spans opened by this thread inside the block to `source`"""
+        previous = getattr(Telemetry._local, "source", None)
+        Telemetry._local.source = source
+        try:
+            yield
+        finally:
+            Telemetry._local.source = previous
+
+    @staticmethod
+    def record(name, duration, source=None, outcome="success", **attrs):
+        """
+        Record a span whose duration was measured elsewhere
+
+        Args:
+            name (str): Phase name, e.g. "wait".
+            duration (float): Seconds.
+            source (str, optional): links.json key or target id. Defaults to
+                                    the thread's current source.
+            outcome (str): How the phase ended.
+            **attrs: Extra fields for the JSON line.
+        """
+        if not Telemetry.enabled:
+            return
+        span = {
+            "run": Telemetry.run_id,
+            "ts": round(time.time() - duration, 3),
+            "name": name,
+            "source": source or getattr(Telemetry._local, "source", None),
+            "duration": round(duration, 4),
+            "outcome": outcome,
+            **attrs,
+        }
+        with Telemetry._lock:
+            Telemetry._spans.append(span)
+
+    @staticmethod
+    @contextmanager
+    def span(name, source=None, **attrs):
+        """
+        Time the enclosed block as a span
+
+        Yields a dict whose "outcome" (default "success") the block may
+        change, e.g. to "failed" when nothing was found. An exception sets
+        it to "timeout" for timeouts and "crash" otherwise, and is re-raised.
+        """
+        span = {"outcome": "success"}
+        started = time.perf_counter()
+        try:
+            yield span
+        except (TimeoutException, TimeoutError):
+            span["outcome"] = "timeout"
+            raise
+        except Exception:
+            span["outcome"] = "crash"
+            raise
+        finally:
+            outcome = span.pop("outcome")
+            Telemetry.record(name, time.perf_counter() - started, source, outcome, **{**attrs, **span})
+
+    @staticmethod
+    def spans():
+        with Telemetry._lock:
+            return list(Telemetry._spans)
+
+    @staticmethod
+    def write_jsonl(filepath):
+        """Append this run's spans to a JSON lines file"""
+        spans = Telemetry.spans()
+        with open(filepath, "a") as f:
+            for span in spans:
+                f.write(json.dumps(span) + "\n")
+
+    @staticmethod
+    def prometheus_text():
+        """
+        Render this run's spans in the Prometheus text exposition format
+
+        Returns:
+            str: Gauges describing the last run, for node_exporter's textfile collector
+        """
+        durations = {}
+        counts = {}
+        run = None
+        for span in Telemetry.spans():
+            if span["name"] == "run":
+                run = span
+                continue
+            key = (span["source"] or "", span["name"])
+            durations[key] = durations.get(key, 0) + span["duration"]
+            outcome_key = key + (span["outcome"],)
+            counts[outcome_key] = counts.get(outcome_key, 0) + 1
+
+        lines = [
+            "# HELP scraper_phase_duration_seconds Time spent in each phase per source during the last run.",
+            "# TYPE scraper_phase_duration_seconds gauge",
+        ]
+        for (source, phase), seconds in sorted(durations.items()):
+            lines.append(f"scraper_phase_duration_seconds{{{labels(source=source, phase=phase)}}} {seconds:.4f}")
+        lines += [
+            "# HELP scraper_phase_spans Spans per source, phase and outcome during the last run.",
+            "# TYPE scraper_phase_spans gauge",
+        ]
+        for (source, phase, outcome), count in sorted(counts.items()):
+            lines.append(f"scraper_phase_spans{{{labels(source=source, phase=phase, outcome=outcome)}}} {count}")
+        if run is not None:
+            lines += [
+                "# HELP scraper_run_duration_seconds Duration of the last run.",
+                "# TYPE scraper_run_duration_seconds gauge",
+                f"scraper_run_duration_seconds{{{labels(outcome=run['outcome'])}}} {run['duration']:.4f}",
+                "# HELP scraper_last_run_timestamp_seconds When the last run finished.",
+                "# TYPE scraper_last_run_timestamp_seconds gauge",
+                f"scraper_last_run_timestamp_seconds {run['ts'] + run['duration']:.3f}",
+            ]
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def write_textfile(filepath):
+        """
+        Write the Prometheus metrics for node_exporter's textfile collector
+
+        The file is replaced atomically so the collector never reads a
+        partial file.
+        """
+        target = Path(filepath).resolve()
+        fd, tmp = tempfile.mkstemp(prefix=f".{target.name}.", suffix=".tmp", dir=target.parent)
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(Telemetry.prometheus_text())
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, target)
+        except Exception:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+
+def labels(**values):
+    """Format Prometheus labels, escaping backslashes, quotes and newlines"""
+    def escape(value):
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return ",".join(f'{key}="{escape(value)}"' for key, value in values.items())
+
+
+def percentile(values, fraction):
+    """Return the nearest-rank percentile of a list of numbers"""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize scrape latency from a spans JSON lines file")
+    parser.add_argument("spans", help="File written by run_scrapers.py --spans")
+    parser.add_argument("--days", type=float, default=30, help="Only include the last N days (default: 30)")
+    parser.add_argument("--phase", default="scrape", help="Phase to summarize (default: scrape)")
+    args = parser.parse_args()
+
+    since = time.time() - args.days * 86400
+    samples = {}
+    with open(args.spans) as f:
+        for line in f:
+            span = json.loads(line)
+            if span["name"] == args.phase and span["ts"] >= since and span["source"]:
+                samples.setdefault(span["source"], []).append(span)
+
+    print(f"{'Source':<24} {'Count':>6} {'p50':>9} {'p95':>9} {'Max':>9} {'Failed':>7}")
+    for source, spans in sorted(samples.items()):
+        durations = [s["duration"] for s in spans]
+        failed = sum(1 for s in spans if s["outcome"] != "success")
+        print(f"{source:<24} {len(spans):>6} {percentile(durations, 0.5):>8.2f}s "
+              f"{percentile(durations, 0.95):>8.2f}s {max(durations):>8.2f}s {failed:>7}")
+
+
+if __name__ == "__main__":
+    main()
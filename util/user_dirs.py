@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+User Dirs
+Per-user locations for state other local users must not be able to plant or
+edit: the Chrome probe cache (which names the chromedriver binary to run),
+the driver lease file and the browser daemon state (whose pids get killed)
+"""
+
+import os
+import stat
+import tempfile
+from pathlib import Path
+
+APP_NAME = "home_value_scraper"
+
+
+def cache_dir() -> Path:
+    """Per-user cache directory ($XDG_CACHE_HOME, ~/.cache or %LOCALAPPDATA%)"""
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / APP_NAME
+
+
+def runtime_dir() -> Path:
+    """
+    Per-user directory for state that only makes sense until reboot (pids)
+
+    $XDG_RUNTIME_DIR when it is set, otherwise a directory named after the
+    user id in the system temp directory.
+    """
+    if os.environ.get("XDG_RUNTIME_DIR"):
+        return Path(os.environ["XDG_RUNTIME_DIR"]) / APP_NAME
+    if hasattr(os, "getuid"):
+        return Path(tempfile.gettempdir()) / f"{APP_NAME}-{os.getuid()}"
+    return Path(tempfile.gettempdir()) / APP_NAME
+
+
+def _owned_and_not_shared(path) -> bool:
+    if not hasattr(os, "getuid"):
+        return True  # no ownership model to check against on Windows
+    info = os.lstat(path)
+    return (
+        info.st_uid == os.getuid()
+        and not stat.S_ISLNK(info.st_mode)
+        and not info.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+    )
+
+
+def ensure_private(directory) -> Path:
+    """
+    Create a directory only this user can write to, or check an existing one
+
+    Args:
+        directory: Directory to create (mode 0700, with parents).
+
+    Returns:
+        Path: The directory.
+
+    Raises:
+        PermissionError: If it exists but belongs to another user, is a
+                         symlink, or is writable by group or others.
+    """
+    directory = Path(directory)
+    directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if not _owned_and_not_shared(directory):
+        raise PermissionError(f"{directory} is not private to this user; refusing to use it")
+    return directory
+
+
+def trusted(path) -> bool:
+    """
+    Return True if a file and its directory are owned by this user and
+    writable by nobody else, so their contents can be acted on
+    """
+    path = Path(path)
+    try:
+        return _owned_and_not_shared(path.parent) and _owned_and_not_shared(path)
+    except OSError:
+        return False